@@ -2,6 +2,7 @@ import code
 import json
 import runpy
 import webbrowser
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from urllib.parse import urlencode, urlparse
 
@@ -23,6 +24,9 @@ from cumulusci.utils import parse_api_datetime
 
 from .runtime import CliRuntime, pass_runtime
 
+# Orgs missing from the keychain's org index are loaded in parallel.
+ORG_LIST_MAX_WORKERS = 8
+
 
 @click.group("org", help="Commands for connecting and interacting with Salesforce orgs")
 def org():
@@ -371,13 +375,15 @@ def org_info(runtime, org_name, print_json):
 def org_list(runtime, json_flag, plain):
     def _get_org_safe(org):
         try:
-            return runtime.keychain.get_org(org)
+            return runtime.keychain.get_org_summary(org)
         except Exception as e:
             click.echo(f"Cannot load org config for `{org}`: {e}")
 
     plain = plain or runtime.universal_config.cli__plain_output
-    org_configs = ((org, _get_org_safe(org)) for org in runtime.keychain.list_orgs())
-    org_configs = {org: org_config for org, org_config in org_configs if org_config}
+    org_names = runtime.keychain.list_orgs()
+    with ThreadPoolExecutor(max_workers=ORG_LIST_MAX_WORKERS) as executor:
+        org_configs = zip(org_names, executor.map(_get_org_safe, org_names))
+        org_configs = {org: org_config for org, org_config in org_configs if org_config}
 
     json_data = {}
     try:
@@ -690,7 +690,7 @@ class TestOrgCommands:
         }
 
         runtime.keychain.list_orgs.return_value = list(org_configs.keys())
-        runtime.keychain.get_org = lambda orgname: org_configs[orgname]
+        runtime.keychain.get_org_summary = lambda orgname: org_configs[orgname]
         runtime.project_config.cache_dir = Path("does_not_possibly_exist")
 
         runtime.keychain.get_default_org.return_value = (
@@ -778,7 +778,7 @@ class TestOrgCommands:
         }
 
         runtime.keychain.list_orgs.return_value = list(org_configs.keys())
-        runtime.keychain.get_org = lambda orgname: org_configs[orgname]
+        runtime.keychain.get_org_summary = lambda orgname: org_configs[orgname]
         runtime.project_config.cache_dir = Path("does_not_possibly_exist")
 
         runtime.keychain.get_default_org.return_value = (
@@ -867,7 +867,7 @@ class TestOrgCommands:
                 raise value
             return value
 
-        runtime.keychain.get_org = get_org
+        runtime.keychain.get_org_summary = get_org
         runtime.project_config.cache_dir = Path("does_not_possibly_exist")
         runtime.keychain.cleanup_org_cache_dirs.side_effect = AssertionError("OUCH!")
 
@@ -1,5 +1,7 @@
+import json
 import os
 import re
+import time
 from collections import defaultdict, namedtuple
 from contextlib import contextmanager
 from datetime import date, datetime
@@ -26,6 +28,12 @@ SKIP_REFRESH = os.environ.get("CUMULUSCI_DISABLE_REFRESH")
 SANDBOX_MYDOMAIN_RE = re.compile(r"\.cs\d+\.my\.(.*)salesforce\.com")
 MYDOMAIN_RE = re.compile(r"\.my\.(.*)salesforce\.com")
 
+# Seconds for which an org's installed packages are cached on disk.
+# The cache is also cleared whenever CumulusCI installs or uninstalls a package.
+INSTALLED_PACKAGES_CACHE_TTL = 300
+# Number of package versions to look up per query
+INSTALLED_PACKAGES_BATCH_SIZE = 100
+
 
 VersionInfo = namedtuple("VersionInfo", ["id", "number"])
 
@@ -319,45 +327,136 @@ class OrgConfig(BaseConfig):
 
         Beta version of a package are represented as "1.2.3b5", where 5 is the build number."""
         if self._installed_packages is None:
-            isp_result = self.salesforce_client.restful(
-                "tooling/query/?q=SELECT SubscriberPackage.Id, SubscriberPackage.NamespacePrefix, "
-                "SubscriberPackageVersionId FROM InstalledSubscriberPackage"
-            )
+            with self._open_installed_packages_cache() as cache:
+                packages = self._read_installed_packages_cache(cache)
+                if packages is None:
+                    packages = self._query_installed_packages()
+                    self._write_installed_packages_cache(cache, packages)
+
             _installed_packages = defaultdict(list)
-            for isp in isp_result["records"]:
-                sp = isp["SubscriberPackage"]
-                try:
-                    spv_result = self.salesforce_client.restful(
-                        "tooling/query/?q=SELECT Id, MajorVersion, MinorVersion, PatchVersion, BuildNumber, "
-                        f"IsBeta FROM SubscriberPackageVersion WHERE Id='{isp['SubscriberPackageVersionId']}'"
-                    )
-                except SalesforceError as err:
-                    self.logger.warning(
-                        f"Ignoring error while trying to check installed package {isp['SubscriberPackageVersionId']}: {err.content}"
-                    )
-                    continue
-                if not spv_result["records"]:
-                    # This _shouldn't_ happen, but it is possible in customer orgs.
-                    continue
-                spv = spv_result["records"][0]
-
-                version = f"{spv['MajorVersion']}.{spv['MinorVersion']}"
-                if spv["PatchVersion"]:
-                    version += f".{spv['PatchVersion']}"
-                if spv["IsBeta"]:
-                    version += f"b{spv['BuildNumber']}"
-                version_info = VersionInfo(spv["Id"], StrictVersion(version))
-                namespace = sp["NamespacePrefix"]
+            for package in packages:
+                version_info = VersionInfo(
+                    package["version_id"], StrictVersion(package["version"])
+                )
+                namespace = package["namespace"]
                 _installed_packages[namespace].append(version_info)
-                namespace_version = f"{namespace}@{version}"
+                namespace_version = f"{namespace}@{package['version']}"
                 _installed_packages[namespace_version].append(version_info)
-                _installed_packages[sp["Id"]].append(version_info)
+                _installed_packages[package["package_id"]].append(version_info)
 
             self._installed_packages = _installed_packages
         return self._installed_packages
 
+    def _query_installed_packages(self):
+        """Query the installed packages and their versions, using one query
+        for every batch of up to INSTALLED_PACKAGES_BATCH_SIZE packages."""
+        isp_result = self.salesforce_client.restful(
+            "tooling/query/?q=SELECT SubscriberPackage.Id, SubscriberPackage.NamespacePrefix, "
+            "SubscriberPackageVersionId FROM InstalledSubscriberPackage"
+        )
+        version_ids = [
+            isp["SubscriberPackageVersionId"] for isp in isp_result["records"]
+        ]
+        versions = {}
+        for i in range(0, len(version_ids), INSTALLED_PACKAGES_BATCH_SIZE):
+            versions.update(
+                self._query_package_versions(
+                    version_ids[i : i + INSTALLED_PACKAGES_BATCH_SIZE]
+                )
+            )
+
+        packages = []
+        for isp in isp_result["records"]:
+            spv = versions.get(isp["SubscriberPackageVersionId"])
+            if not spv:
+                # This _shouldn't_ happen, but it is possible in customer orgs.
+                continue
+
+            version = f"{spv['MajorVersion']}.{spv['MinorVersion']}"
+            if spv["PatchVersion"]:
+                version += f".{spv['PatchVersion']}"
+            if spv["IsBeta"]:
+                version += f"b{spv['BuildNumber']}"
+            packages.append(
+                {
+                    "package_id": isp["SubscriberPackage"]["Id"],
+                    "namespace": isp["SubscriberPackage"]["NamespacePrefix"],
+                    "version_id": spv["Id"],
+                    "version": version,
+                }
+            )
+
+        return packages
+
+    def _query_package_versions(self, version_ids):
+        """Return a dict mapping each of the given SubscriberPackageVersion Ids
+        to its record. If the batch query fails, fall back to querying each
+        version alone so that one bad package doesn't hide the others."""
+        id_list = ", ".join(f"'{version_id}'" for version_id in version_ids)
+        try:
+            spv_result = self.salesforce_client.restful(
+                "tooling/query/?q=SELECT Id, MajorVersion, MinorVersion, PatchVersion, BuildNumber, "
+                f"IsBeta FROM SubscriberPackageVersion WHERE Id IN ({id_list})"
+            )
+        except SalesforceError as err:
+            if len(version_ids) == 1:
+                self.logger.warning(
+                    f"Ignoring error while trying to check installed package {version_ids[0]}: {err.content}"
+                )
+                return {}
+
+            versions = {}
+            for version_id in version_ids:
+                versions.update(self._query_package_versions([version_id]))
+            return versions
+
+        return {spv["Id"]: spv for spv in spv_result["records"]}
+
+    @contextmanager
+    def _open_installed_packages_cache(self):
+        # Without a keychain and a username (and a repo, for project orgs),
+        # we don't know where to cache.
+        if not (
+            self.keychain
+            and self.username
+            and self.get_domain()
+            and (self.global_org or self.keychain.project_config.repo_root)
+        ):
+            yield None
+            return
+
+        with self.get_orginfo_cache_dir("installed_packages") as directory:
+            yield directory / "installed_packages.json"
+
+    def _read_installed_packages_cache(self, cache):
+        if cache is None or not cache.exists():
+            return None
+
+        try:
+            with cache.open("r") as f:
+                cached = json.load(f)
+        except ValueError:
+            return None
+
+        age = time.time() - cached.get("timestamp", 0)
+        if not 0 <= age < INSTALLED_PACKAGES_CACHE_TTL:
+            return None
+        return cached["packages"]
+
+    def _write_installed_packages_cache(self, cache, packages):
+        if cache is None:
+            return
+
+        with cache.open("w") as f:
+            json.dump({"timestamp": time.time(), "packages": packages}, f)
+
     def reset_installed_packages(self):
+        """Forget the installed packages, here and in the on-disk cache.
+        Call this after installing or uninstalling a package."""
         self._installed_packages = None
+        with self._open_installed_packages_cache() as cache:
+            if cache is not None and cache.exists():
+                cache.unlink()
 
     def save(self):
         assert self.keychain, "Keychain was not set on OrgConfig"
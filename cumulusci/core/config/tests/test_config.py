@@ -2,6 +2,7 @@
 import json
 import os
 import pathlib
+import time
 from pathlib import Path
 from tempfile import TemporaryDirectory
 from unittest import mock
@@ -1220,8 +1221,8 @@ class TestOrgConfig:
             ],
         },
         {
-            "size": 1,
-            "totalSize": 1,
+            "size": 3,
+            "totalSize": 3,
             "done": True,
             "records": [
                 {
@@ -1231,14 +1232,7 @@ class TestOrgConfig:
                     "PatchVersion": 0,
                     "BuildNumber": 5,
                     "IsBeta": False,
-                }
-            ],
-        },
-        {
-            "size": 1,
-            "totalSize": 1,
-            "done": True,
-            "records": [
+                },
                 {
                     "Id": "04t000000000001AAA",
                     "MajorVersion": 12,
@@ -1246,14 +1240,7 @@ class TestOrgConfig:
                     "PatchVersion": 1,
                     "BuildNumber": 1,
                     "IsBeta": False,
-                }
-            ],
-        },
-        {
-            "size": 1,
-            "totalSize": 1,
-            "done": True,
-            "records": [
+                },
                 {
                     "Id": "04t000000000002AAA",
                     "MajorVersion": 1,
@@ -1261,11 +1248,9 @@ class TestOrgConfig:
                     "PatchVersion": 0,
                     "BuildNumber": 5,
                     "IsBeta": True,
-                }
+                },
             ],
         },
-        {"size": 0, "totalSize": 0, "done": True, "records": []},
-        SalesforceError(None, None, None, None),
     ]
 
     @mock.patch("cumulusci.core.config.org_config.OrgConfig.salesforce_client")
@@ -1309,6 +1294,132 @@ class TestOrgConfig:
         assert config.installed_packages == expected
         sf.restful.assert_called()
 
+    @mock.patch("cumulusci.core.config.org_config.OrgConfig.salesforce_client")
+    def test_installed_packages__batched(self, sf):
+        config = OrgConfig({}, "test")
+        sf.restful.side_effect = self.MOCK_TOOLING_PACKAGE_RESULTS
+
+        assert list(config.installed_packages) == [
+            "GW_Volunteers",
+            "GW_Volunteers@3.119",
+            "03350000000DEz4AAG",
+            "GW_Volunteers@12.0.1",
+            "03350000000DEz5AAG",
+            "TESTY",
+            "TESTY@1.10b5",
+            "03350000000DEz7AAG",
+        ]
+        assert sf.restful.call_count == 2
+        assert sf.restful.call_args[0][0].endswith(
+            "FROM SubscriberPackageVersion WHERE Id IN ('04t1T00000070yqQAA', "
+            "'04t000000000001AAA', '04t000000000002AAA', '04t0000000BOGUSAAA', "
+            "'04t0000000ERRORAAA')"
+        )
+
+    @mock.patch("cumulusci.core.config.org_config.INSTALLED_PACKAGES_BATCH_SIZE", 3)
+    @mock.patch("cumulusci.core.config.org_config.OrgConfig.salesforce_client")
+    def test_installed_packages__batch_error(self, sf):
+        config = OrgConfig({}, "test")
+        isp_result, spv_result = self.MOCK_TOOLING_PACKAGE_RESULTS
+        spv_records = {r["Id"]: r for r in spv_result["records"]}
+
+        def restful(query):
+            if "FROM InstalledSubscriberPackage" in query:
+                return isp_result
+            if "ERROR" in query:
+                raise SalesforceError(None, None, None, None)
+            return {
+                "records": [
+                    record
+                    for version_id, record in spv_records.items()
+                    if version_id in query
+                ]
+            }
+
+        sf.restful.side_effect = restful
+
+        assert config.installed_packages["GW_Volunteers"] == [
+            VersionInfo("04t1T00000070yqQAA", StrictVersion("3.119")),
+            VersionInfo("04t000000000001AAA", StrictVersion("12.0.1")),
+        ]
+        assert "TESTY" in config.installed_packages
+        assert "error" not in config.installed_packages
+        # Two batches, plus one query for each package in the failed batch
+        assert sf.restful.call_count == 1 + 2 + 2
+
+    @mock.patch("cumulusci.core.config.org_config.OrgConfig.salesforce_client")
+    def test_installed_packages__disk_cache(self, sf):
+        def make_config():
+            return OrgConfig(
+                {
+                    "instance_url": "http://zombo.com/welcome",
+                    "username": "test-example@example.com",
+                },
+                "test",
+                keychain=DummyKeychain(),
+                global_org=False,
+            )
+
+        with TemporaryDirectory() as t:
+            with mock.patch("cumulusci.tests.util.DummyKeychain.cache_dir", Path(t)):
+                sf.restful.side_effect = self.MOCK_TOOLING_PACKAGE_RESULTS
+                expected = make_config().installed_packages
+                assert sf.restful.call_count == 2
+
+                # A new process reads the packages from the cache
+                assert make_config().installed_packages == expected
+                assert sf.restful.call_count == 2
+
+                # ...until it is invalidated after installing a package
+                config = make_config()
+                assert config.installed_packages == expected
+                assert sf.restful.call_count == 2
+                config.reset_installed_packages()
+                sf.restful.side_effect = self.MOCK_TOOLING_PACKAGE_RESULTS
+                assert make_config().installed_packages == expected
+                assert sf.restful.call_count == 4
+
+                # ...or it expires
+                with mock.patch(
+                    "cumulusci.core.config.org_config.time.time",
+                    return_value=time.time() + 3600,
+                ):
+                    sf.restful.side_effect = self.MOCK_TOOLING_PACKAGE_RESULTS
+                    assert make_config().installed_packages == expected
+                    assert sf.restful.call_count == 6
+
+    @mock.patch("cumulusci.core.config.org_config.OrgConfig.salesforce_client")
+    def test_installed_packages__no_disk_cache(self, sf):
+        keychain = DummyKeychain()
+        configs = [
+            # no username
+            OrgConfig(
+                {"instance_url": "http://zombo.com/welcome"},
+                "test",
+                keychain=keychain,
+            ),
+            # no repo to cache in
+            OrgConfig(
+                {
+                    "instance_url": "http://zombo.com/welcome",
+                    "username": "test-example@example.com",
+                },
+                "test",
+                keychain=keychain,
+                global_org=False,
+            ),
+        ]
+        with mock.patch.object(
+            BaseProjectConfig, "repo_root", new_callable=mock.PropertyMock
+        ) as repo_root, mock.patch.object(
+            OrgConfig, "get_orginfo_cache_dir"
+        ) as get_orginfo_cache_dir:
+            repo_root.return_value = None
+            for config in configs:
+                sf.restful.side_effect = self.MOCK_TOOLING_PACKAGE_RESULTS
+                assert "TESTY" in config.installed_packages
+        get_orginfo_cache_dir.assert_not_called()
+
     @mock.patch("cumulusci.core.config.org_config.OrgConfig.salesforce_client")
     def test_has_minimum_package_version(self, sf):
         config = OrgConfig({}, "test")
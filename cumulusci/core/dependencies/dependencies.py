@@ -1,9 +1,11 @@
 import abc
 import contextlib
+import functools
 import itertools
 import logging
 import os
-from typing import List, Optional
+from pathlib import Path
+from typing import Callable, List, Optional
 from zipfile import ZipFile
 
 import pydantic
@@ -65,6 +67,15 @@ def _validate_github_parameters(values):
     return values
 
 
+def _get_zipball_cache_dir(context: BaseProjectConfig) -> Optional[Path]:
+    """Return the directory where GitHub zipballs are cached by commit SHA,
+    or None if there is no local project to hold the cache."""
+    if not context.repo_root:
+        return None
+
+    return context.cache_dir / "zipballs"
+
+
 class DependencyPin(HashableBaseModel, abc.ABC):
     @abc.abstractmethod
     def can_pin(self, d: "DynamicDependency") -> bool:
@@ -559,10 +570,26 @@ class UnmanagedDependency(StaticDependency, abc.ABC):
     def _get_zip_src(self, context: BaseProjectConfig) -> ZipFile:
         pass
 
+    def _get_source_format(self, zip_src: ZipFile) -> SourceFormat:
+        """Determine the format of the metadata that will be deployed from the zip."""
+        if (
+            get_source_format_for_zipfile(zip_src, self.subfolder or "src")
+            is SourceFormat.MDAPI
+        ):
+            return SourceFormat.MDAPI
+        if not self.subfolder:
+            return get_source_format_for_zipfile(zip_src, None)
+
+        return SourceFormat.SFDX
+
     def get_metadata_package_zip_builder(
-        self, project_config: BaseProjectConfig, org: OrgConfig
+        self,
+        project_config: BaseProjectConfig,
+        org: OrgConfig,
+        zip_src: Optional[ZipFile] = None,
     ) -> MetadataPackageZipBuilder:
-        zip_src = self._get_zip_src(project_config)
+        if zip_src is None:
+            zip_src = self._get_zip_src(project_config)
         # Determine whether to inject namespace prefixes or not
         # If and only if we have no explicit configuration.
 
@@ -624,11 +651,41 @@ class UnmanagedDependency(StaticDependency, abc.ABC):
 
         return package_zip
 
-    def install(self, context: BaseProjectConfig, org: OrgConfig):
+    def prefetch_metadata_package_zip_builder(
+        self, project_config: BaseProjectConfig, org: OrgConfig
+    ) -> Callable[[], MetadataPackageZipBuilder]:
+        """Do as much of the work of `get_metadata_package_zip_builder()` as is
+        safe to do on a background thread, ahead of installation.
+
+        Returns a callable that finishes the job on the calling thread."""
+        zip_src = self._get_zip_src(project_config)
+
+        # We can't build yet if the package options depend on what is installed
+        # in the org by the time we get around to deploying, or if we need to
+        # convert SFDX source (which changes the working directory).
+        if (
+            self.unmanaged is None and self.namespace_inject
+        ) or self._get_source_format(zip_src) is SourceFormat.SFDX:
+            return functools.partial(
+                self.get_metadata_package_zip_builder, project_config, org, zip_src
+            )
+
+        package_zip = self.get_metadata_package_zip_builder(
+            project_config, org, zip_src
+        )
+        return lambda: package_zip
+
+    def install(
+        self,
+        context: BaseProjectConfig,
+        org: OrgConfig,
+        package_zip_builder: Optional[MetadataPackageZipBuilder] = None,
+    ):
 
         context.logger.info(f"Deploying unmanaged metadata from {self.description}")
 
-        package_zip_builder = self.get_metadata_package_zip_builder(context, org)
+        if package_zip_builder is None:
+            package_zip_builder = self.get_metadata_package_zip_builder(context, org)
         task = TaskContext(org_config=org, project_config=context, logger=logger)
         api = ApiDeploy(task, package_zip_builder.as_base64())
 
@@ -667,6 +724,7 @@ class UnmanagedGitHubRefDependency(UnmanagedDependency):
         return download_extract_github_from_repo(
             repo,
             ref=self.ref,
+            cache_dir=_get_zipball_cache_dir(context),
         )
 
     @property
@@ -0,0 +1,75 @@
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, List
+
+from cumulusci.core.config import OrgConfig
+from cumulusci.core.config.project_config import BaseProjectConfig
+from cumulusci.core.dependencies.dependencies import (
+    StaticDependency,
+    UnmanagedDependency,
+)
+from cumulusci.salesforce_api.package_zip import MetadataPackageZipBuilder
+
+
+class UnmanagedDependencyPrefetcher:
+    """Downloads and builds the packages for upcoming unmanaged dependencies
+    on background threads, so that this local work overlaps with installing
+    earlier dependencies into the org. Installs themselves stay serialized.
+
+    At most `max_workers` packages are held ahead of the one being installed.
+    Errors raised while prefetching a dependency are re-raised when that
+    dependency's package is requested."""
+
+    def __init__(
+        self,
+        context: BaseProjectConfig,
+        org: OrgConfig,
+        dependencies: List[StaticDependency],
+        max_workers: int = 2,
+    ):
+        self.context = context
+        self.org = org
+        self.max_workers = max_workers
+        self._pending = [d for d in dependencies if isinstance(d, UnmanagedDependency)]
+        self._futures: Dict[int, Future] = {}
+        self._executor = None
+
+    def __enter__(self):
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="cci-prefetch"
+        )
+        self._fill()
+        return self
+
+    def __exit__(self, *args):
+        for future in self._futures.values():
+            future.cancel()
+        self._futures.clear()
+        self._pending.clear()
+        self._executor.shutdown(wait=True)
+
+    def _fill(self):
+        while self._pending and len(self._futures) < self.max_workers:
+            dependency = self._pending.pop(0)
+            self._futures[id(dependency)] = self._executor.submit(
+                dependency.prefetch_metadata_package_zip_builder,
+                self.context,
+                self.org,
+            )
+
+    def get_metadata_package_zip_builder(
+        self, dependency: UnmanagedDependency
+    ) -> MetadataPackageZipBuilder:
+        """Return the package for `dependency`, waiting for it to be prefetched
+        if necessary, and start prefetching the next pending dependency."""
+        future = self._futures.pop(id(dependency), None)
+        if future is None:
+            # Requested out of order: build it now, and don't prefetch it again.
+            self._pending = [d for d in self._pending if d is not dependency]
+            return dependency.get_metadata_package_zip_builder(self.context, self.org)
+
+        try:
+            finish = future.result()
+        finally:
+            self._fill()
+
+        return finish()
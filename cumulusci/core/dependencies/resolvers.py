@@ -1,5 +1,7 @@
 import abc
+import contextlib
 import itertools
+from concurrent.futures import ThreadPoolExecutor
 from typing import Callable, Iterable, List, Optional, Tuple, Union
 
 from github3.exceptions import NotFoundError
@@ -511,6 +513,10 @@ RESOLVER_CLASSES = {
 
 ## External API
 
+# Number of threads used to resolve and flatten each level of the dependency tree.
+# Resolution is dominated by GitHub API latency, so a small pool goes a long way.
+DEFAULT_RESOLUTION_MAX_WORKERS = 8
+
 
 def get_resolver(
     strategy: DependencyResolutionStrategy, dependency: DynamicDependency
@@ -563,6 +569,7 @@ def get_static_dependencies(
     strategies: Optional[List[DependencyResolutionStrategy]] = None,
     filter_function: Optional[Callable] = None,
     pins: Optional[List[DependencyPin]] = None,
+    max_workers: Optional[int] = None,
 ) -> List[StaticDependency]:
     """Resolves the dependencies of a CumulusCI project
     to convert dynamic GitHub dependencies into static dependencies
@@ -578,6 +585,10 @@ def get_static_dependencies(
     :param filter_function: if provided, call the function with each dependency
                             (including transitive ones) encountered, and include
                             those for which True is returned.
+    :param pins: an optional list of pins to apply
+                 (defaults to project__dependency_pins from the project_config)
+    :param max_workers: the number of threads used to resolve each level of the
+                        dependency tree concurrently. Pass 1 to resolve serially.
     """
     if dependencies is None:
         dependencies = parse_dependencies(context.project__dependencies)
@@ -590,36 +601,67 @@ def get_static_dependencies(
         strategies = get_resolver_stack(context, resolution_strategy)
     if filter_function is None:
         filter_function = lambda x: True  # noqa: E731
-
-    while any(not d.is_flattened or not d.is_resolved for d in dependencies):
-        for d in dependencies:
-            if isinstance(d, DynamicDependency) and not d.is_resolved:
-                # Finish resolving the dependency using our given strategies.
-                d.resolve(context, strategies, pins)
-
-        def unique(it: Iterable):
-            seen = set()
-
-            for each in it:
-                if each not in seen:
-                    seen.add(each)
-                    yield each
-
-        dependencies = list(
-            unique(
-                itertools.chain(
-                    *list(
-                        d.flatten(context) for d in dependencies if filter_function(d)
-                    )
-                ),
+    if max_workers is None:
+        max_workers = DEFAULT_RESOLUTION_MAX_WORKERS
+
+    def unique(it: Iterable):
+        seen = set()
+
+        for each in it:
+            if each not in seen:
+                seen.add(each)
+                yield each
+
+    def resolve(d: DynamicDependency):
+        d.resolve(context, strategies, pins)
+
+    def flatten(d: Dependency) -> List[Dependency]:
+        return d.flatten(context)
+
+    # Each pass handles one level of the dependency tree. Resolving and flattening
+    # the dependencies within a level are independent of one another, so they run
+    # concurrently; `map()` hands back results in input order, which keeps the
+    # output (and the de-duplication below) identical to a sequential run.
+    with _level_mapper(max_workers) as map_level:
+        while any(not d.is_flattened or not d.is_resolved for d in dependencies):
+            # Finish resolving the dependencies using our given strategies.
+            # The same object may appear more than once; only resolve it once.
+            unresolved = {
+                id(d): d
+                for d in dependencies
+                if isinstance(d, DynamicDependency) and not d.is_resolved
+            }
+            list(map_level(resolve, unresolved.values()))
+
+            dependencies = list(
+                unique(
+                    itertools.chain(
+                        *map_level(
+                            flatten, [d for d in dependencies if filter_function(d)]
+                        )
+                    ),
+                )
             )
-        )
 
     # Make sure, if we had no flattening or resolving to do, that we apply the ignore list.
     # Type is guaranteed via the logic above.
     return [d for d in dependencies if filter_function(d)]  # type: ignore
 
 
+@contextlib.contextmanager
+def _level_mapper(max_workers: int):
+    """Yield an order-preserving `map()`, backed by a thread pool if
+    more than one worker is requested."""
+    if max_workers <= 1:
+        yield map
+        return
+
+    with ThreadPoolExecutor(
+        max_workers=max_workers, thread_name_prefix="cci-dependencies"
+    ) as executor:
+        yield executor.map
+
+
 def resolve_dependency(
     dependency: DynamicDependency,
     context: BaseProjectConfig,
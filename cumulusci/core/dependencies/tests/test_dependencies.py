@@ -1,5 +1,6 @@
 import io
 import os
+from pathlib import Path
 from typing import List, Optional, Tuple
 from unittest import mock
 from zipfile import ZipFile
@@ -620,11 +621,12 @@ class TestUnmanagedGitHubRefDependency:
         download_mock.return_value = zf
 
         context = mock.Mock()
+        context.repo_root = None
         org = mock.Mock()
         d.install(context, org)
 
         download_mock.assert_called_once_with(
-            context.get_repo_from_url.return_value, ref=d.ref
+            context.get_repo_from_url.return_value, ref=d.ref, cache_dir=None
         )
         zip_builder_mock.from_zipfile.assert_called_once_with(
             download_mock.return_value,
@@ -646,6 +648,22 @@ class TestUnmanagedGitHubRefDependency:
 
         api_deploy_mock.return_value.assert_called_once()
 
+    @mock.patch(
+        "cumulusci.core.dependencies.dependencies.download_extract_github_from_repo"
+    )
+    def test_get_zip_src__cache_dir(self, download_mock):
+        d = UnmanagedGitHubRefDependency(
+            github="http://github.com/Test/TestRepo", ref="aaaaaaaa"
+        )
+        context = mock.Mock(repo_root="/tmp/project", cache_dir=Path("/tmp/.cci"))
+        d._get_zip_src(context)
+
+        download_mock.assert_called_once_with(
+            context.get_repo_from_url.return_value,
+            ref=d.ref,
+            cache_dir=Path("/tmp/.cci/zipballs"),
+        )
+
     def test_get_unmanaged(self):
         org = mock.Mock()
         org.installed_packages = {"foo": "1.0"}
@@ -868,6 +886,86 @@ class TestUnmanagedZipURLDependency:
         )
 
 
+class TestUnmanagedDependencyPrefetch:
+    def _zip(self, *names):
+        zf = ZipFile(io.BytesIO(), "w")
+        for name in names:
+            zf.writestr(name, "test")
+        return zf
+
+    @mock.patch("cumulusci.core.dependencies.dependencies.MetadataPackageZipBuilder")
+    @mock.patch("cumulusci.core.dependencies.dependencies.download_extract_zip")
+    def test_prefetch_metadata_package_zip_builder__builds_mdapi(
+        self, download_zip_mock, zipbuilder_mock
+    ):
+        download_zip_mock.return_value = self._zip("src/package.xml")
+        dep = UnmanagedZipURLDependency(zip_url="http://foo.com")
+
+        finish = dep.prefetch_metadata_package_zip_builder(mock.Mock(), mock.Mock())
+
+        zipbuilder_mock.from_zipfile.assert_called_once()
+        assert finish() == zipbuilder_mock.from_zipfile.return_value
+        zipbuilder_mock.from_zipfile.assert_called_once()
+
+    @mock.patch("cumulusci.core.dependencies.dependencies.MetadataPackageZipBuilder")
+    @mock.patch("cumulusci.core.dependencies.dependencies.download_extract_zip")
+    def test_prefetch_metadata_package_zip_builder__defers_org_dependent_options(
+        self, download_zip_mock, zipbuilder_mock
+    ):
+        download_zip_mock.return_value = self._zip("src/package.xml")
+        dep = UnmanagedZipURLDependency(zip_url="http://foo.com", namespace_inject="ns")
+        org = mock.Mock()
+        org.installed_packages = {}
+
+        finish = dep.prefetch_metadata_package_zip_builder(mock.Mock(), org)
+        download_zip_mock.assert_called_once()
+        zipbuilder_mock.from_zipfile.assert_not_called()
+
+        # The namespace is installed by an earlier dependency in the meantime.
+        org.installed_packages = {"ns": []}
+        assert finish() == zipbuilder_mock.from_zipfile.return_value
+        assert (
+            zipbuilder_mock.from_zipfile.call_args[1]["options"]["unmanaged"] is False
+        )
+        download_zip_mock.assert_called_once()
+
+    @mock.patch("cumulusci.core.dependencies.dependencies.MetadataPackageZipBuilder")
+    @mock.patch("cumulusci.core.dependencies.dependencies.download_extract_zip")
+    def test_prefetch_metadata_package_zip_builder__defers_sfdx(
+        self, download_zip_mock, zipbuilder_mock
+    ):
+        download_zip_mock.return_value = self._zip("force-app/main/default/classes/")
+        dep = UnmanagedZipURLDependency(zip_url="http://foo.com", subfolder="force-app")
+
+        with mock.patch.object(
+            UnmanagedZipURLDependency, "get_metadata_package_zip_builder"
+        ) as get_builder:
+            context = mock.Mock()
+            org = mock.Mock()
+            finish = dep.prefetch_metadata_package_zip_builder(context, org)
+            get_builder.assert_not_called()
+
+            assert finish() == get_builder.return_value
+            get_builder.assert_called_once_with(
+                context, org, download_zip_mock.return_value
+            )
+
+    @mock.patch("cumulusci.core.dependencies.dependencies.ApiDeploy")
+    def test_install__prebuilt(self, api_deploy_mock):
+        dep = UnmanagedZipURLDependency(zip_url="http://foo.com")
+        builder = mock.Mock()
+
+        with mock.patch.object(
+            UnmanagedZipURLDependency, "get_metadata_package_zip_builder"
+        ) as get_builder:
+            dep.install(mock.Mock(), mock.Mock(), builder)
+
+        get_builder.assert_not_called()
+        api_deploy_mock.assert_called_once_with(
+            mock.ANY, builder.as_base64.return_value
+        )
+
+
 class TestParseDependency:
     def test_parse_managed_package_dep(self):
         m = parse_dependency({"version": "1.0", "namespace": "foo"})
@@ -0,0 +1,104 @@
+import threading
+from unittest import mock
+
+import pytest
+
+from cumulusci.core.dependencies.dependencies import (
+    PackageNamespaceVersionDependency,
+    UnmanagedZipURLDependency,
+)
+from cumulusci.core.dependencies.prefetch import UnmanagedDependencyPrefetcher
+from cumulusci.core.exceptions import DependencyResolutionError
+from cumulusci.salesforce_api.package_zip import MetadataPackageZipBuilder
+
+
+def _unmanaged(n):
+    return UnmanagedZipURLDependency(zip_url=f"http://example.com/{n}.zip")
+
+
+class TestUnmanagedDependencyPrefetcher:
+    def test_prefetches_in_background(self):
+        deps = [
+            PackageNamespaceVersionDependency(namespace="ns", version="1.0"),
+            _unmanaged(1),
+            _unmanaged(2),
+        ]
+        threads = {}
+        main_thread = threading.get_ident()
+
+        def prefetch(self, context, org):
+            threads[self.zip_url] = threading.get_ident()
+            package = mock.Mock(spec=MetadataPackageZipBuilder, url=self.zip_url)
+            return lambda: package
+
+        with mock.patch.object(
+            UnmanagedZipURLDependency, "prefetch_metadata_package_zip_builder", prefetch
+        ):
+            with UnmanagedDependencyPrefetcher(
+                mock.Mock(), mock.Mock(), deps, max_workers=2
+            ) as prefetcher:
+                first = prefetcher.get_metadata_package_zip_builder(deps[1])
+                assert first.url == "http://example.com/1.zip"
+                second = prefetcher.get_metadata_package_zip_builder(deps[2])
+                assert second.url == "http://example.com/2.zip"
+
+        assert len(threads) == 2
+        assert main_thread not in threads.values()
+
+    def test_bounds_lookahead(self):
+        deps = [_unmanaged(n) for n in range(4)]
+
+        with mock.patch.object(
+            UnmanagedZipURLDependency, "prefetch_metadata_package_zip_builder"
+        ) as prefetch:
+            with UnmanagedDependencyPrefetcher(
+                mock.Mock(), mock.Mock(), deps, max_workers=2
+            ) as prefetcher:
+                assert len(prefetcher._futures) == 2
+                assert prefetcher._pending == deps[2:]
+
+                prefetcher.get_metadata_package_zip_builder(deps[0])
+                assert len(prefetcher._futures) == 2
+                assert prefetcher._pending == deps[3:]
+
+        assert prefetch.call_count == 3
+
+    def test_reraises_errors_in_order(self):
+        deps = [_unmanaged(1), _unmanaged(2)]
+        package = mock.Mock(spec=MetadataPackageZipBuilder)
+
+        def prefetch(self, context, org):
+            if self is deps[0]:
+                raise DependencyResolutionError("Could not download")
+            return lambda: package
+
+        with mock.patch.object(
+            UnmanagedZipURLDependency, "prefetch_metadata_package_zip_builder", prefetch
+        ):
+            with UnmanagedDependencyPrefetcher(
+                mock.Mock(), mock.Mock(), deps
+            ) as prefetcher:
+                with pytest.raises(DependencyResolutionError):
+                    prefetcher.get_metadata_package_zip_builder(deps[0])
+                assert prefetcher.get_metadata_package_zip_builder(deps[1]) == package
+
+    def test_builds_unknown_dependency_directly(self):
+        deps = [_unmanaged(n) for n in range(3)]
+        context = mock.Mock()
+        org = mock.Mock()
+
+        with mock.patch.object(
+            UnmanagedZipURLDependency, "prefetch_metadata_package_zip_builder"
+        ), mock.patch.object(
+            UnmanagedZipURLDependency, "get_metadata_package_zip_builder"
+        ) as get_builder:
+            with UnmanagedDependencyPrefetcher(
+                context, org, deps, max_workers=1
+            ) as prefetcher:
+                assert (
+                    prefetcher.get_metadata_package_zip_builder(deps[2])
+                    == get_builder.return_value
+                )
+                assert prefetcher._pending == deps[1:2]
+
+        get_builder.assert_called_once_with(context, org)
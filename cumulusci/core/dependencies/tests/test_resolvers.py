@@ -1,3 +1,4 @@
+import threading
 from typing import List, Optional, Tuple
 from unittest import mock
 
@@ -856,3 +857,74 @@ version_id: 04t000000000000"""
                 namespace_inject="bar",
             ),
         ]
+
+    def test_get_static_dependencies__serial_matches_concurrent(self, project_config):
+        def resolve(max_workers):
+            return get_static_dependencies(
+                project_config,
+                dependencies=[
+                    GitHubDynamicDependency(
+                        github="https://github.com/SFDO-Tooling/RootRepo"
+                    ),
+                    GitHubDynamicDependency(
+                        github="https://github.com/SFDO-Tooling/DependencyRepo"
+                    ),
+                ],
+                strategies=[DependencyResolutionStrategy.RELEASE_TAG],
+                max_workers=max_workers,
+            )
+
+        with mock.patch(
+            "cumulusci.core.dependencies.resolvers.ThreadPoolExecutor"
+        ) as executor:
+            serial = resolve(1)
+        executor.assert_not_called()
+
+        concurrent = resolve(4)
+        assert concurrent == serial
+        assert [str(d) for d in concurrent] == [
+            "https://github.com/SFDO-Tooling/DependencyRepo/unpackaged/pre/top @tag_sha",
+            "DependencyRepo 1.1",
+            "https://github.com/SFDO-Tooling/DependencyRepo/unpackaged/post/top @tag_sha",
+            "https://github.com/SFDO-Tooling/RootRepo/unpackaged/pre/first @tag_sha",
+            "https://github.com/SFDO-Tooling/RootRepo/unpackaged/pre/second @tag_sha",
+            "RootRepo 2.0",
+            "https://github.com/SFDO-Tooling/RootRepo/unpackaged/post/first @tag_sha",
+            "DependencyRepo 1.1",
+        ]
+
+    def test_get_static_dependencies__resolves_level_concurrently(self, project_config):
+        deps = [
+            GitHubDynamicDependency(github=f"https://github.com/Test/Repo{i}")
+            for i in range(3)
+        ]
+        barrier = threading.Barrier(len(deps))
+        threads = set()
+
+        def resolve(self, context, strategies, pins):
+            threads.add(threading.get_ident())
+            # Only passes if every dependency in the level is resolved at once.
+            barrier.wait(timeout=5)
+            self.ref = "abcdef"
+            self.package_dependency = PackageNamespaceVersionDependency(
+                namespace=self.github.path.strip("/"), version="1.0"
+            )
+
+        def flatten(self, context):
+            return [self.package_dependency]
+
+        with mock.patch.object(GitHubDynamicDependency, "resolve", resolve):
+            with mock.patch.object(GitHubDynamicDependency, "flatten", flatten):
+                result = get_static_dependencies(
+                    project_config,
+                    dependencies=deps,
+                    strategies=[],
+                    max_workers=len(deps),
+                )
+
+        assert len(threads) == len(deps)
+        assert [d.namespace for d in result] == [
+            "Test/Repo0",
+            "Test/Repo1",
+            "Test/Repo2",
+        ]
@@ -78,6 +78,7 @@ from cumulusci.core.exceptions import (
     FlowInfiniteLoopError,
     TaskImportError,
 )
+from cumulusci.salesforce_api.utils import OrgConnectionPool
 from cumulusci.utils.version_strings import LooseVersion
 
 if TYPE_CHECKING:
@@ -330,6 +331,7 @@ class FlowCoordinator:
     runtime_options: dict
     name: Optional[str]
     results: List[StepResult]
+    connection_pool: Optional[OrgConnectionPool]
 
     def __init__(
         self,
@@ -344,6 +346,7 @@ class FlowCoordinator:
         self.flow_config = flow_config
         self.name = name
         self.org_config = None
+        self.connection_pool = None
 
         if not callbacks:
             callbacks = FlowCallback()
@@ -490,6 +493,7 @@ class FlowCoordinator:
         self.logger.info("Starting execution")
         self._rule(new_line=True)
 
+        self._open_connection_pool()
         try:
             for step in self.steps:
                 self._run_step(step)
@@ -498,6 +502,7 @@ class FlowCoordinator:
                 f"Completed flow {flow_name}on org {org_config.name} successfully!"
             )
         finally:
+            self._close_connection_pool()
             self.callbacks.post_flow(self)
 
     def _run_step(self, step: StepSpec):
@@ -748,6 +753,15 @@ class FlowCoordinator:
         with self.org_config.save_if_changed():
             self.org_config.refresh_oauth_token(self.project_config.keychain)
 
+    def _open_connection_pool(self):
+        """Share API connections to the org among the tasks of this run."""
+        self.connection_pool = OrgConnectionPool(self.org_config)
+
+    def _close_connection_pool(self):
+        if self.connection_pool:
+            self.connection_pool.close()
+            self.connection_pool = None
+
     def resolve_return_value_options(self, options):
         """Handle dynamic option value lookups in the format ^^task_name.attr"""
         for key, value in options.items():
@@ -786,6 +800,7 @@ class PreflightFlowCoordinator(FlowCoordinator):
         self.preflight_results = defaultdict(list)
         # Expose for test access
         self._task_caches = {self.project_config: TaskCache(self, self.project_config)}
+        self._open_connection_pool()
         try:
             # flow-level checks
             jinja2_context = {
@@ -814,6 +829,7 @@ class PreflightFlowCoordinator(FlowCoordinator):
                     if result:
                         self.preflight_results[str(step.step_num)].append(result)
         finally:
+            self._close_connection_pool()
             self.callbacks.post_flow(self)
 
     def evaluate_check(
@@ -136,6 +136,11 @@ class BaseProjectKeychain(BaseConfig):
             org.keychain = self
         return org
 
+    def get_org_summary(self, name: str):
+        """retrieve an org configuration for display purposes.
+        Keychains may return a config without secrets, which is cheaper to load."""
+        return self.get_org(name)
+
     def list_orgs(self):
         """list the orgs configured in the keychain"""
         orgs = list(self.orgs.keys())
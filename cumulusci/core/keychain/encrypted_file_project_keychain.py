@@ -1,7 +1,10 @@
 import base64
+import hashlib
 import json
 import os
 import sys
+import threading
+import time
 import typing as T
 from pathlib import Path
 from shutil import rmtree
@@ -21,6 +24,8 @@ from cumulusci.core.exceptions import (
 from cumulusci.core.keychain import BaseProjectKeychain
 from cumulusci.core.keychain.base_project_keychain import DEFAULT_CONNECTED_APP_NAME
 from cumulusci.core.keychain.serialization import (
+    decode_dict,
+    encode_value,
     load_config_from_json_or_pickle,
     serialize_config_to_json_or_pickle,
 )
@@ -29,6 +34,22 @@ from cumulusci.utils.encryption import _get_cipher, encrypt_and_b64
 from cumulusci.utils.yaml.cumulusci_yml import ScratchOrg
 
 DEFAULT_SERVICES_FILENAME = "DEFAULT_SERVICES.json"
+ORG_INDEX_FILENAME = "ORG_INDEX.json"
+
+# Org config keys which are copied to the (unencrypted) org index.
+# This must never include secrets such as tokens or passwords.
+INDEXED_ORG_KEYS = (
+    "scratch",
+    "sfdx",
+    "created",
+    "config_name",
+    "date_created",
+    "days",
+    "expires",
+    "username",
+    "instance_url",
+)
+_org_index_lock = threading.Lock()
 
 # The file permissions that we want set on all
 # .org and .service files. Equivalent to -rw-------
@@ -65,6 +86,10 @@ Org files (.org) live in both under ~/.cumulusci and in local project directorie
 The .org files store an encrypted access_token and other org attributes. There is a
 DEFAULT_ORG.txt file in each local project directory that stores the name of
 the default org for that project.
+
+Each directory with .org files also has an ORG_INDEX.json file, which holds the
+non-secret attributes of its orgs so that they can be listed without decrypting
+every .org file.
 """
 
 
@@ -220,6 +245,7 @@ class EncryptedFileProjectKeychain(BaseProjectKeychain):
             return Path(self.project_local_dir) / "DEFAULT_ORG.txt"
 
     def _load_orgs(self) -> None:
+        self._org_indexes = {}
         self._load_orgs_from_environment()
         self._load_org_files(self.global_config_dir, GlobalOrg)
         self._load_org_files(self.project_local_dir, LocalOrg)
@@ -276,6 +302,7 @@ class EncryptedFileProjectKeychain(BaseProjectKeychain):
         org_config.global_org = global_org
 
         org_name = org_config.name
+        config_to_index = org_config
 
         org_bytes = self._get_config_bytes(org_config)
         assert isinstance(org_bytes, bytes)
@@ -305,13 +332,15 @@ class EncryptedFileProjectKeychain(BaseProjectKeychain):
                 org_name,
                 org_config.data,
                 global_org,
+                org_config=config_to_index,
             )
 
-    def _save_org(self, name, org_bytes, global_org):
+    def _save_org(self, name, org_bytes, global_org, org_config=None):
         """
         @name - name of the org
         @org_bytes - bytes-like objecte to write to disk
         @global_org - whether or not this is a global org
+        @org_config - the OrgConfig to record in the org index, if any
         """
         if global_org:
             filename = Path(f"{self.global_config_dir}/{name}.org")
@@ -324,6 +353,9 @@ class EncryptedFileProjectKeychain(BaseProjectKeychain):
         with open(fd, "wb") as f:
             f.write(org_bytes)
 
+        if org_config is not None:
+            self._update_org_index(name, org_config, org_bytes, global_org)
+
     def _get_org(self, org_name: str) -> ScratchOrgConfig:
         try:
             config = self.orgs[org_name].data
@@ -350,6 +382,88 @@ class EncryptedFileProjectKeychain(BaseProjectKeychain):
 
         return org
 
+    def get_org_summary(self, org_name: str) -> OrgConfig:
+        """Retrieve an org configuration for display purposes.
+
+        If the org index is up to date for this org, the config returned
+        holds only the keys in INDEXED_ORG_KEYS and the org file is not
+        decrypted. Otherwise the full org config is loaded and indexed."""
+        try:
+            org = self.orgs[org_name]
+        except KeyError:
+            raise OrgNotFound(f"Org with name '{org_name}' does not exist.")
+
+        entry = self._read_org_index(org.global_org).get(org_name)
+        if entry and entry.get("digest") == _get_org_digest(org.data):
+            summary = self._construct_config(
+                OrgConfig, [dict(entry["config"]), org_name, self]
+            )
+            summary.global_org = org.global_org
+            if isinstance(summary, ScratchOrgConfig):
+                self._merge_config_from_yml(summary)
+            return summary
+
+        org_config = self.get_org(org_name)
+        # Orgs loaded from the environment have no file to index.
+        if org.filename:
+            self._update_org_index(org_name, org_config, org.data, org.global_org)
+        return org_config
+
+    def _get_org_index_path(self, global_org: bool) -> T.Optional[Path]:
+        scope = self.global_config_dir if global_org else self.project_local_dir
+        if scope:
+            return Path(scope) / ORG_INDEX_FILENAME
+
+    def _read_org_index(self, global_org: bool) -> dict:
+        path = self._get_org_index_path(global_org)
+        if path not in self._org_indexes:
+            index = {}
+            if path and path.exists():
+                try:
+                    index = json.loads(path.read_text(), object_hook=decode_dict)
+                except ValueError:
+                    self.logger.warning(f"Ignoring unreadable org index {path}")
+            self._org_indexes[path] = index
+        return self._org_indexes[path]
+
+    def _write_org_index(self, global_org: bool, index: dict):
+        path = self._get_org_index_path(global_org)
+        # Replace the file at once so that other processes never see a partial index
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(index, default=encode_value))
+        os.replace(tmp_path, path)
+
+    def _update_org_index(
+        self, org_name: str, org_config: OrgConfig, org_bytes: bytes, global_org: bool
+    ):
+        """Record the non-secret attributes of an org in the org index."""
+        if not self._get_org_index_path(global_org):
+            return
+        config = {
+            key: org_config.config[key]
+            for key in INDEXED_ORG_KEYS
+            if org_config.config.get(key) is not None
+        }
+        if "username" not in config and org_config.userinfo__preferred_username:
+            config["username"] = org_config.userinfo__preferred_username
+        entry = {
+            "digest": _get_org_digest(org_bytes),
+            "saved": time.time(),
+            "config": config,
+        }
+        with _org_index_lock:
+            index = self._read_org_index(global_org)
+            index[org_name] = entry
+            self._write_org_index(global_org, index)
+
+    def _remove_from_org_index(self, org_name: str, global_org: bool):
+        if not self._get_org_index_path(global_org):
+            return
+        with _org_index_lock:
+            index = self._read_org_index(global_org)
+            if index.pop(org_name, None) is not None:
+                self._write_org_index(global_org, index)
+
     def _merge_config_from_yml(self, scratch_config: ScratchOrgConfig):
         """Merges any values configurable via cumulusci.yml
         into the scratch org config that is loaded from file."""
@@ -392,6 +506,7 @@ class EncryptedFileProjectKeychain(BaseProjectKeychain):
 
         org_path.unlink()
         del self.orgs[name]
+        self._remove_from_org_index(name, global_org)
 
     def cleanup_org_cache_dirs(self):
         """Cleanup directories that are not associated with a connected/live org."""
@@ -400,7 +515,7 @@ class EncryptedFileProjectKeychain(BaseProjectKeychain):
             return
         active_org_domains = set()
         for org in self.list_orgs():
-            org_config = self.get_org(org)
+            org_config = self.get_org_summary(org)
             domain = org_config.get_domain()
             if domain:
                 active_org_domains.add(domain)
@@ -929,6 +1044,11 @@ class EncryptedFileProjectKeychain(BaseProjectKeychain):
         )
 
 
+def _get_org_digest(org_bytes: bytes) -> str:
+    """Identifies the saved contents of an org file, to detect stale index entries."""
+    return hashlib.sha256(org_bytes).hexdigest()
+
+
 class GlobalOrg(T.NamedTuple):
     data: bytes
     global_org: bool = True
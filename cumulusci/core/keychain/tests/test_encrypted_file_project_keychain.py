@@ -38,6 +38,7 @@ from cumulusci.core.keychain.base_project_keychain import (
     DEFAULT_CONNECTED_APP_NAME,
 )
 from cumulusci.core.keychain.encrypted_file_project_keychain import (
+    ORG_INDEX_FILENAME,
     SERVICE_ORG_FILE_MODE,
     GlobalOrg,
 )
@@ -176,6 +177,71 @@ class TestEncryptedFileProjectKeychain:
         keychain.set_org(org_config)
         keychain.remove_org("test")
         assert "test" not in keychain.orgs
+        index_path = Path(keychain.project_local_dir, ORG_INDEX_FILENAME)
+        assert "test" not in json.loads(index_path.read_text())
+
+    def test_get_org_summary__from_index(self, keychain, project_config, key):
+        date_created = datetime.datetime(2021, 1, 1)
+        scratch_org_config = ScratchOrgConfig(
+            {
+                "scratch": True,
+                "config_name": "dev",
+                "date_created": date_created,
+                "days": 7,
+                "username": "test@example.com",
+                "instance_url": "https://foo.my.salesforce.com",
+                "access_token": "SECRET",
+            },
+            "scratch",
+        )
+        keychain.set_org(scratch_org_config, False)
+        keychain.set_org(
+            OrgConfig(
+                {"userinfo": {"preferred_username": "user@example.com"}},
+                "dev",
+                global_org=True,
+            ),
+            True,
+        )
+        index_path = Path(keychain.project_local_dir, ORG_INDEX_FILENAME)
+        assert "SECRET" not in index_path.read_text()
+
+        # A new keychain loads the summaries without decrypting org files
+        keychain = EncryptedFileProjectKeychain(project_config, key)
+        with mock.patch.object(keychain, "get_org") as get_org:
+            summary = keychain.get_org_summary("scratch")
+            dev_summary = keychain.get_org_summary("dev")
+        get_org.assert_not_called()
+
+        assert isinstance(summary, ScratchOrgConfig)
+        assert summary.date_created == date_created
+        assert summary.expired
+        assert summary.get_domain() == "foo.my.salesforce.com"
+        assert "access_token" not in summary.config
+        assert not summary.global_org
+        assert dev_summary.config == {"username": "user@example.com"}
+        assert dev_summary.global_org
+
+    def test_get_org_summary__stale_index(self, keychain, project_config, key):
+        keychain.set_org(OrgConfig({"username": "old@example.com"}, "test"), False)
+
+        # Another process saves the org without updating the index
+        org_bytes = keychain._get_config_bytes(
+            OrgConfig({"username": "new@example.com"}, "test")
+        )
+        Path(keychain.project_local_dir, "test.org").write_bytes(org_bytes)
+
+        keychain = EncryptedFileProjectKeychain(project_config, key)
+        summary = keychain.get_org_summary("test")
+        assert summary.username == "new@example.com"
+        with mock.patch.object(keychain, "get_org") as get_org:
+            summary = keychain.get_org_summary("test")
+        get_org.assert_not_called()
+        assert summary.config == {"username": "new@example.com"}
+
+    def test_get_org_summary__not_found(self, keychain):
+        with pytest.raises(OrgNotFound):
+            keychain.get_org_summary("mythical")
 
     def test_remove_org__not_found(self, keychain):
         keychain.orgs["test"] = mock.Mock()
@@ -1082,7 +1148,9 @@ class TestCleanupOrgCacheDir:
         ):
             global_org_dir = _touch_test_org_file(keychain.global_config_dir)
             temp_for_project = tempfile.mkdtemp()
-            keychain.project_config = mock.Mock()
+            keychain.project_config = mock.Mock(
+                project_local_dir=keychain.project_local_dir
+            )
 
             cache_dir = keychain.project_config.cache_dir = Path(temp_for_project)
             project_org_dir = _touch_test_org_file(cache_dir)
@@ -1108,7 +1176,9 @@ class TestCleanupOrgCacheDir:
             OrgConfig({"instance_url": "http://foo.my.salesforce.com/"}, "dev"), False
         )
 
-        keychain.project_config = mock.Mock()
+        keychain.project_config = mock.Mock(
+            project_local_dir=keychain.project_local_dir
+        )
         temp_for_global = tempfile.mkdtemp()
         with mock.patch.object(
             EncryptedFileProjectKeychain, "global_config_dir", Path(temp_for_global)
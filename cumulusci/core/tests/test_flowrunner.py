@@ -653,6 +653,7 @@ class TestPreflightFlowCoordinatorTest(AbstractFlowCoordinatorTest):
         # Make sure task result got cached
         key = ("log", (("level", "info"), ("line", "plan")))
         assert key in flow._task_caches[flow.project_config].results
+        assert flow.connection_pool is None
 
     def test_run__cross_project_preflights(self):
         other_project_config = mock.MagicMock()
@@ -1,11 +1,16 @@
-from simple_salesforce.exceptions import SalesforceResourceNotFound
+from itertools import groupby
 
 from cumulusci.core.template_utils import format_str
 from cumulusci.robotframework.base_library import BaseLibrary
+from cumulusci.utils.iterators import iterate_in_chunks
 
 # https://developer.salesforce.com/docs/atlas.en-us.api_rest.meta/api_rest/resources_composite_sobjects_collections_create.htm
 SF_COLLECTION_INSERTION_LIMIT = 200
+# https://developer.salesforce.com/docs/atlas.en-us.api_rest.meta/api_rest/resources_composite_sobjects_collections_delete.htm
+SF_COLLECTION_DELETION_LIMIT = 200
 STATUS_KEY = ("status",)
+# Errors meaning that a record is already gone, e.g. by a cascading delete
+ALREADY_DELETED_ERRORS = ("ENTITY_IS_DELETED", "INVALID_CROSS_REFERENCE_KEY")
 
 
 class SalesforceAPI(BaseLibrary):
@@ -20,21 +25,70 @@ class SalesforceAPI(BaseLibrary):
 
         (Only records specifically recorded using the Store Session Record
         keyword are deleted.)
+
+        Records are deleted in the reverse of the order they were created
+        in, so that child records are deleted before their parents.
+        Consecutive records of the same type are deleted up to 200 at a
+        time with the sObject Collections API. Records that could not be
+        deleted are logged and kept in the session records.
         """
-        self._session_records.reverse()
         self.builtin.log("Deleting {} records".format(len(self._session_records)))
-        for record in self._session_records[:]:
-            self.builtin.log("  Deleting {type} {id}".format(**record))
-            try:
-                self.salesforce_delete(record["type"], record["id"])
-            except SalesforceResourceNotFound:
-                self.builtin.log("    {type} {id} is already deleted".format(**record))
-            except Exception as e:
+        deleted = set()
+        for obj_type, ids in self._session_records_by_type():
+            for batch in iterate_in_chunks(SF_COLLECTION_DELETION_LIMIT, ids):
+                deleted.update(
+                    (obj_type, obj_id)
+                    for obj_id in self._salesforce_collection_delete(obj_type, batch)
+                )
+        self._session_records = [
+            record
+            for record in self._session_records
+            if (record["type"], record["id"]) not in deleted
+        ]
+
+    def _session_records_by_type(self):
+        """Group the Ids of runs of session records with the same type,
+        newest first"""
+        return [
+            (obj_type, [record["id"] for record in records])
+            for obj_type, records in groupby(
+                reversed(self._session_records), key=lambda record: record["type"]
+            )
+        ]
+
+    def _salesforce_collection_delete(self, obj_type, ids):
+        """Delete records and return the Ids of the ones that are gone"""
+        self.builtin.log("  Deleting {} {} records".format(len(ids), obj_type))
+        try:
+            results = self.cumulusci.sf.restful(
+                "composite/sobjects",
+                method="DELETE",
+                params={"ids": ",".join(ids), "allOrNone": "false"},
+            )
+        except Exception as e:
+            self.builtin.log(
+                "    {} records could not be deleted:".format(obj_type), level="WARN"
+            )
+            self.builtin.log("      {}".format(e), level="WARN")
+            return []
+
+        gone = []
+        for obj_id, result in zip(ids, results):
+            errors = result.get("errors") or []
+            if result["success"]:
+                gone.append(obj_id)
+            elif all(error["statusCode"] in ALREADY_DELETED_ERRORS for error in errors):
+                self.builtin.log(f"    {obj_type} {obj_id} is already deleted")
+                gone.append(obj_id)
+            else:
                 self.builtin.log(
-                    "    {type} {id} could not be deleted:".format(**record),
-                    level="WARN",
+                    f"    {obj_type} {obj_id} could not be deleted:", level="WARN"
                 )
-                self.builtin.log("      {}".format(e), level="WARN")
+                for error in errors:
+                    self.builtin.log(
+                        "      {statusCode}: {message}".format(**error), level="WARN"
+                    )
+        return gone
 
     def get_latest_api_version(self):
         """Return the API version used by the current org"""
@@ -193,7 +247,8 @@ class SalesforceAPI(BaseLibrary):
         _objects_ is a list of data, typically generated by the
         *Generate Test Data* keyword.
 
-        A 200 record limit is enforced by the Salesforce APIs.
+        A 200 record limit is enforced by the Salesforce APIs. Use
+        *Salesforce Collection Insert All* for more records.
 
         The object name and Id is passed to the *Store Session
         Record* keyword, and will be deleted when the keyword *Delete
@@ -242,7 +297,8 @@ class SalesforceAPI(BaseLibrary):
         _objects_ is a dictionary of data in the format returned
         by the *Salesforce Collection Insert* keyword.
 
-        A 200 record limit is enforced by the Salesforce APIs.
+        A 200 record limit is enforced by the Salesforce APIs. Use
+        *Salesforce Collection Update All* for more records.
 
         Example:
 
@@ -287,6 +343,50 @@ class SalesforceAPI(BaseLibrary):
                     "Error on Object {idx}: {record} : {obj}".format(**vars())
                 )
 
+    def salesforce_collection_insert_all(self, objects):
+        """Inserts any number of records that were created with *Generate Test Data*.
+
+        This works like *Salesforce Collection Insert*, but sends the
+        records 200 at a time so it is not limited to 200 records. Each
+        batch is saved on its own: if a batch fails, the batches before
+        it stay inserted (and are deleted by *Delete Session Records*).
+
+        Example:
+
+        | @{objects}=  Generate Test Data  Contact  1000
+        | ...  FirstName=User {{number}}
+        | ...  LastName={{fake.last_name}}
+        | Salesforce Collection Insert All  ${objects}
+
+        """
+        for batch in iterate_in_chunks(SF_COLLECTION_INSERTION_LIMIT, objects):
+            self.salesforce_collection_insert(list(batch))
+        return objects
+
+    def salesforce_collection_update_all(self, objects):
+        """Updates any number of records described as Robot/Python dictionaries.
+
+        This works like *Salesforce Collection Update*, but sends the
+        records 200 at a time so it is not limited to 200 records. Each
+        batch is saved on its own: if a batch fails, the batches before
+        it stay updated.
+
+        Example:
+
+        | ${data}=  Generate Test Data  Account  1000
+        | ...  Name=Account #{{number}}
+        | ...  Rating=Cold
+        | ${accounts}=  Salesforce Collection Insert All  ${data}
+        |
+        | FOR  ${account}  IN  @{accounts}
+        |     Set to dictionary  ${account}  Rating  Hot
+        | END
+        | Salesforce Collection Update All  ${accounts}
+
+        """
+        for batch in iterate_in_chunks(SF_COLLECTION_INSERTION_LIMIT, objects):
+            self.salesforce_collection_update(list(batch))
+
     def salesforce_query(self, obj_name, **kwargs):
         """Constructs and runs a simple SOQL query and returns a list of dictionaries.
 
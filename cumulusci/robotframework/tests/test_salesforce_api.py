@@ -0,0 +1,145 @@
+from unittest import mock
+
+import pytest
+
+from cumulusci.robotframework.SalesforceAPI import SalesforceAPI
+
+
+@pytest.fixture
+def sfapi():
+    with mock.patch.object(SalesforceAPI, "cumulusci"), mock.patch.object(
+        SalesforceAPI, "builtin"
+    ):
+        yield SalesforceAPI()
+
+
+def delete_results(params, errors=None):
+    errors = errors or {}
+    return [
+        {
+            "id": None if obj_id in errors else obj_id,
+            "success": obj_id not in errors,
+            "errors": [
+                {"statusCode": errors[obj_id], "message": "Oops"}
+                for _ in range(obj_id in errors)
+            ],
+        }
+        for obj_id in params["ids"].split(",")
+    ]
+
+
+class TestKeyword_delete_session_records:
+    def test_delete_session_records__batches_by_type(self, sfapi):
+        for i in range(3):
+            sfapi.store_session_record("Account", f"001{i}")
+        for i in range(250):
+            sfapi.store_session_record("Contact", f"003{i}")
+        sfapi.cumulusci.sf.restful.side_effect = lambda path, params, method: (
+            delete_results(params)
+        )
+
+        sfapi.delete_session_records()
+
+        calls = sfapi.cumulusci.sf.restful.mock_calls
+        assert len(calls) == 3
+        batches = [call.kwargs["params"]["ids"].split(",") for call in calls]
+        # newest type first, newest records first
+        assert batches[0] == [f"003{i}" for i in reversed(range(50, 250))]
+        assert batches[1] == [f"003{i}" for i in reversed(range(50))]
+        assert batches[2] == ["0012", "0011", "0010"]
+        assert calls[0].kwargs["method"] == "DELETE"
+        assert calls[0].kwargs["params"]["allOrNone"] == "false"
+        assert sfapi._session_records == []
+
+    def test_delete_session_records__interleaved_types(self, sfapi):
+        sfapi.store_session_record("Account", "0010")
+        sfapi.store_session_record("Contact", "0030")
+        sfapi.store_session_record("Account", "0011")
+        sfapi.store_session_record("Account", "0012")
+        sfapi.cumulusci.sf.restful.side_effect = lambda path, params, method: (
+            delete_results(params)
+        )
+
+        sfapi.delete_session_records()
+
+        # the child is deleted before the parent created before it
+        batches = [
+            call.kwargs["params"]["ids"]
+            for call in sfapi.cumulusci.sf.restful.mock_calls
+        ]
+        assert batches == ["0012,0011", "0030", "0010"]
+        assert sfapi._session_records == []
+
+    def test_delete_session_records__errors(self, sfapi):
+        sfapi.store_session_record("Account", "0010")
+        sfapi.store_session_record("Contact", "0030")
+        sfapi.store_session_record("Contact", "0031")
+        sfapi.cumulusci.sf.restful.side_effect = lambda path, params, method: (
+            delete_results(
+                params,
+                {"0030": "ENTITY_IS_DELETED", "0010": "DELETE_FAILED"},
+            )
+        )
+
+        sfapi.delete_session_records()
+
+        assert sfapi._session_records == [{"type": "Account", "id": "0010"}]
+        sfapi.builtin.log.assert_any_call("    Contact 0030 is already deleted")
+        sfapi.builtin.log.assert_any_call(
+            "    Account 0010 could not be deleted:", level="WARN"
+        )
+        sfapi.builtin.log.assert_any_call("      DELETE_FAILED: Oops", level="WARN")
+
+    def test_delete_session_records__request_fails(self, sfapi):
+        sfapi.store_session_record("Account", "0010")
+        sfapi.store_session_record("Contact", "0030")
+        sfapi.cumulusci.sf.restful.side_effect = [
+            Exception("Server error"),
+            delete_results({"ids": "0010"}),
+        ]
+
+        sfapi.delete_session_records()
+
+        assert sfapi._session_records == [{"type": "Contact", "id": "0030"}]
+        sfapi.builtin.log.assert_any_call(
+            "    Contact records could not be deleted:", level="WARN"
+        )
+
+
+class TestKeyword_salesforce_collection_all:
+    def test_salesforce_collection_insert_all(self, sfapi):
+        objects = sfapi.generate_test_data("Contact", 450, LastName="User {{number}}")
+        sfapi.cumulusci.sf.restful.side_effect = lambda path, method, json: [
+            {"id": obj["LastName"], "success": True, "errors": []}
+            for obj in json["records"]
+        ]
+
+        result = sfapi.salesforce_collection_insert_all(objects)
+
+        sizes = [
+            len(call.kwargs["json"]["records"])
+            for call in sfapi.cumulusci.sf.restful.mock_calls
+        ]
+        assert sizes == [200, 200, 50]
+        assert result[449]["id"] == "User 449"
+        assert len(sfapi._session_records) == 450
+
+    def test_salesforce_collection_update_all(self, sfapi):
+        objects = [{"id": f"003{i}", "LastName": "User"} for i in range(201)]
+        sfapi.cumulusci.sf.restful.return_value = [{"success": True, "errors": []}]
+
+        sfapi.salesforce_collection_update_all(objects)
+
+        calls = sfapi.cumulusci.sf.restful.mock_calls
+        assert [call.kwargs["method"] for call in calls] == ["PATCH", "PATCH"]
+        assert calls[1].kwargs["json"]["records"] == [objects[200]]
+
+    def test_salesforce_collection_insert_all__error(self, sfapi):
+        objects = sfapi.generate_test_data("Contact", 2, LastName="User")
+        sfapi.cumulusci.sf.restful.return_value = [
+            {"id": None, "success": False, "errors": ["Bad"]},
+            {"id": None, "success": False, "errors": []},
+        ]
+
+        with pytest.raises(AssertionError, match="Error on Object 0"):
+            sfapi.salesforce_collection_insert_all(objects)
@@ -237,6 +237,7 @@ def install_package_by_version_id(
         ),
         **retry_options,
     )
+    org_config.reset_installed_packages()
 
 
 def install_package_by_namespace_version(
@@ -263,3 +264,4 @@ def install_package_by_namespace_version(
         ),
         **retry_options,
     )
+    org_config.reset_installed_packages()
@@ -4,7 +4,10 @@ from unittest.mock import Mock, patch
 from cumulusci import __version__
 from cumulusci.core.config import OrgConfig
 from cumulusci.core.exceptions import ServiceNotConfigured
-from cumulusci.salesforce_api.utils import get_simple_salesforce_connection
+from cumulusci.salesforce_api.utils import (
+    OrgConnectionPool,
+    get_simple_salesforce_connection,
+)
 
 
 def test_connection():
@@ -107,3 +110,72 @@ def test_sf_api_retries(mock_http_response):
             pass
 
         assert 2 == _make_request.call_count
+
+
+def _get_pool_configs():
+    org_config = OrgConfig(
+        {
+            "instance_url": "https://orgname.my.salesforce.com",
+            "access_token": "BOGUS",
+        },
+        "test",
+    )
+    proj_config = Mock()
+    proj_config.keychain.get_service.side_effect = ServiceNotConfigured
+    proj_config.project__package__api_version = "51.0"
+    return org_config, proj_config
+
+
+def test_connection_pool__shares_clients():
+    org_config, proj_config = _get_pool_configs()
+    pool = OrgConnectionPool(org_config, pool_maxsize=5)
+
+    sf = pool.get_connection(proj_config)
+    tooling = pool.get_connection(proj_config, base_url="tooling")
+    assert pool.get_connection(proj_config) is sf
+    assert pool.get_connection(proj_config, api_version="51.0") is sf
+    assert pool.get_connection(proj_config, base_url="tooling") is tooling
+    assert tooling.base_url.endswith("/v51.0/tooling/")
+    assert pool.get_connection(proj_config, api_version="50.0") is not sf
+
+    assert sf.session is pool.session
+    assert tooling.session is pool.session
+    adapter = pool.session.get_adapter("https://")
+    assert adapter._pool_maxsize == 5
+    assert 502 in adapter.max_retries.status_forcelist
+
+
+def test_connection_pool__new_token():
+    org_config, proj_config = _get_pool_configs()
+    pool = OrgConnectionPool(org_config)
+    sf = pool.get_connection(proj_config)
+    bulk = pool.get_bulk_connection("51.0")
+
+    org_config.config["access_token"] = "NEW"
+
+    new_sf = pool.get_connection(proj_config)
+    assert new_sf is not sf
+    assert new_sf.headers["Authorization"] == "Bearer NEW"
+    assert pool.get_bulk_connection("51.0") is not bulk
+
+
+def test_connection_pool__bulk():
+    org_config, proj_config = _get_pool_configs()
+    pool = OrgConnectionPool(org_config)
+
+    bulk = pool.get_bulk_connection("51.0")
+    assert pool.get_bulk_connection("51.0") is bulk
+    assert bulk.sessionId == "BOGUS"
+    assert bulk.endpoint == "https://orgname.my.salesforce.com/services/async/51.0"
+
+
+def test_connection_pool__close():
+    org_config, proj_config = _get_pool_configs()
+    pool = OrgConnectionPool(org_config)
+    sf = pool.get_connection(proj_config)
+
+    with patch.object(pool.session, "close") as close:
+        pool.close()
+
+    close.assert_called_once_with()
+    assert pool.get_connection(proj_config) is not sf
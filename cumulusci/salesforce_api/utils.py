@@ -1,22 +1,42 @@
+import threading
+from typing import Dict, Optional, Tuple
 from urllib.parse import urlparse
 
+import requests
 import simple_salesforce
 from requests.adapters import HTTPAdapter
 from requests.packages.urllib3.util.retry import Retry
+from salesforce_bulk import SalesforceBulk
 
 from cumulusci import __version__
 from cumulusci.core.exceptions import ServiceNotConfigured, ServiceNotValid
 
 CALL_OPTS_HEADER_KEY = "Sforce-Call-Options"
 
+# Number of keep-alive connections per host kept by a shared session,
+# enough for tasks that issue requests from several threads.
+POOLED_CONNECTIONS = 20
 
-def get_simple_salesforce_connection(
-    project_config, org_config, api_version=None, base_url: str = None
-):
 
+def _get_retry_adapter(pool_maxsize: int = None) -> HTTPAdapter:
     # Retry on long-running metadeploy jobs
     retries = Retry(total=5, status_forcelist=(502, 503, 504), backoff_factor=0.3)
-    adapter = HTTPAdapter(max_retries=retries)
+    if pool_maxsize:
+        return HTTPAdapter(max_retries=retries, pool_maxsize=pool_maxsize)
+    return HTTPAdapter(max_retries=retries)
+
+
+def get_simple_salesforce_connection(
+    project_config,
+    org_config,
+    api_version=None,
+    base_url: str = None,
+    session: Optional[requests.Session] = None,
+):
+    """Return a simple_salesforce.Salesforce instance for the org.
+
+    If `session` is passed, it is used (and not modified) in place of a new
+    requests.Session, so that connections can be reused across clients."""
     instance = org_config.instance_url
 
     # Attempt to get the host and port from the URL
@@ -31,6 +51,7 @@ def get_simple_salesforce_connection(
         instance=instance,
         session_id=org_config.access_token,
         version=api_version or project_config.project__package__api_version,
+        session=session,
     )
     try:
         app = project_config.keychain.get_service("connectedapp")
@@ -39,8 +60,10 @@ def get_simple_salesforce_connection(
         client_name = "CumulusCI/{}".format(__version__)
 
     sf.headers.setdefault(CALL_OPTS_HEADER_KEY, "client={}".format(client_name))
-    sf.session.mount("http://", adapter)
-    sf.session.mount("https://", adapter)
+    if session is None:
+        adapter = _get_retry_adapter()
+        sf.session.mount("http://", adapter)
+        sf.session.mount("https://", adapter)
 
     if base_url:
         base_url = (
@@ -49,3 +72,65 @@ def get_simple_salesforce_connection(
         sf.base_url += base_url
 
     return sf
+
+
+class OrgConnectionPool:
+    """Shares API clients for one org among the tasks of a flow.
+
+    All REST and Tooling API clients use a single requests.Session,
+    so TLS connections are kept alive from one task to the next.
+    Clients are cached by API version and base url, which also lets
+    describes cached per client (see `mapping_parser.describe_data`)
+    be reused by later tasks. Metadata API tasks clear that cache,
+    since they can change the schema."""
+
+    def __init__(self, org_config, pool_maxsize: int = POOLED_CONNECTIONS):
+        self.org_config = org_config
+        self.session = requests.Session()
+        adapter = _get_retry_adapter(pool_maxsize)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self._connections: Dict[Tuple, simple_salesforce.Salesforce] = {}
+        self._bulk_connections: Dict[Tuple, SalesforceBulk] = {}
+        self._lock = threading.Lock()
+
+    def get_connection(
+        self, project_config, api_version: str = None, base_url: str = None
+    ) -> simple_salesforce.Salesforce:
+        version = api_version or project_config.project__package__api_version
+        # The token is part of the key in case it was refreshed mid-flow.
+        key = (
+            self.org_config.instance_url,
+            self.org_config.access_token,
+            version,
+            base_url,
+        )
+        with self._lock:
+            if key not in self._connections:
+                self._connections[key] = get_simple_salesforce_connection(
+                    project_config,
+                    self.org_config,
+                    api_version=version,
+                    base_url=base_url,
+                    session=self.session,
+                )
+            return self._connections[key]
+
+    def get_bulk_connection(self, api_version: str) -> SalesforceBulk:
+        key = (self.org_config.instance_url, self.org_config.access_token, api_version)
+        with self._lock:
+            if key not in self._bulk_connections:
+                self._bulk_connections[key] = SalesforceBulk(
+                    host=self.org_config.instance_url.replace("https://", "").rstrip(
+                        "/"
+                    ),
+                    sessionId=self.org_config.access_token,
+                    API_version=api_version,
+                )
+            return self._bulk_connections[key]
+
+    def close(self):
+        with self._lock:
+            self._connections.clear()
+            self._bulk_connections.clear()
+        self.session.close()
@@ -4,7 +4,14 @@ import html
 import io
 import json
 import re
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import PurePosixPath
 
+import sarge
+
+from cumulusci.core.config import TaskConfig
 from cumulusci.core.exceptions import (
     ApexTestException,
     CumulusCIException,
@@ -12,6 +19,7 @@ from cumulusci.core.exceptions import (
 )
 from cumulusci.core.utils import decode_to_unicode, process_bool_arg, process_list_arg
 from cumulusci.tasks.salesforce import BaseSalesforceApiTask
+from cumulusci.utils import parse_api_datetime
 from cumulusci.utils.http.requests_utils import safe_json_from_response
 
 APEX_LIMITS = {
@@ -64,6 +72,26 @@ APEX_LIMITS = {
 }
 
 
+RETRY_STRATEGIES = ("batch", "class", "method")
+
+TEST_IMPACT_MAP_FILENAME = "apex_test_impact.json"
+TEST_DURATIONS_FILENAME = "apex_test_durations.json"
+COMBINED_COVERAGE_QUERY = (
+    "SELECT ApexClassOrTrigger.Name, Coverage FROM ApexCodeCoverageAggregate"
+)
+
+# Options which only apply to the task that coordinates a sharded run
+SHARD_RUNNER_EXCLUDED_OPTIONS = (
+    "shard_orgs",
+    "impacted_by",
+    "impacted_since",
+    "update_test_impact_map",
+    "record_test_durations",
+)
+TEST_IMPACT_COVERAGE_QUERY = (
+    "SELECT ApexTestClass.Name, ApexClassOrTrigger.Name FROM ApexCodeCoverage"
+)
+
 TEST_RESULT_QUERY = """
 SELECT Id,ApexClassId,TestTimestamp,
        Message,MethodName,Outcome,
@@ -77,6 +105,26 @@ FROM ApexTestResult
 WHERE AsyncApexJobId='{}'
 """
 
+# Used by incremental_progress to fetch only the results changed since the last poll
+STREAMED_TEST_RESULT_QUERY = """
+SELECT Id,ApexClassId,TestTimestamp,SystemModstamp,
+       Message,MethodName,Outcome,
+       RunTime,StackTrace,
+       (SELECT
+          Id,Callouts,AsyncCalls,DmlRows,Email,
+          LimitContext,LimitExceptions,MobilePush,
+          QueryRows,Sosl,Cpu,Dml,Soql
+        FROM ApexTestResults)
+FROM ApexTestResult
+WHERE AsyncApexJobId='{}'{}
+ORDER BY SystemModstamp
+"""
+
+QUEUE_ITEM_STATUS_COUNT_QUERY = (
+    "SELECT Status, COUNT(Id) total FROM ApexTestQueueItem "
+    "WHERE ParentJobId = '{}' GROUP BY Status"
+)
+
 
 class RunApexTests(BaseSalesforceApiTask):
     """Task to run Apex tests with the Tooling API and report results.
@@ -86,11 +134,17 @@ class RunApexTests(BaseSalesforceApiTask):
     add ones or more regular expressions to the list option `retry_failures`.
 
     When a test run fails, if all of the failures' error messages or stack traces
-    match one of these regular expressions, each failed test will be retried by
-    itself. This is often useful when running Apex tests in parallel; row locks
+    match one of these regular expressions, the failed tests will be retried.
+    This is often useful when running Apex tests in parallel; row locks
     may automatically be retried. Note that retries are supported whether or not
     the org has parallel Apex testing enabled.
 
+    By default all failed tests are retried together in a single test run.
+    Tests which fail again are split in halves and retried, until each
+    remaining failure has been retried by itself. The ``retry_strategy``
+    option can instead start with one test run per class (``class``) or
+    per test method (``method``).
+
     The ``retry_always`` option modifies this behavior: if a test run fails and
     any (not all) of the failures match the specified regular expressions,
     all of the failed tests will be retried in serial. This is helpful when
@@ -108,10 +162,25 @@ class RunApexTests(BaseSalesforceApiTask):
 
     Some projects' unit tests produce so many concurrency errors that
     it's faster to execute the entire run in serial mode than to use retries.
-    Serial and parallel mode are configured in the scratch org definition file."""
+    Serial and parallel mode are configured in the scratch org definition file.
+
+    The ``impacted_by`` and ``impacted_since`` options run only the test
+    classes which cover the given Apex classes and triggers, or those changed
+    since a git ref. They use a map of which test classes cover which Apex
+    classes, saved in the project's cache directory by a full test run with
+    ``update_test_impact_map``. If the map is missing, invalid or older than
+    ``test_impact_map_max_age`` days, or has no coverage for one of the changed
+    classes, all tests run and the map is saved again.
+
+    With ``shard_orgs``, the test classes are split into one shard per org,
+    balanced using the class durations recorded by earlier runs, and the
+    shards run concurrently. The results are combined into a single report,
+    and code coverage is checked against the lines covered in any of the orgs."""
 
     api_version = "38.0"
     name = "RunApexTests"
+    # The tasks running each shard (including this one) in a sharded run
+    shard_runners = ()
     task_options = {
         "test_name_match": {
             "description": (
@@ -159,6 +228,12 @@ class RunApexTests(BaseSalesforceApiTask):
             "description": "By default, all failures must match retry_failures to perform "
             "a retry. Set retry_always to True to retry all failed tests if any failure matches."
         },
+        "retry_strategy": {
+            "description": "How failed tests are grouped when they are retried: "
+            "batch (all in one test run), class (one test run per class), or method "
+            "(one test run per test method). Tests which fail again in a run with "
+            "other tests are retried in smaller groups. Defaults to batch."
+        },
         "required_org_code_coverage_percent": {
             "description": "Require at least X percent code coverage across the org following the test run.",
             "usage": "--required_org_code_coverage_percent PERCENTAGE",
@@ -173,6 +248,36 @@ class RunApexTests(BaseSalesforceApiTask):
         "test_suite_names": {
             "description": "Accepts a comma-separated list of test suite names. Only runs test classes that are part of the test suites specified."
         },
+        "impacted_by": {
+            "description": "A comma-separated list of Apex class and trigger names. "
+            "Only runs the test classes which cover them, according to the saved test impact map."
+        },
+        "impacted_since": {
+            "description": "A git ref. Only runs the test classes which cover Apex classes "
+            "and triggers changed since this ref, according to the saved test impact map."
+        },
+        "update_test_impact_map": {
+            "description": "If True, a full test run saves which test classes cover "
+            "each Apex class and trigger, for use by impacted_by and impacted_since. Defaults to False."
+        },
+        "shard_orgs": {
+            "description": "A comma-separated list of additional org names from the keychain. "
+            "The test classes are split into shards with similar expected durations, which "
+            "run concurrently in this org and each of these orgs."
+        },
+        "record_test_durations": {
+            "description": "If True, save the duration of each test class for use by "
+            "shard_orgs. Sharded runs always save durations. Defaults to False."
+        },
+        "incremental_progress": {
+            "description": "If True, poll for test progress with an aggregate count of "
+            "test classes by status and fetch test results as the classes complete, "
+            "logging failures while the run is in progress. Defaults to False."
+        },
+        "test_impact_map_max_age": {
+            "description": "Number of days after which the test impact map is ignored, "
+            "all tests are run and the map is saved again. Defaults to 7."
+        },
     }
 
     def _init_options(self, kwargs):
@@ -223,9 +328,38 @@ class RunApexTests(BaseSalesforceApiTask):
         self.options["retry_always"] = process_bool_arg(
             self.options.get("retry_always") or False
         )
+        self.options["retry_strategy"] = self.options.get("retry_strategy") or "batch"
+        if self.options["retry_strategy"] not in RETRY_STRATEGIES:
+            raise TaskOptionsError(
+                f"retry_strategy must be one of {', '.join(RETRY_STRATEGIES)}"
+            )
 
         self.verbose = process_bool_arg(self.options.get("verbose") or False)
 
+        self.options["impacted_by"] = process_list_arg(
+            self.options.get("impacted_by") or []
+        )
+        self.options["shard_orgs"] = process_list_arg(
+            self.options.get("shard_orgs") or []
+        )
+        self.options["record_test_durations"] = process_bool_arg(
+            self.options.get("record_test_durations") or False
+        )
+        self.options["incremental_progress"] = process_bool_arg(
+            self.options.get("incremental_progress") or False
+        )
+        self.options["update_test_impact_map"] = process_bool_arg(
+            self.options.get("update_test_impact_map") or False
+        )
+        try:
+            self.options["test_impact_map_max_age"] = float(
+                self.options.get("test_impact_map_max_age", 7)
+            )
+        except ValueError:
+            raise TaskOptionsError(
+                f"Invalid test_impact_map_max_age {self.options['test_impact_map_max_age']}"
+            )
+
         self.counts = {}
 
         if "required_org_code_coverage_percent" in self.options:
@@ -423,12 +557,18 @@ class RunApexTests(BaseSalesforceApiTask):
             for each_class in test_classes["records"]
         }
 
-        result = self.tooling.query_all(TEST_RESULT_QUERY.format(self.job_id))
+        if self.options["incremental_progress"]:
+            # Pick up anything which changed after the last poll.
+            self._stream_test_results()
+            records = list(self.streamed_results.values())
+        else:
+            result = self.tooling.query_all(TEST_RESULT_QUERY.format(self.job_id))
+            records = result["records"]
 
         if allow_retries:
             self.retry_details = {}
 
-        for test_result in result["records"]:
+        for test_result in records:
             class_name = self.classes_by_id[test_result["ApexClassId"]]
             self.results_by_class_name[class_name][
                 test_result["MethodName"]
@@ -490,6 +630,11 @@ class RunApexTests(BaseSalesforceApiTask):
                             ).append(test_result["MethodName"])
 
     def _process_test_results(self):
+        test_results = self._collect_test_results()
+        self._log_test_summary(test_results)
+        return test_results
+
+    def _collect_test_results(self):
         test_results = []
         class_names = list(self.results_by_class_name.keys())
         class_names.sort()
@@ -500,7 +645,7 @@ class RunApexTests(BaseSalesforceApiTask):
 
             if None in method_names:
                 class_id = self.classes_by_name[class_name]
-                self.retry_details.setdefault(class_id, []).append(
+                self.retry_details.setdefault(class_id, []).extend(
                     self._get_test_methods_for_class(class_name)
                 )
                 del self.results_by_class_name[class_name][None]
@@ -543,6 +688,9 @@ class RunApexTests(BaseSalesforceApiTask):
                     self.logger.info(f"\tStackTrace: {result['StackTrace']}")
                 elif self.verbose:
                     self.logger.info(message)
+        return test_results
+
+    def _log_test_summary(self, test_results):
         self.logger.info("-" * 80)
         self.logger.info(
             "Pass: {}  Retried: {}  Fail: {}  CompileFail: {}  Skip: {}".format(
@@ -573,8 +721,6 @@ class RunApexTests(BaseSalesforceApiTask):
                     self.logger.error(f"\tMessage: {result['Message']}")
                     self.logger.error(f"\tStackTrace: {result['StackTrace']}")
 
-        return test_results
-
     def _get_stats_from_result(self, result):
         stats = {"duration": result["RunTime"]}
 
@@ -617,11 +763,8 @@ class RunApexTests(BaseSalesforceApiTask):
                 bool(namespace) and namespace in self.org_config.installed_packages
             )
 
-    def _run_task(self):
-        result = self._get_test_classes()
-        if result["totalSize"] == 0:
-            return
-        for test_class in result["records"]:
+    def _run_test_classes(self, test_classes):
+        for test_class in test_classes:
             self.classes_by_id[test_class["Id"]] = test_class["Name"]
             self.classes_by_name[test_class["Name"]] = test_class["Id"]
             self.results_by_class_name[test_class["Name"]] = {}
@@ -652,9 +795,151 @@ class RunApexTests(BaseSalesforceApiTask):
         else:
             self._attempt_retries()
 
-        test_results = self._process_test_results()
+    def _run_sharded(self, test_classes):
+        """Run the test classes in shards balanced by their recorded durations,
+        one shard per org, and combine the results."""
+        shards = self._partition_test_classes(
+            [test_class["Name"] for test_class in test_classes],
+            1 + len(self.options["shard_orgs"]),
+        )
+        keychain = self.project_config.keychain
+        self.shard_runners = [self] + [
+            self._get_shard_runner(keychain.get_org(org_name))
+            for org_name in self.options["shard_orgs"][: len(shards) - 1]
+        ]
+        self.logger.info(
+            f"Running {len(test_classes)} test classes in {len(shards)} shards."
+        )
+
+        def run_shard(runner, shard):
+            if runner is self:
+                shard_classes = [c for c in test_classes if c["Name"] in shard]
+            else:
+                # Each org has its own Ids for the test classes.
+                shard_classes = [
+                    c
+                    for c in runner._get_test_classes()["records"]
+                    if c["Name"] in shard
+                ]
+                missing = set(shard) - {c["Name"] for c in shard_classes}
+                if missing:
+                    raise CumulusCIException(
+                        f"Test classes not found in org {runner.org_config.name}: "
+                        + ", ".join(sorted(missing))
+                    )
+            runner._run_test_classes(shard_classes)
+            return runner._collect_test_results()
+
+        with ThreadPoolExecutor(max_workers=len(shards)) as executor:
+            shard_results = list(executor.map(run_shard, self.shard_runners, shards))
+
+        for runner in self.shard_runners[1:]:
+            for outcome, count in runner.counts.items():
+                self.counts[outcome] += count
+            self.results_by_class_name.update(runner.results_by_class_name)
+        self._save_test_durations()
+
+        test_results = sorted(
+            (result for results in shard_results for result in results),
+            key=lambda result: result["ClassName"],
+        )
+        self._log_test_summary(test_results)
+        return test_results
+
+    def _get_shard_runner(self, org_config):
+        options = {
+            name: value
+            for name, value in (self.task_config.options or {}).items()
+            if name not in SHARD_RUNNER_EXCLUDED_OPTIONS
+        }
+        runner = RunApexTests(
+            self.project_config,
+            TaskConfig({"options": options}),
+            org_config,
+            logger=self.logger,
+        )
+        runner._update_credentials()
+        runner._init_task()
+        return runner
+
+    def _partition_test_classes(self, class_names, shard_count):
+        """Split test classes into shards with similar expected durations.
+
+        Classes are placed longest first into the shard with the least
+        expected duration so far. Classes without a recorded duration
+        are assumed to take the average recorded duration."""
+        durations = self._load_test_durations()
+        known = [durations[name] for name in class_names if name in durations]
+        default = sum(known) / len(known) if known else 1
+        expected = {name: durations.get(name, default) for name in class_names}
+
+        shards = [[] for _ in range(min(shard_count, len(class_names)))]
+        totals = [0] * len(shards)
+        for name in sorted(class_names, key=lambda name: (-expected[name], name)):
+            index = totals.index(min(totals))
+            shards[index].append(name)
+            totals[index] += expected[name]
+        return shards
+
+    @property
+    def _test_durations_path(self):
+        return self.project_config.cache_dir / TEST_DURATIONS_FILENAME
+
+    def _load_test_durations(self):
+        path = self._test_durations_path
+        if path.exists():
+            return json.loads(path.read_text())
+        return {}
+
+    def _save_test_durations(self):
+        """Record the total RunTime (in ms) of each test class that ran."""
+        durations = self._load_test_durations()
+        for class_name, results in self.results_by_class_name.items():
+            if results:
+                durations[class_name] = sum(
+                    result["RunTime"] or 0 for result in results.values()
+                )
+        self._test_durations_path.write_text(json.dumps(durations))
+
+    def _run_task(self):
+        result = self._get_test_classes()
+        if result["totalSize"] == 0:
+            return
+        test_classes = result["records"]
+
+        full_run = True
+        if self.options["impacted_by"] or self.options.get("impacted_since"):
+            impacted = self._get_impacted_test_classes(
+                {test_class["Name"] for test_class in test_classes}
+            )
+            if impacted is not None:
+                full_run = False
+                test_classes = [
+                    test_class
+                    for test_class in test_classes
+                    if test_class["Name"] in impacted
+                ]
+                self.logger.info(
+                    f"Running {len(test_classes)} of {result['totalSize']} test classes "
+                    "impacted by the changes."
+                )
+                if not test_classes:
+                    return
+            else:
+                self.options["update_test_impact_map"] = True
+
+        if self.options["shard_orgs"]:
+            test_results = self._run_sharded(test_classes)
+        else:
+            self._run_test_classes(test_classes)
+            test_results = self._process_test_results()
+            if self.options["record_test_durations"]:
+                self._save_test_durations()
         self._write_output(test_results)
 
+        if full_run and self.options["update_test_impact_map"]:
+            self._save_test_impact_map()
+
         if self.counts.get("Fail") or self.counts.get("CompileFail"):
             raise ApexTestException(
                 "{} tests failed and {} tests failed compilation".format(
@@ -674,12 +959,106 @@ class RunApexTests(BaseSalesforceApiTask):
                 "No code coverage level specified; not checking code coverage."
             )
 
+    @property
+    def _test_impact_map_path(self):
+        return self.project_config.cache_dir / TEST_IMPACT_MAP_FILENAME
+
+    def _load_test_impact_map(self):
+        """Returns the saved map of tests by covered class, unless it is missing or stale."""
+        path = self._test_impact_map_path
+        if not path.exists():
+            self.logger.info("No test impact map found; running all tests.")
+            return None
+        try:
+            impact_map = json.loads(path.read_text())
+            age_days = (time.time() - impact_map["timestamp"]) / 86400
+            tests_by_class = impact_map["tests_by_class"]
+        except (ValueError, KeyError, TypeError):
+            self.logger.warning("The test impact map is invalid; running all tests.")
+            return None
+        if not 0 <= age_days < self.options["test_impact_map_max_age"]:
+            self.logger.info("The test impact map is out of date; running all tests.")
+            return None
+        return tests_by_class
+
+    def _save_test_impact_map(self):
+        tests_by_class = {}
+        records = [
+            record
+            for runner in self.shard_runners or [self]
+            for record in runner.tooling.query_all(TEST_IMPACT_COVERAGE_QUERY)[
+                "records"
+            ]
+        ]
+        for record in records:
+            if not record["ApexTestClass"] or not record["ApexClassOrTrigger"]:
+                continue
+            tests = tests_by_class.setdefault(record["ApexClassOrTrigger"]["Name"], [])
+            if record["ApexTestClass"]["Name"] not in tests:
+                tests.append(record["ApexTestClass"]["Name"])
+        self._test_impact_map_path.write_text(
+            json.dumps({"timestamp": time.time(), "tests_by_class": tests_by_class})
+        )
+        self.logger.info(
+            f"Saved test impact map for {len(tests_by_class)} classes and triggers."
+        )
+
+    def _get_changed_apex_names(self):
+        changed = set(self.options["impacted_by"])
+        ref = self.options.get("impacted_since")
+        if ref:
+            p = sarge.Command(
+                sarge.shell_format("git diff --name-only {0!s}", ref),
+                cwd=self.project_config.repo_root,
+                stdout=sarge.Capture(buffer_size=-1),
+                stderr=sarge.Capture(buffer_size=-1),
+                shell=True,
+            )
+            p.run()
+            if p.returncode:
+                raise TaskOptionsError(
+                    f"Unable to list changes since {ref}: {p.stderr.text.strip()}"
+                )
+            for path in p.stdout.text.splitlines():
+                path = PurePosixPath(path.strip())
+                if path.suffix in (".cls", ".trigger"):
+                    changed.add(path.stem)
+        return changed
+
+    def _get_impacted_test_classes(self, test_class_names):
+        """Returns the names of test classes impacted by the changed Apex,
+        or None if all tests should run."""
+        tests_by_class = self._load_test_impact_map()
+        if tests_by_class is None:
+            return None
+
+        impacted = set()
+        for name in sorted(self._get_changed_apex_names()):
+            if name in test_class_names:
+                impacted.add(name)
+            elif name in tests_by_class:
+                impacted.update(tests_by_class[name])
+            else:
+                # e.g. a new class, which no test is known to cover yet
+                self.logger.warning(
+                    f"No test coverage is recorded for {name}; running all tests."
+                )
+                return None
+        return impacted
+
     def _check_code_coverage(self):
         self.logger.info("Checking code coverage.")
         class_level_coverage_failures = {}
 
+        if self.shard_runners:
+            class_coverage, coverage = self._get_combined_coverage()
+            class_level_coverage_failures = {
+                class_name: coverage_percentage
+                for class_name, coverage_percentage in class_coverage.items()
+                if coverage_percentage < self.required_per_class_code_coverage_percent
+            }
         # Query for Class level code coverage using the aggregate
-        if self.required_per_class_code_coverage_percent:
+        elif self.required_per_class_code_coverage_percent:
             test_classes = self.tooling.query(
                 "SELECT ApexClassOrTrigger.Name, ApexClassOrTriggerId, NumLinesCovered, NumLinesUncovered FROM ApexCodeCoverageAggregate ORDER BY ApexClassOrTrigger.Name ASC"
             )["records"]
@@ -703,8 +1082,11 @@ class RunApexTests(BaseSalesforceApiTask):
                     ] = coverage_percentage
 
         # Query for OrgWide coverage
-        result = self.tooling.query("SELECT PercentCovered FROM ApexOrgWideCoverage")
-        coverage = result["records"][0]["PercentCovered"]
+        if not self.shard_runners:
+            result = self.tooling.query(
+                "SELECT PercentCovered FROM ApexOrgWideCoverage"
+            )
+            coverage = result["records"][0]["PercentCovered"]
 
         errors = []
         if self.required_per_class_code_coverage_percent:
@@ -732,6 +1114,32 @@ class RunApexTests(BaseSalesforceApiTask):
             self.logger.info(error_message)
             raise ApexTestException(error_message)
 
+    def _get_combined_coverage(self):
+        """Merge the covered lines recorded in the org of each shard.
+
+        Returns the coverage percentage of each class and trigger,
+        and the overall coverage percentage."""
+        covered = defaultdict(set)
+        uncovered = defaultdict(set)
+        for runner in self.shard_runners:
+            for record in runner.tooling.query_all(COMBINED_COVERAGE_QUERY)["records"]:
+                class_name = record["ApexClassOrTrigger"]["Name"]
+                covered[class_name].update(record["Coverage"]["coveredLines"])
+                uncovered[class_name].update(record["Coverage"]["uncoveredLines"])
+
+        class_coverage = {}
+        total_covered = total_lines = 0
+        for class_name in sorted(set(covered) | set(uncovered)):
+            lines = covered[class_name] | uncovered[class_name]
+            if lines:
+                class_coverage[class_name] = round(
+                    len(covered[class_name]) / len(lines) * 100, 2
+                )
+                total_covered += len(covered[class_name])
+                total_lines += len(lines)
+        coverage = round(total_covered / total_lines * 100, 2) if total_lines else 0
+        return class_coverage, coverage
+
     def _attempt_retries(self):
         total_method_retries = sum(
             [len(test_list) for test_list in self.retry_details.values()]
@@ -743,30 +1151,69 @@ class RunApexTests(BaseSalesforceApiTask):
         )
         self.counts["Fail"] = 0
 
-        for class_id, test_list in self.retry_details.items():
-            for each_test in test_list:
-                self.logger.warning(
-                    "Retrying {}.{}".format(self.classes_by_id[class_id], each_test)
-                )
-                self.job_id = self._enqueue_test_run({class_id: [each_test]})
+        batches = self._get_retry_batches()
+        while batches:
+            next_batches = []
+            for batch in batches:
+                if len(batch) == 1:
+                    class_id, method_name = batch[0]
+                    self.logger.warning(
+                        f"Retrying {self.classes_by_id[class_id]}.{method_name}"
+                    )
+                else:
+                    self.logger.warning(f"Retrying {len(batch)} methods together")
+                failures_before = self.counts["Fail"]
+                self.job_id = self._enqueue_test_run(self._get_retry_run(batch))
                 self._wait_for_tests()
                 self._get_test_results(allow_retries=False)
 
+                failed = [test for test in batch if self._is_failed_retry(*test)]
+                if failed and len(batch) > 1:
+                    # Only a failure when retried by itself counts.
+                    self.counts["Fail"] = failures_before
+                    middle = (len(failed) + 1) // 2
+                    next_batches.extend(
+                        part for part in (failed[:middle], failed[middle:]) if part
+                    )
+            batches = next_batches
+
         # If the retry failed, report the remaining failures.
         if self.counts["Fail"]:
             self.logger.error("Test retry failed.")
 
+    def _get_retry_batches(self):
+        """Partition the tests in retry_details according to retry_strategy."""
+        tests_by_class = [
+            [(class_id, method_name) for method_name in method_names]
+            for class_id, method_names in self.retry_details.items()
+        ]
+        strategy = self.options["retry_strategy"]
+        if strategy == "class":
+            return [tests for tests in tests_by_class if tests]
+        all_tests = [test for tests in tests_by_class for test in tests]
+        if strategy == "method":
+            return [[test] for test in all_tests]
+        return [all_tests] if all_tests else []
+
+    def _get_retry_run(self, batch):
+        run = {}
+        for class_id, method_name in batch:
+            run.setdefault(class_id, []).append(method_name)
+        return run
+
+    def _is_failed_retry(self, class_id, method_name):
+        class_results = self.results_by_class_name[self.classes_by_id[class_id]]
+        return class_results.get(method_name, {}).get("Outcome") == "Fail"
+
     def _wait_for_tests(self):
         self.poll_complete = False
         self.poll_interval_s = int(self.options.get("poll_interval", 1))
         self.poll_count = 0
+        self.streamed_results = {}
+        self.last_result_modstamp = None
         self._poll()
 
     def _poll_action(self):
-        self.result = self.tooling.query_all(
-            "SELECT Id, Status, ApexClassId FROM ApexTestQueueItem "
-            + "WHERE ParentJobId = '{}'".format(self.job_id)
-        )
         counts = {
             "Aborted": 0,
             "Completed": 0,
@@ -776,15 +1223,28 @@ class RunApexTests(BaseSalesforceApiTask):
             "Processing": 0,
             "Queued": 0,
         }
-        processing_class_id = None
-        total_test_count = self.result["totalSize"]
-        for test_queue_item in self.result["records"]:
-            counts[test_queue_item["Status"]] += 1
-            if test_queue_item["Status"] == "Processing":
-                processing_class_id = test_queue_item["ApexClassId"]
         processing_class = ""
-        if counts["Processing"] == 1:
-            processing_class = f" ({self.classes_by_id[processing_class_id]})"
+        if self.options["incremental_progress"]:
+            # One row per status instead of one row per test class
+            self.result = self.tooling.query_all(
+                QUEUE_ITEM_STATUS_COUNT_QUERY.format(self.job_id)
+            )
+            for status_count in self.result["records"]:
+                counts[status_count["Status"]] += status_count["total"]
+            total_test_count = sum(counts.values())
+        else:
+            self.result = self.tooling.query_all(
+                "SELECT Id, Status, ApexClassId FROM ApexTestQueueItem "
+                + "WHERE ParentJobId = '{}'".format(self.job_id)
+            )
+            processing_class_id = None
+            total_test_count = self.result["totalSize"]
+            for test_queue_item in self.result["records"]:
+                counts[test_queue_item["Status"]] += 1
+                if test_queue_item["Status"] == "Processing":
+                    processing_class_id = test_queue_item["ApexClassId"]
+            if counts["Processing"] == 1:
+                processing_class = f" ({self.classes_by_id[processing_class_id]})"
         self.logger.info(
             "Completed: {}  Processing: {}{}  Queued: {}".format(
                 counts["Completed"],
@@ -799,6 +1259,36 @@ class RunApexTests(BaseSalesforceApiTask):
         ):
             self.logger.info("Apex tests completed")
             self.poll_complete = True
+        elif self.options["incremental_progress"]:
+            self._stream_test_results()
+
+    def _stream_test_results(self):
+        """Fetch the test results which changed since the last call,
+        and log new failures."""
+        modstamp_filter = ""
+        if self.last_result_modstamp:
+            # SOQL datetimes have second precision, so results in the same
+            # second as the last one seen are fetched again and deduplicated by Id.
+            modstamp_filter = " AND SystemModstamp >= {}".format(
+                self.last_result_modstamp.strftime("%Y-%m-%dT%H:%M:%SZ")
+            )
+        result = self.tooling.query_all(
+            STREAMED_TEST_RESULT_QUERY.format(self.job_id, modstamp_filter)
+        )
+        for test_result in result["records"]:
+            modstamp = parse_api_datetime(test_result["SystemModstamp"])
+            if (
+                self.last_result_modstamp is None
+                or modstamp > self.last_result_modstamp
+            ):
+                self.last_result_modstamp = modstamp
+            is_new = test_result["Id"] not in self.streamed_results
+            self.streamed_results[test_result["Id"]] = test_result
+            if is_new and test_result["Outcome"] in ("Fail", "CompileFail"):
+                class_name = self.classes_by_id[test_result["ApexClassId"]]
+                self.logger.error(
+                    f"Failed: {class_name}.{test_result['MethodName']}: {test_result['Message']}"
+                )
 
     def _write_output(self, test_results):
         junit_output = self.options["junit_output"]
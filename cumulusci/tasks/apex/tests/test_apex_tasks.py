@@ -1,8 +1,11 @@
+import datetime
 import http.client
+import json
 import logging
 import os
 import shutil
 import tempfile
+import time
 from copy import deepcopy
 from unittest.mock import MagicMock, Mock, patch
 
@@ -498,6 +501,491 @@ class TestRunApexTests(MockLoggerMixin):
         with pytest.raises(ApexTestException):
             task()
 
+    @responses.activate
+    def test_run_task__retry_tests_batched(self):
+        self._mock_apex_class_query()
+        for job_id in ("JOB_ID1234567", "JOBID_9999", "JOBID_9990", "JOBID_9991"):
+            self._mock_run_tests(body=job_id)
+            self._mock_get_failed_test_classes(job_id=job_id)
+            self._mock_tests_complete(job_id=job_id)
+        self._mock_get_test_results_multiple(
+            ["TestOne", "TestTwo", "TestThree"],
+            ["Fail", "Fail", "Fail"],
+            ["UNABLE_TO_LOCK_ROW"] * 3,
+        )
+        self._mock_get_test_results_multiple(
+            ["TestOne", "TestTwo", "TestThree"],
+            ["Pass", "Fail", "Fail"],
+            ["", "UNABLE_TO_LOCK_ROW", "UNABLE_TO_LOCK_ROW"],
+            job_id="JOBID_9999",
+        )
+        self._mock_get_test_results_multiple(
+            ["TestTwo"], ["Pass"], [""], job_id="JOBID_9990"
+        )
+        self._mock_get_test_results_multiple(
+            ["TestThree"], ["Pass"], [""], job_id="JOBID_9991"
+        )
+
+        task_config = TaskConfig()
+        task_config.config["options"] = {
+            "junit_output": "results_junit.xml",
+            "poll_interval": 1,
+            "test_name_match": "%_TEST",
+            "retry_failures": ["UNABLE_TO_LOCK_ROW"],
+        }
+        task = RunApexTests(self.project_config, task_config, self.org_config)
+        task()
+
+        run_bodies = [
+            json.loads(call.request.body)
+            for call in responses.calls
+            if call.request.url.endswith("runTestsAsynchronous")
+        ]
+        assert run_bodies == [
+            {"classids": "1"},
+            {
+                "tests": [
+                    {
+                        "classId": 1,
+                        "testMethods": ["TestOne", "TestTwo", "TestThree"],
+                    }
+                ]
+            },
+            {"tests": [{"classId": 1, "testMethods": ["TestTwo"]}]},
+            {"tests": [{"classId": 1, "testMethods": ["TestThree"]}]},
+        ]
+        assert task.counts["Fail"] == 0
+        assert task.counts["Pass"] == 3
+
+    @responses.activate
+    def test_run_task__retry_tests_batched_fails(self):
+        self._mock_apex_class_query()
+        for job_id in ("JOB_ID1234567", "JOBID_9999", "JOBID_9990", "JOBID_9991"):
+            self._mock_run_tests(body=job_id)
+            self._mock_get_failed_test_classes(job_id=job_id)
+            self._mock_tests_complete(job_id=job_id)
+        self._mock_get_test_results_multiple(
+            ["TestOne", "TestTwo"], ["Fail", "Fail"], ["UNABLE_TO_LOCK_ROW"] * 2
+        )
+        self._mock_get_test_results_multiple(
+            ["TestOne", "TestTwo"],
+            ["Fail", "Fail"],
+            ["UNABLE_TO_LOCK_ROW"] * 2,
+            job_id="JOBID_9999",
+        )
+        self._mock_get_test_results_multiple(
+            ["TestOne"], ["Pass"], [""], job_id="JOBID_9990"
+        )
+        self._mock_get_test_results_multiple(
+            ["TestTwo"], ["Fail"], ["LimitException"], job_id="JOBID_9991"
+        )
+
+        task_config = TaskConfig()
+        task_config.config["options"] = {
+            "junit_output": "results_junit.xml",
+            "poll_interval": 1,
+            "test_name_match": "%_TEST",
+            "retry_failures": ["UNABLE_TO_LOCK_ROW"],
+        }
+        task = RunApexTests(self.project_config, task_config, self.org_config)
+        with pytest.raises(ApexTestException, match="1 tests failed"):
+            task()
+        assert "Test retry failed." in self.task_log["error"]
+
+    def test_get_retry_batches(self):
+        task = RunApexTests(self.project_config, self.task_config, self.org_config)
+        task.retry_details = {"1": ["a", "b"], "2": ["c"]}
+
+        assert task._get_retry_batches() == [[("1", "a"), ("1", "b"), ("2", "c")]]
+        task.options["retry_strategy"] = "class"
+        assert task._get_retry_batches() == [[("1", "a"), ("1", "b")], [("2", "c")]]
+        task.options["retry_strategy"] = "method"
+        assert task._get_retry_batches() == [[("1", "a")], [("1", "b")], [("2", "c")]]
+
+    def test_init_options__bad_retry_strategy(self):
+        task_config = TaskConfig()
+        task_config.config["options"] = {
+            "test_name_match": "%_TEST",
+            "retry_strategy": "random",
+        }
+        with pytest.raises(TaskOptionsError, match="retry_strategy"):
+            RunApexTests(self.project_config, task_config, self.org_config)
+
+    def _get_impact_task(self, cache_dir, **options):
+        self.project_config._cache_dir = cache_dir
+        task_config = TaskConfig()
+        task_config.config["options"] = {
+            "junit_output": "results_junit.xml",
+            "poll_interval": 1,
+            "test_name_match": "%_TEST",
+            **options,
+        }
+        return RunApexTests(self.project_config, task_config, self.org_config)
+
+    def _mock_coverage_query(self):
+        responses.add(
+            responses.GET,
+            self.base_tooling_url + "query/",
+            json={
+                "done": True,
+                "totalSize": 3,
+                "records": [
+                    {
+                        "ApexTestClass": {"Name": "TestClass_TEST"},
+                        "ApexClassOrTrigger": {"Name": "Foo"},
+                    },
+                    {
+                        "ApexTestClass": {"Name": "TestClass_TEST"},
+                        "ApexClassOrTrigger": {"Name": "Foo"},
+                    },
+                    {"ApexTestClass": None, "ApexClassOrTrigger": {"Name": "Bar"}},
+                ],
+            },
+        )
+
+    def _write_impact_map(self, cache_dir, timestamp=None):
+        (cache_dir / "apex_test_impact.json").write_text(
+            json.dumps(
+                {
+                    "timestamp": timestamp or time.time(),
+                    "tests_by_class": {"Foo": ["TestClass_TEST"]},
+                }
+            )
+        )
+
+    @responses.activate
+    def test_run_task__update_test_impact_map(self, tmp_path):
+        self._mock_apex_class_query()
+        self._mock_run_tests()
+        self._mock_get_failed_test_classes()
+        self._mock_tests_complete()
+        self._mock_get_test_results()
+        self._mock_coverage_query()
+
+        task = self._get_impact_task(tmp_path, update_test_impact_map=True)
+        task()
+
+        impact_map = json.loads((tmp_path / "apex_test_impact.json").read_text())
+        assert impact_map["tests_by_class"] == {"Foo": ["TestClass_TEST"]}
+
+    @responses.activate
+    def test_run_task__impacted_by(self, tmp_path):
+        self._write_impact_map(tmp_path)
+        self._mock_apex_class_query()
+        self._mock_run_tests()
+        self._mock_get_failed_test_classes()
+        self._mock_tests_complete()
+        self._mock_get_test_results()
+
+        task = self._get_impact_task(tmp_path, impacted_by="Foo")
+        task()
+
+        assert task.counts["Pass"] == 1
+        assert len(responses.calls) == 5
+        assert (
+            "Running 1 of 1 test classes impacted by the changes."
+            in self.task_log["info"]
+        )
+
+    @responses.activate
+    def test_run_task__impacted_by__no_tests(self, tmp_path):
+        self._write_impact_map(tmp_path)
+        self._mock_apex_class_query()
+        self._mock_run_tests()
+        self._mock_get_failed_test_classes()
+        self._mock_tests_complete()
+        self._mock_get_test_results()
+        self._mock_coverage_query()
+
+        task = self._get_impact_task(tmp_path, impacted_by="Foo,Bar")
+        task()
+
+        assert task.counts["Pass"] == 1
+        assert (
+            "No test coverage is recorded for Bar; running all tests."
+            in self.task_log["warning"]
+        )
+        impact_map = json.loads((tmp_path / "apex_test_impact.json").read_text())
+        assert impact_map["tests_by_class"] == {"Foo": ["TestClass_TEST"]}
+
+    @pytest.mark.parametrize(
+        "contents", ["{not json", json.dumps({"tests_by_class": {}}), "[]"]
+    )
+    def test_load_test_impact_map__invalid(self, tmp_path, contents):
+        (tmp_path / "apex_test_impact.json").write_text(contents)
+        task = self._get_impact_task(tmp_path, impacted_by="Foo")
+
+        assert task._load_test_impact_map() is None
+        assert (
+            "The test impact map is invalid; running all tests."
+            in self.task_log["warning"]
+        )
+
+    @responses.activate
+    def test_run_task__impacted_by__stale_map(self, tmp_path):
+        self._write_impact_map(tmp_path, timestamp=time.time() - 8 * 86400)
+        self._mock_apex_class_query()
+        self._mock_run_tests()
+        self._mock_get_failed_test_classes()
+        self._mock_tests_complete()
+        self._mock_get_test_results()
+        self._mock_coverage_query()
+
+        task = self._get_impact_task(tmp_path, impacted_by="Bar")
+        task()
+
+        assert task.counts["Pass"] == 1
+        assert "The test impact map is out of date; running all tests." in (
+            self.task_log["info"]
+        )
+        impact_map = json.loads((tmp_path / "apex_test_impact.json").read_text())
+        assert impact_map["timestamp"] > time.time() - 60
+
+    @responses.activate
+    def test_run_task__impacted_by__no_map(self, tmp_path):
+        self._mock_apex_class_query()
+        self._mock_run_tests()
+        self._mock_get_failed_test_classes()
+        self._mock_tests_complete()
+        self._mock_get_test_results()
+        self._mock_coverage_query()
+
+        task = self._get_impact_task(tmp_path, impacted_by="Foo")
+        task()
+
+        assert "No test impact map found; running all tests." in self.task_log["info"]
+        assert (tmp_path / "apex_test_impact.json").exists()
+
+    def test_get_changed_apex_names(self, tmp_path):
+        task = self._get_impact_task(tmp_path, impacted_by="Foo", impacted_since="main")
+        with patch("cumulusci.tasks.apex.testrunner.sarge.Command") as Command:
+            Command.return_value.returncode = 0
+            Command.return_value.stdout.text = (
+                "force-app/main/default/classes/Bar.cls\n"
+                "force-app/main/default/classes/Bar.cls-meta.xml\n"
+                "src/triggers/Baz.trigger\n"
+                "README.md\n"
+            )
+            assert task._get_changed_apex_names() == {"Foo", "Bar", "Baz"}
+        assert Command.call_args[0][0] == "git diff --name-only main"
+
+    def test_get_changed_apex_names__git_error(self, tmp_path):
+        task = self._get_impact_task(tmp_path, impacted_since="nope")
+        with patch("cumulusci.tasks.apex.testrunner.sarge.Command") as Command:
+            Command.return_value.returncode = 128
+            Command.return_value.stderr.text = "fatal: bad revision 'nope'"
+            with pytest.raises(TaskOptionsError, match="bad revision"):
+                task._get_changed_apex_names()
+
+    def test_partition_test_classes(self, tmp_path):
+        self.project_config._cache_dir = tmp_path
+        (tmp_path / "apex_test_durations.json").write_text(
+            json.dumps({"A_TEST": 100, "B_TEST": 60, "C_TEST": 50, "E_TEST": 10})
+        )
+        task = RunApexTests(self.project_config, self.task_config, self.org_config)
+
+        shards = task._partition_test_classes(
+            ["A_TEST", "B_TEST", "C_TEST", "D_TEST"], 2
+        )
+
+        # D_TEST has no history, so it is expected to take the average
+        # duration of the other classes being run (70ms)
+        assert shards == [["A_TEST", "C_TEST"], ["D_TEST", "B_TEST"]]
+        assert task._partition_test_classes(["A_TEST"], 3) == [["A_TEST"]]
+
+    def test_run_sharded(self, tmp_path):
+        self.project_config._cache_dir = tmp_path
+        self.task_config.config["options"]["shard_orgs"] = "other"
+        task = RunApexTests(self.project_config, self.task_config, self.org_config)
+        task._init_class()
+        task.counts = {"Pass": 0, "Fail": 0, "CompileFail": 0, "Skip": 0}
+
+        def run_test_classes(test_classes):
+            assert [c["Name"] for c in test_classes] == ["A_TEST"]
+            task.counts["Pass"] = 1
+            task.results_by_class_name["A_TEST"] = {"a": {"RunTime": 10}}
+
+        task._run_test_classes = Mock(side_effect=run_test_classes)
+        task._collect_test_results = Mock(return_value=[{"ClassName": "A_TEST"}])
+        task._log_test_summary = Mock()
+        other_org = OrgConfig({}, "other")
+        runner = Mock(org_config=other_org)
+        runner._get_test_classes.return_value = {
+            "records": [{"Id": "2", "Name": "B_TEST"}, {"Id": "3", "Name": "C_TEST"}]
+        }
+        runner._collect_test_results.return_value = [{"ClassName": "B_TEST"}]
+        runner.counts = {"Pass": 0, "Fail": 1, "CompileFail": 0, "Skip": 0}
+        runner.results_by_class_name = {"B_TEST": {"b": {"RunTime": 20}}}
+
+        with patch.object(
+            self.project_config.keychain, "get_org", return_value=other_org
+        ), patch.object(task, "_get_shard_runner", return_value=runner) as get_runner:
+            results = task._run_sharded(
+                [{"Id": "1", "Name": "A_TEST"}, {"Id": "2", "Name": "B_TEST"}]
+            )
+
+        get_runner.assert_called_once_with(other_org)
+        runner._run_test_classes.assert_called_once_with(
+            [{"Id": "2", "Name": "B_TEST"}]
+        )
+        assert results == [{"ClassName": "A_TEST"}, {"ClassName": "B_TEST"}]
+        task._log_test_summary.assert_called_once_with(results)
+        assert task.counts == {"Pass": 1, "Fail": 1, "CompileFail": 0, "Skip": 0}
+        assert task.shard_runners == [task, runner]
+        durations = json.loads((tmp_path / "apex_test_durations.json").read_text())
+        assert durations == {"A_TEST": 10, "B_TEST": 20}
+
+    def test_run_sharded__missing_class(self, tmp_path):
+        self.project_config._cache_dir = tmp_path
+        self.task_config.config["options"]["shard_orgs"] = "other"
+        task = RunApexTests(self.project_config, self.task_config, self.org_config)
+        task._run_test_classes = Mock()
+        task._collect_test_results = Mock(return_value=[])
+        runner = Mock(org_config=OrgConfig({}, "other"))
+        runner._get_test_classes.return_value = {"records": []}
+
+        with patch.object(self.project_config.keychain, "get_org"), patch.object(
+            task, "_get_shard_runner", return_value=runner
+        ):
+            with pytest.raises(CumulusCIException, match="not found in org other"):
+                task._run_sharded(
+                    [{"Id": "1", "Name": "A_TEST"}, {"Id": "2", "Name": "B_TEST"}]
+                )
+
+    def test_get_shard_runner(self):
+        self.task_config.config["options"]["shard_orgs"] = "other"
+        self.task_config.config["options"]["impacted_by"] = "Foo"
+        task = RunApexTests(self.project_config, self.task_config, self.org_config)
+        other_org = OrgConfig({}, "other")
+
+        with patch.object(RunApexTests, "_update_credentials"), patch.object(
+            RunApexTests, "_init_task"
+        ):
+            runner = task._get_shard_runner(other_org)
+
+        assert runner.org_config is other_org
+        assert runner.options["shard_orgs"] == []
+        assert runner.options["impacted_by"] == []
+        assert runner.options["test_name_match"] == "%_TEST"
+        assert runner.logger is task.logger
+
+    def _get_streamed_result(self, id, method_name, outcome, modstamp):
+        return {
+            "Id": id,
+            "ApexClassId": 1,
+            "MethodName": method_name,
+            "Outcome": outcome,
+            "Message": "Boom" if outcome == "Fail" else None,
+            "StackTrace": None,
+            "RunTime": 1,
+            "SystemModstamp": modstamp,
+        }
+
+    def test_poll_action__incremental_progress(self):
+        self.task_config.config["options"]["incremental_progress"] = True
+        self.task_config.config["options"]["poll_interval"] = 0
+        task = RunApexTests(self.project_config, self.task_config, self.org_config)
+        task._init_class()
+        task.classes_by_id = {1: "TestClass_TEST"}
+        task.job_id = "JOB_ID1234567"
+        task.tooling = Mock()
+        task.tooling.query_all.side_effect = [
+            {
+                "records": [
+                    {"Status": "Completed", "total": 3},
+                    {"Status": "Processing", "total": 2},
+                ]
+            },
+            {
+                "records": [
+                    self._get_streamed_result(
+                        "R1", "test1", "Fail", "2022-01-01T10:00:00.000+0000"
+                    )
+                ]
+            },
+            {"records": [{"Status": "Completed", "total": 5}]},
+        ]
+
+        task._wait_for_tests()
+
+        assert "Completed: 3  Processing: 2  Queued: 0" in self.task_log["info"]
+        assert "Failed: TestClass_TEST.test1: Boom" in self.task_log["error"]
+        assert task.poll_complete
+        assert list(task.streamed_results) == ["R1"]
+        assert "GROUP BY Status" in task.tooling.query_all.call_args_list[0][0][0]
+
+    def test_get_test_results__incremental_progress(self):
+        self.task_config.config["options"]["incremental_progress"] = True
+        task = RunApexTests(self.project_config, self.task_config, self.org_config)
+        task._init_class()
+        task.classes_by_id = {1: "TestClass_TEST"}
+        task.results_by_class_name = {"TestClass_TEST": {}}
+        task.counts = {"Pass": 0, "Fail": 0, "CompileFail": 0, "Skip": 0}
+        task.job_id = "JOB_ID1234567"
+        task.streamed_results = {
+            "R1": self._get_streamed_result(
+                "R1", "test1", "Pass", "2022-01-01T10:00:00.000+0000"
+            )
+        }
+        task.last_result_modstamp = datetime.datetime(2022, 1, 1, 10)
+        task.tooling = Mock()
+        task.tooling.query_all.side_effect = [
+            {"records": []},
+            {
+                "records": [
+                    self._get_streamed_result(
+                        "R1", "test1", "Pass", "2022-01-01T10:00:00.000+0000"
+                    ),
+                    self._get_streamed_result(
+                        "R2", "test2", "Pass", "2022-01-01T10:00:05.000+0000"
+                    ),
+                ]
+            },
+        ]
+
+        task._get_test_results()
+
+        assert (
+            "AND SystemModstamp >= 2022-01-01T10:00:00Z"
+            in task.tooling.query_all.call_args_list[1][0][0]
+        )
+        assert task.counts["Pass"] == 2
+        assert set(task.results_by_class_name["TestClass_TEST"]) == {"test1", "test2"}
+        assert task.last_result_modstamp == datetime.datetime(2022, 1, 1, 10, 0, 5)
+
+    def test_check_code_coverage__sharded(self):
+        task = RunApexTests(self.project_config, self.task_config, self.org_config)
+        task.code_coverage_level = 75
+        task.required_per_class_code_coverage_percent = 60
+        runners = [Mock(), Mock()]
+        runners[0].tooling.query_all.return_value = {
+            "records": [
+                {
+                    "ApexClassOrTrigger": {"Name": "Foo"},
+                    "Coverage": {"coveredLines": [1, 2], "uncoveredLines": [3, 4]},
+                },
+                {
+                    "ApexClassOrTrigger": {"Name": "Bar"},
+                    "Coverage": {"coveredLines": [1], "uncoveredLines": [2, 3]},
+                },
+            ]
+        }
+        runners[1].tooling.query_all.return_value = {
+            "records": [
+                {
+                    "ApexClassOrTrigger": {"Name": "Foo"},
+                    "Coverage": {"coveredLines": [3, 4], "uncoveredLines": [1, 2]},
+                },
+            ]
+        }
+        task.shard_runners = runners
+
+        assert task._get_combined_coverage() == ({"Bar": 33.33, "Foo": 100.0}, 71.43)
+        with pytest.raises(ApexTestException) as e:
+            task._check_code_coverage()
+        assert "Bar's code coverage of 33.33%" in str(e.value)
+        assert "Organization-wide code coverage of 71.43%" in str(e.value)
+
     @responses.activate
     def test_run_task__processing(self):
         self._mock_apex_class_query()
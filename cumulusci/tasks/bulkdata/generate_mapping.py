@@ -7,6 +7,9 @@ import yaml
 from cumulusci.core.exceptions import TaskOptionsError
 from cumulusci.core.utils import process_bool_arg, process_list_arg
 from cumulusci.salesforce_api.org_schema import Field, get_org_schema
+from cumulusci.tasks.bulkdata.generate_mapping_utils.dependency_graph import (
+    DependencyGraph,
+)
 from cumulusci.tasks.salesforce import BaseSalesforceApiTask
 
 
@@ -87,6 +90,7 @@ class GenerateMapping(BaseSalesforceApiTask):
         self._build_mapping()
         with open(filename, "w") as f:
             yaml.dump(self.mapping, f, sort_keys=False)
+        self.return_values = {"load_levels": self.load_levels}
 
     def _collect_objects(self, org_schema):
         """Walk the global describe and identify the sObjects we need to include in a minimal operation."""
@@ -252,40 +256,36 @@ class GenerateMapping(BaseSalesforceApiTask):
 
     def _split_dependencies(self, objs, dependencies):
         """Attempt to flatten the object network into a sequence of load operations."""
-        stack = []
-        objs_remaining = sorted(objs)
-
         # The structure of `dependencies` is:
         # key = object, value = set of objects it references.
-
-        # Iterate through our list of objects
-        # For each object, if it is not dependent on any other objects, place it at the end of the stack.
-        # Once an object is placed in the stack, remove dependencies to it (they're satisfied)
-        while objs_remaining:
-            objs_without_deps = [
-                obj
-                for obj in objs_remaining
-                if obj not in dependencies or not dependencies[obj]
-            ]
-            assert all(objs_without_deps)
-
-            if not objs_without_deps:
-                choice = self.choose_next_object(objs_remaining, dependencies)
+        graph = DependencyGraph(sorted(objs))
+        for obj, references in dependencies.items():
+            for other_obj in references:
+                graph.add_dependency(obj, other_obj)
+
+        # Objects in the same level do not depend on each other.
+        self.load_levels = []
+        while graph.remaining:
+            level = graph.next_level()
+            if not level:
+                # Only the objects of cycles that are not waiting on
+                # anything else are worth choosing from.
+                objs_remaining = graph.stuck_candidates()
+                remaining_dependencies = {
+                    obj: {
+                        other_obj: fields
+                        for other_obj, fields in dependencies.get(obj, {}).items()
+                        if not graph.is_done(other_obj)
+                    }
+                    for obj in objs_remaining
+                }
+                choice = self.choose_next_object(objs_remaining, remaining_dependencies)
                 assert choice
-                objs_without_deps = [choice]
-
-            for obj in objs_without_deps:
-                stack.append(obj)
-
-                # Remove all dependencies on this object (they're satisfied)
-                for other_obj in dependencies:
-                    if obj in dependencies.get(other_obj):
-                        del dependencies[other_obj][obj]
-
-                # Remove this object from our remaining set.
-                objs_remaining.remove(obj)
+                graph.force(choice)
+                level = [choice]
+            self.load_levels.append(level)
 
-        return stack
+        return [obj for level in self.load_levels for obj in level]
 
     def find_free_object(self, objs_remaining: list, dependencies: dict):
         # if you change this code, remember that
@@ -0,0 +1,178 @@
+import heapq
+import typing as T
+from collections import defaultdict
+
+
+class DependencyGraph:
+    """Order tables so that each one comes after the tables it depends on.
+
+    This is Kahn's algorithm, run one "level" at a time: `next_level`
+    returns every table whose dependencies are done, in the order the
+    tables were given. Tables in a level do not depend on each other,
+    so they could be loaded in parallel.
+
+    When no table is free, the remaining tables contain a cycle.
+    `stuck_candidates` finds the cycles that do not wait on anything
+    else (with Tarjan's strongly connected components algorithm) and
+    the caller picks one of their tables to `force`.
+
+    A dependency can name several tables (e.g. a polymorphic lookup)
+    and is met when all of them are done. Dependencies of a table on
+    itself are ignored."""
+
+    def __init__(self, table_names: T.Iterable[str]):
+        self._index = {name: idx for idx, name in enumerate(dict.fromkeys(table_names))}
+        self._done = set()
+        self._dependencies = defaultdict(list)  # table -> its dependency ids
+        self._owners = []  # dependency id -> table that has it
+        self._targets = []  # dependency id -> tables it waits for
+        self._priorities = []  # dependency id -> priority
+        self._pending = []  # dependency id -> number of targets not done
+        self._unmet = dict.fromkeys(self._index, 0)  # table -> unmet dependencies
+        self._waiting_on = defaultdict(list)  # table -> dependency ids waiting on it
+        self._free = [(idx, name) for name, idx in self._index.items()]
+
+    def add_dependency(
+        self,
+        table_name: str,
+        table_names_to: T.Union[str, T.Iterable[str]],
+        priority: int = 0,
+    ):
+        if table_name not in self._index:
+            return
+        if isinstance(table_names_to, str):
+            table_names_to = (table_names_to,)
+        targets = set(table_names_to) - {table_name}
+        if not targets:
+            return
+        dep_id = len(self._targets)
+        self._owners.append(table_name)
+        self._targets.append(targets)
+        self._priorities.append(priority)
+        self._pending.append(len(targets - self._done))
+        self._dependencies[table_name].append(dep_id)
+        for target in targets:
+            self._waiting_on[target].append(dep_id)
+        if self._pending[dep_id]:
+            self._unmet[table_name] += 1
+
+    @property
+    def remaining(self) -> T.List[str]:
+        """Tables that are not done yet, in their original order"""
+        return [name for name in self._index if name not in self._done]
+
+    def is_done(self, table_name: str) -> bool:
+        return table_name in self._done
+
+    def is_free(self, table_name: str, min_priority: int = 0) -> bool:
+        """Are all dependencies with at least `min_priority` met?"""
+        return all(
+            not self._pending[dep_id] or self._priorities[dep_id] < min_priority
+            for dep_id in self._dependencies[table_name]
+        )
+
+    @property
+    def priorities(self) -> T.List[int]:
+        return sorted(set(self._priorities))
+
+    def next_level(self) -> T.List[str]:
+        """Mark the free tables as done and return them.
+
+        Returns an empty list when every table is done or when the
+        remaining tables are stuck on a cycle."""
+        level = []
+        while self._free:
+            _, name = heapq.heappop(self._free)
+            if name not in self._done and not self._unmet[name]:
+                level.append(name)
+        # tables freed by this level belong to the next one
+        for name in level:
+            self._mark_done(name)
+        return level
+
+    def force(self, table_name: str):
+        """Mark a table as done even though it has unmet dependencies"""
+        self._mark_done(table_name)
+
+    def _mark_done(self, table_name: str):
+        if table_name in self._done:
+            return
+        self._done.add(table_name)
+        for dep_id in self._waiting_on[table_name]:
+            self._pending[dep_id] -= 1
+            if not self._pending[dep_id]:
+                owner = self._owners[dep_id]
+                self._unmet[owner] -= 1
+                if not self._unmet[owner] and owner not in self._done:
+                    heapq.heappush(self._free, (self._index[owner], owner))
+
+    def _edges(self, table_name: str) -> T.Iterator[str]:
+        """Remaining tables that this table is waiting for"""
+        for dep_id in self._dependencies[table_name]:
+            if self._pending[dep_id]:
+                for target in self._targets[dep_id]:
+                    if target in self._index and target not in self._done:
+                        yield target
+
+    def strongly_connected_components(self) -> T.List[T.List[str]]:
+        """Tarjan's algorithm over the remaining tables.
+
+        Written without recursion because schemas can be large. Components
+        come out dependencies-first."""
+        index = {}
+        lowlink = {}
+        on_stack = set()
+        stack = []
+        components = []
+        counter = 0
+
+        for root in self.remaining:
+            if root in index:
+                continue
+            work = [(root, iter(self._edges(root)))]
+            index[root] = lowlink[root] = counter
+            counter += 1
+            stack.append(root)
+            on_stack.add(root)
+            while work:
+                node, edges = work[-1]
+                for target in edges:
+                    if target not in index:
+                        index[target] = lowlink[target] = counter
+                        counter += 1
+                        stack.append(target)
+                        on_stack.add(target)
+                        work.append((target, iter(self._edges(target))))
+                        break
+                    elif target in on_stack:
+                        lowlink[node] = min(lowlink[node], index[target])
+                else:
+                    work.pop()
+                    if work:
+                        parent = work[-1][0]
+                        lowlink[parent] = min(lowlink[parent], lowlink[node])
+                    if lowlink[node] == index[node]:
+                        component = []
+                        while True:
+                            member = stack.pop()
+                            on_stack.remove(member)
+                            component.append(member)
+                            if member == node:
+                                break
+                        components.append(component)
+        return components
+
+    def stuck_candidates(self) -> T.List[str]:
+        """Tables worth forcing when no table is free.
+
+        These are the members of the cycles that wait on no table outside
+        of themselves. Forcing any other table would break a dependency
+        without getting any closer to resolving a cycle."""
+        candidates = set()
+        for component in self.strongly_connected_components():
+            members = set(component)
+            if all(
+                target in members for name in component for target in self._edges(name)
+            ):
+                candidates.update(members)
+        return [name for name in self.remaining if name in candidates]
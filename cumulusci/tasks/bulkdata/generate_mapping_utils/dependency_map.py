@@ -4,6 +4,9 @@ from collections import defaultdict
 from cumulusci.tasks.bulkdata.extract_dataset_utils.calculate_dependencies import (
     SObjDependency,
 )
+from cumulusci.tasks.bulkdata.generate_mapping_utils.dependency_graph import (
+    DependencyGraph,
+)
 from cumulusci.utils.collections import OrderedSet, OrderedSetType
 
 StrDependencyMapping = T.Mapping[str, OrderedSetType[SObjDependency]]
@@ -25,6 +28,7 @@ class DependencyMap:
     reference_fields: StrDependencyMapping
 
     _sorted_tables = None  # cache for sorted table computation
+    _levels = None  # cache for the levels of the sorted tables
 
     def __init__(
         self,
@@ -55,100 +59,63 @@ class DependencyMap:
     def get_dependency_order(self):
         """Sort the dependencies to output tables in the right order."""
         if not self._sorted_tables:
+            self._sorted_tables = [
+                table for level in self.get_dependency_levels() for table in level
+            ]
+        return self._sorted_tables
+
+    def get_dependency_levels(self):
+        """Group the sorted tables into levels that could be loaded in parallel."""
+        if not self._levels:
             # SnowfakeryPersonAccounts: Add this back in when Snowfakery is integrated with this code.
             # _remove_person_contact_id(self.dependencies)
-            self._sorted_tables = _sort_by_dependencies(
+            self._levels = _sort_by_dependencies(
                 tuple(self.table_names), self.dependencies
             )
-        return self._sorted_tables
+        return self._levels
 
 
 def _sort_by_dependencies(
     table_names: T.Sequence[str],
     dependencies: T.Mapping[str, OrderedSet],
-    priority: int = 0,
-):
-    "Sort tables by dependency relationships."
-    sorted_tables = []
-    dependencies = dict(dependencies)
-
-    while table_names:
-        remaining = len(table_names)
-        leaf_tables = [
-            table
-            for table in table_names
-            if _table_is_free(table, dependencies, sorted_tables, priority)
-        ]
-        sorted_tables.extend(leaf_tables)
-        table_names = [table for table in table_names if table not in sorted_tables]
-
-        # Nothing changed, so we need to attempt other techniques.
-        if len(table_names) == remaining:
-            # this is a bit tricky.
-            # run the algorithm with ONLY the declared/hard
-            # dependencies and see if it comes to resolution
-
-            higher_priority_sort = _sort_dependencies_higher_priority(
-                table_names, dependencies, priority
-            )
-
-            if higher_priority_sort:
-                sorted_tables.extend(higher_priority_sort)
-            else:
-                # I'm stuck. Try randomly
-                sorted_tables.append(sorted(table_names)[0])
-
-    return sorted_tables
-
-
-def _sort_dependencies_higher_priority(
-    table_names: T.Iterable[str],
-    dependencies: T.Mapping[str, OrderedSet],
-    priority: int,
-):
-    """After a priority-ignoring dependency sort has failed, try sorting ONLY
-    on that subset of dependencies marked with a higher priority. This function
-    is mututally recursive with `_sort_by_dependencies` so it will ratchet
-    up the priority potentially multiple times."""
-    relevant_dependencies = (
-        dep.priority
-        for depset in dependencies.values()
-        for dep in depset
-        if dep.priority > priority
-    )
-    lowest_priority_dependency = min(relevant_dependencies, default=None)
-
-    if lowest_priority_dependency is not None:
-        return _sort_by_dependencies(
-            table_names, dependencies, lowest_priority_dependency
-        )
-
-
-def _table_is_free(
-    table_name: str,
-    dependencies: StrDependencyMapping,
-    sorted_tables: T.Sequence[str],
-    priority: int,
-):
-    """Check if every child of this table is already sorted
-
-    Look at the unit test test_table_is_free_simple to see some
-    usage examples.
-    """
-    tables_this_table_depends_upon = dependencies.get(table_name, OrderedSet()).copy()
-    for dependency in sorted(tables_this_table_depends_upon):
-        table_names = (
-            [dependency.table_names_to]
-            if isinstance(dependency.table_names_to, str)
-            else dependency.table_names_to
-        )
-        if (
-            all(table in sorted_tables or table == table_name for table in table_names)
-            or dependency.priority < priority
-        ):
-            tables_this_table_depends_upon.remove(dependency)
-
-    return len(tables_this_table_depends_upon) == 0
+) -> T.List[T.List[str]]:
+    """Sort tables by dependency relationships.
+
+    Returns levels of tables. Tables in the same level do not depend
+    on each other."""
+    graph = DependencyGraph(table_names)
+    for depset in dependencies.values():
+        for dep in depset:
+            graph.add_dependency(dep.table_name_from, dep.table_names_to, dep.priority)
+
+    levels = []
+    while graph.remaining:
+        level = graph.next_level()
+        if not level:
+            # Nothing is free, so we need to break a cycle.
+            level = _tables_to_force(graph)
+            for table in level:
+                graph.force(table)
+        levels.append(level)
+    return levels
+
+
+def _tables_to_force(graph: DependencyGraph) -> T.List[str]:
+    """Pick tables to load before all of their dependencies are loaded.
+
+    First try the tables that are free when only the dependencies with
+    a higher priority (e.g. declared ones) count, ratcheting up the
+    priority as needed."""
+    for priority in graph.priorities:
+        if priority > 0:
+            free_tables = [
+                table for table in graph.remaining if graph.is_free(table, priority)
+            ]
+            if free_tables:
+                return free_tables
+
+    # I'm stuck. Break one of the cycles that waits on nothing else.
+    return [sorted(graph.stuck_candidates())[0]]
 
 
 # SnowfakeryPersonAccounts: This code will be enabled when Snowfakery
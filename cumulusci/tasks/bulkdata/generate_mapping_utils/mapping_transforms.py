@@ -26,9 +26,11 @@ def sort_steps(
     mapping_steps: T.List[MappingStep], depmap: DependencyMap
 ) -> T.List[MappingStep]:
     """Sort mapping declaration steps in dependency order"""
-    table_order = depmap.get_dependency_order()
+    positions = {
+        table: position for position, table in enumerate(depmap.get_dependency_order())
+    }
 
-    return sorted(mapping_steps, key=lambda step: table_order.index(step.sf_object))
+    return sorted(mapping_steps, key=lambda step: positions[step.sf_object])
 
 
 class _MappingStepSignature(CCIModel):
@@ -0,0 +1,94 @@
+from cumulusci.tasks.bulkdata.generate_mapping_utils.dependency_graph import (
+    DependencyGraph,
+)
+
+
+def make_graph(table_names, dependencies):
+    graph = DependencyGraph(table_names)
+    for dependency in dependencies:
+        graph.add_dependency(*dependency)
+    return graph
+
+
+class TestDependencyGraph:
+    def test_levels(self):
+        graph = make_graph(
+            ["Opportunity", "Contact", "Account", "Lead"],
+            [
+                ("Contact", "Account"),
+                ("Opportunity", "Contact"),
+                ("Opportunity", "Account"),
+                ("Account", "Account"),  # self-references are ignored
+            ],
+        )
+
+        assert graph.next_level() == ["Account", "Lead"]
+        assert graph.next_level() == ["Contact"]
+        assert graph.remaining == ["Opportunity"]
+        assert graph.next_level() == ["Opportunity"]
+        assert graph.next_level() == []
+        assert graph.remaining == []
+
+    def test_polymorphic_dependencies(self):
+        graph = make_graph(
+            ["Task", "Account", "Contact"],
+            [("Task", ("Account", "Contact")), ("Contact", "Account")],
+        )
+
+        assert graph.next_level() == ["Account"]
+        # Task waits for every table it can refer to
+        assert graph.next_level() == ["Contact"]
+        assert graph.next_level() == ["Task"]
+
+    def test_stuck_candidates(self):
+        graph = make_graph(
+            ["Account", "Contact", "Custom__c", "Custom_2__c", "Lead"],
+            [
+                ("Account", "Contact"),
+                ("Contact", "Account"),
+                ("Custom__c", "Account"),
+                ("Custom__c", "Custom_2__c"),
+                ("Custom_2__c", "Custom__c"),
+            ],
+        )
+
+        assert graph.next_level() == ["Lead"]
+        assert graph.next_level() == []
+        # Custom__c and Custom_2__c are in a cycle, but it waits for Account
+        assert graph.stuck_candidates() == ["Account", "Contact"]
+        assert sorted(
+            sorted(component) for component in graph.strongly_connected_components()
+        ) == [["Account", "Contact"], ["Custom_2__c", "Custom__c"]]
+
+        graph.force("Contact")
+        assert graph.next_level() == ["Account"]
+        assert graph.next_level() == []
+        assert graph.stuck_candidates() == ["Custom__c", "Custom_2__c"]
+
+    def test_is_free__priorities(self):
+        graph = make_graph(
+            ["Account", "Contact"],
+            [("Account", "Contact", True), ("Contact", "Account", False)],
+        )
+
+        assert graph.next_level() == []
+        assert graph.priorities == [False, True]
+        assert not graph.is_free("Contact")
+        assert graph.is_free("Contact", min_priority=True)
+        assert not graph.is_free("Account", min_priority=True)
+
+    def test_large_schema(self):
+        # a long chain with a cycle at the end would recurse deeply
+        names = [f"Object_{i:04}__c" for i in range(3000)]
+        dependencies = [(name, next_name) for name, next_name in zip(names, names[1:])]
+        graph = make_graph(names, dependencies + [(names[-1], names[0])])
+
+        assert graph.next_level() == []
+        assert len(graph.strongly_connected_components()) == 1
+        assert graph.stuck_candidates() == names
+
+        graph.force(names[-1])
+        levels = []
+        while graph.remaining:
+            levels.append(graph.next_level())
+        assert levels == [[name] for name in reversed(names[:-1])]
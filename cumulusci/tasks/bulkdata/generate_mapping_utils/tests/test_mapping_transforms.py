@@ -111,6 +111,25 @@ class TestSortSteps(MappingTransformTesterBase):
             positions = {name: pos for (pos, name) in enumerated}
             assert positions["Custom_2__c"] < positions["Custom_3__c"], positions
 
+    def test_dependency_levels(self):
+        deps = DependencyMap(
+            ["Contact", "Account", "Opportunity", "Lead"],
+            [
+                SObjDependency("Contact", "Account", "AccountId"),
+                SObjDependency("Opportunity", "Account", "AccountId"),
+            ],
+        )
+        assert deps.get_dependency_levels() == [
+            ["Account", "Lead"],
+            ["Contact", "Opportunity"],
+        ]
+        assert deps.get_dependency_order() == [
+            "Account",
+            "Lead",
+            "Contact",
+            "Opportunity",
+        ]
+
 
 class TestMergeMatchingSteps(MappingTransformTesterBase):
     def test_merge_matching_steps(self):
@@ -1,3 +1,4 @@
+import json
 import shutil
 import time
 import typing as T
@@ -140,6 +141,26 @@ class Snowfakery(BaseSalesforceApiTask):
             "description": "Boolean: should we continue loading even after running into row errors? "
             "Defaults to False."
         },
+        "persistent_workers": {
+            "description": "Boolean: should data generators and loaders keep running and "
+            "take one portion after another, instead of starting a new process or thread "
+            "for each portion? Defaults to False."
+        },
+        "direct_load": {
+            "description": "Boolean: should each data generator load the portion it "
+            "generated itself, keeping the data in memory instead of writing a database "
+            "file for a separate loader? Defaults to False."
+        },
+        "autoscale": {
+            "description": "Boolean: should workers be shifted between data generation "
+            "and loading to keep up with the org, backing off when the org reports "
+            "lock contention? Defaults to False."
+        },
+        "telemetry_file": {
+            "description": "Path to a file where a line of JSON with throughput "
+            "statistics (records per second, queue depths, job durations) is "
+            "appended on every progress report."
+        },
     }
 
     def _validate_options(self):
@@ -160,6 +181,12 @@ class Snowfakery(BaseSalesforceApiTask):
         self.drop_missing_schema = process_bool_arg(
             self.options.get("drop_missing_schema", False)
         )
+        self.persistent_workers = process_bool_arg(
+            self.options.get("persistent_workers", False)
+        )
+        self.direct_load = process_bool_arg(self.options.get("direct_load", False))
+        self.autoscale = process_bool_arg(self.options.get("autoscale", False))
+        self.telemetry_file = self.options.get("telemetry_file")
 
         loading_rules = process_list_arg(self.options.get("loading_rules")) or []
         self.loading_rules = [Path(path) for path in loading_rules if path]
@@ -223,6 +250,8 @@ class Snowfakery(BaseSalesforceApiTask):
         self.start_time = time.time()
         self.recipe = Path(self.options.get("recipe"))
         self.sobject_counts = defaultdict(RunningTotals)
+        # lock contention errors reported since the last tick
+        self.new_lock_errors = 0
         self._init_channel_configs(self.recipe)
 
     ## Todo: Consider when this process runs longer than 2 Hours,
@@ -257,13 +286,16 @@ class Snowfakery(BaseSalesforceApiTask):
             # Retrieve OrgRecordCounts code from
             # https://github.com/SFDO-Tooling/CumulusCI/commit/7d703c44b94e8b21f165e5538c2249a65da0a9eb#diff-54676811961455410c30d9c9405a8f3b9d12a6222a58db9d55580a2da3cfb870R147
 
-            self._loop(
-                template_path,
-                working_directory,
-                None,
-                portions,
-            )
-            self.finish()
+            try:
+                self._loop(
+                    template_path,
+                    working_directory,
+                    None,
+                    portions,
+                )
+                self.finish()
+            finally:
+                self.queue_manager.close()
 
     def _setup_channels_and_queues(self, working_directory):
         """Set up all of the channels and queues.
@@ -284,6 +316,9 @@ class Snowfakery(BaseSalesforceApiTask):
             project_config=self.project_config,
             logger=self.logger,
             subtask_configurator=subtask_configurator,
+            persistent_workers=self.persistent_workers,
+            direct_load=self.direct_load,
+            autoscale=self.autoscale,
         )
         if len(self.channel_configs) == 1:
             channel = self.channel_configs[0]
@@ -361,8 +396,11 @@ class Snowfakery(BaseSalesforceApiTask):
             )
             self.update_running_totals()
             self.print_running_totals()
+            self.queue_manager.adjust_workers(self.new_lock_errors)
+            self.new_lock_errors = 0
+            self.write_telemetry()
 
-            time.sleep(WAIT_TIME)
+            self.queue_manager.wait_for_job_events(WAIT_TIME)
 
             upload_status = self._report_status(
                 portions.batch_size,
@@ -425,6 +463,8 @@ class Snowfakery(BaseSalesforceApiTask):
                 self.update_running_totals_from_load_step_results(results["results"])
             elif "error" in results:
                 self.logger.warning(f"Error in load: {results}")
+                if "UNABLE_TO_LOCK_ROW" in results["error"]:
+                    self.new_lock_errors += 1
             else:  # pragma: no cover
                 self.logger.warning(f"Unexpected message from subtask: {results}")
 
@@ -436,6 +476,37 @@ class Snowfakery(BaseSalesforceApiTask):
             totals.errors += result["total_row_errors"]
             totals.successes += result["records_processed"] - result["total_row_errors"]
 
+    def write_telemetry(self):
+        """Append throughput statistics to the telemetry file as a line of JSON"""
+        if not self.telemetry_file:
+            return
+        status = self.get_upload_status(0)
+        elapsed = max(self.queue_manager.elapsed_seconds(), 1)
+        sets_generated = (
+            status.sets_queued_for_loading
+            + status.sets_being_loaded
+            + status.sets_finished
+        )
+        record = {
+            "elapsed_seconds": round(elapsed, 1),
+            "sets_generated": sets_generated,
+            "sets_generated_per_second": round(sets_generated / elapsed, 2),
+            "sets_loaded": status.sets_finished,
+            "sets_loaded_per_second": round(status.sets_finished / elapsed, 2),
+            "sets_failed": status.sets_failed,
+            "sobjects": {
+                name: {
+                    "successes": totals.successes,
+                    "errors": totals.errors,
+                    "loaded_per_second": round(totals.successes / elapsed, 2),
+                }
+                for name, totals in self.sobject_counts.items()
+            },
+            "channels": self.queue_manager.telemetry(),
+        }
+        with open(self.telemetry_file, "a", encoding="utf-8") as f:
+            f.write(json.dumps(record) + "\n")
+
     def print_running_totals(self):
         for name, result in self.sobject_counts.items():
             self.logger.info(
@@ -455,10 +526,11 @@ class Snowfakery(BaseSalesforceApiTask):
                 self.logger.info(msg)
                 self.update_running_totals()
                 self.print_running_totals()
+                self.write_telemetry()
                 cooldown = 5
             else:
                 cooldown -= 1
-            time.sleep(WAIT_TIME)
+            self.queue_manager.wait_for_job_events(WAIT_TIME)
 
         self.log_failures()
 
@@ -466,6 +538,7 @@ class Snowfakery(BaseSalesforceApiTask):
         self.logger.info(" == Results == ")
         self.update_running_totals()
         self.print_running_totals()
+        self.write_telemetry()
         elapsed = format_duration(timedelta(seconds=time.time() - self.start_time))
 
         if self.run_until.sobject_name:
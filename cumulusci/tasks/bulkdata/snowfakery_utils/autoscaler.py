@@ -0,0 +1,92 @@
+import typing as T
+
+# how many ticks to leave the loaders alone after backing off
+BACKOFF_TICKS = 5
+
+
+class ChannelAutoscaler:
+    """Shift workers between data generation and data loading.
+
+    One generator process is traded for `loaders_per_generator` loader
+    threads, so a channel never uses more than the capacity it started
+    with. Generators never grow beyond their starting number because
+    they are CPU-bound.
+
+    When the org reports lock contention the loaders are halved and
+    left alone for a few ticks before they can grow back."""
+
+    def __init__(self, channel, loaders_per_generator: int, logger):
+        self.channel = channel
+        self.loaders_per_generator = loaders_per_generator
+        self.logger = logger
+        self.max_generators = channel.num_generator_workers
+        self.base_loaders = channel.num_loader_workers
+        self.backoff_ticks = 0
+
+    @property
+    def num_generators(self) -> int:
+        return self.channel.data_gen_q.num_workers
+
+    @property
+    def num_loaders(self) -> int:
+        return self.channel.load_data_q.num_workers
+
+    @property
+    def max_loaders(self) -> int:
+        """Loaders we can afford with the generators we have given up"""
+        given_up = self.max_generators - self.num_generators
+        return self.base_loaders + given_up * self.loaders_per_generator
+
+    def adjust(self, lock_errors: int = 0) -> T.Optional[str]:
+        """Called every tick. Returns a description of any change."""
+        if lock_errors:
+            self.backoff_ticks = BACKOFF_TICKS
+            return self._resize(
+                self.num_generators,
+                max(self.num_loaders // 2, 1),
+                "lock contention",
+            )
+        if self.backoff_ticks:
+            self.backoff_ticks -= 1
+            return None
+
+        gen_q, load_q = self.channel.data_gen_q, self.channel.load_data_q
+        loaders_are_behind = load_q.queued_jobs and not load_q.num_free_workers
+        loaders_are_idle = (
+            not load_q.queued_jobs
+            and load_q.num_free_workers >= self.loaders_per_generator
+        )
+        if loaders_are_behind and self.num_loaders < self.max_loaders:
+            return self._resize(
+                self.num_generators,
+                min(self.num_loaders + self.loaders_per_generator, self.max_loaders),
+                "load backlog",
+            )
+        elif loaders_are_behind and self.num_generators > 1:
+            return self._resize(
+                self.num_generators - 1,
+                self.num_loaders + self.loaders_per_generator,
+                "load backlog",
+            )
+        elif (
+            loaders_are_idle
+            and not gen_q.num_free_workers
+            and self.num_generators < self.max_generators
+        ):
+            return self._resize(
+                self.num_generators + 1,
+                max(self.num_loaders - self.loaders_per_generator, 1),
+                "idle loaders",
+            )
+        return None
+
+    def _resize(self, num_generators: int, num_loaders: int, reason: str):
+        if (num_generators, num_loaders) == (self.num_generators, self.num_loaders):
+            return None
+        self.channel.resize(num_generators, num_loaders)
+        description = (
+            f"Autoscaling ({reason}): {num_generators} data generators, "
+            f"{num_loaders} loaders"
+        )
+        self.logger.info(description)
+        return description
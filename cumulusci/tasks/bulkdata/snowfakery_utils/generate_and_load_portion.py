@@ -0,0 +1,74 @@
+import sqlite3
+from contextlib import closing
+from uuid import uuid4
+
+from cumulusci.core.config import TaskConfig
+from cumulusci.core.tasks import BaseTask
+from cumulusci.tasks.bulkdata.generate_from_yaml import GenerateDataFromYaml
+from cumulusci.tasks.bulkdata.load import LoadData
+from cumulusci.tasks.salesforce import BaseSalesforceApiTask
+
+
+class GenerateAndLoadPortion(BaseTask):
+    """Generate a Snowfakery portion and load it from the same worker.
+
+    The generated rows are kept in an in-memory SQLite database
+    instead of a database file that is handed to a separate loader."""
+
+    # Shared by the Salesforce connections of the subtasks, if set
+    connection_pool = None
+
+    task_options = {
+        "database_file": {
+            "description": "SQLite file with the ID mappings to start from",
+            "required": True,
+        },
+        "generator_options": {
+            "description": "Options for the GenerateDataFromYaml subtask",
+            "required": True,
+        },
+        "loader_options": {
+            "description": "Options for the LoadData subtask",
+            "required": True,
+        },
+        "working_directory": {
+            "description": "Path for the portion's continuation files"
+        },
+    }
+
+    def _run_task(self):
+        name = f"portion_{uuid4().hex}"
+        database_url = f"sqlite:///file:{name}?mode=memory&cache=shared&uri=true"
+        # A shared in-memory database lives as long as some connection
+        # to it is open, so we hold one until the portion is loaded.
+        with closing(
+            sqlite3.connect(f"file:{name}?mode=memory&cache=shared", uri=True)
+        ) as keepalive:
+            with closing(sqlite3.connect(self.options["database_file"])) as template:
+                template.backup(keepalive)
+
+            self._run_subtask(
+                GenerateDataFromYaml,
+                {
+                    **self.options["generator_options"],
+                    "database_url": database_url,
+                    "working_directory": self.options.get("working_directory"),
+                },
+            )
+            self.return_values = self._run_subtask(
+                LoadData,
+                {**self.options["loader_options"], "database_url": database_url},
+            )
+        return self.return_values
+
+    def _run_subtask(self, task_class, options) -> dict:
+        subtask = task_class(
+            project_config=self.project_config,
+            task_config=TaskConfig({"options": options}),
+            org_config=self.org_config,
+            logger=self.logger,
+        )
+        if issubclass(task_class, BaseSalesforceApiTask):
+            subtask.connection_pool = self.connection_pool
+        subtask()
+        return subtask.return_values
@@ -16,6 +16,8 @@ from cumulusci.utils.parallel.task_worker_queues.parallel_worker_queue import (
     WorkerQueueConfig,
 )
 
+from .autoscaler import ChannelAutoscaler
+from .generate_and_load_portion import GenerateAndLoadPortion
 from .snowfakery_run_until import PortionGenerator
 from .snowfakery_working_directory import SnowfakeryWorkingDirectory
 from .subtask_configurator import SubtaskConfigurator
@@ -45,6 +47,9 @@ class SnowfakeryChannelManager:
         *,
         project_config,
         logger,
+        persistent_workers: bool = False,
+        direct_load: bool = False,
+        autoscale: bool = False,
     ):
         # Look at the docstring on get_results_report to understand
         # what this queue is for.
@@ -59,10 +64,19 @@ class SnowfakeryChannelManager:
         # and work across processes, (PR #3080) but it's dramatically
         # slower. See attachment to PR #3076
         self.results_reporter = queue.Queue()
+        # Workers report every job they finish here, so we can react to
+        # finished jobs right away and count jobs without listing folders.
+        # Generators are processes, so this must be a multiprocessing Queue.
+        self.job_events = WorkerQueue.context.Queue()
         self.channels = []
         self.project_config = project_config
         self.logger = logger
         self.subtask_configurator = subtask_configurator
+        self.persistent_workers = persistent_workers
+        self.direct_load = direct_load
+        # there are no loaders to scale when generators load directly
+        self.autoscale = autoscale and not direct_load
+        self.autoscalers = []
         self.start_time = time.time()
 
     def add_channel(
@@ -76,19 +90,25 @@ class SnowfakeryChannelManager:
         if not num_loader_workers:
             num_loader_workers = num_generator_workers * WORKER_TO_LOADER_RATIO
 
-        self.channels.append(
-            Channel(
-                project_config=self.project_config,
-                org_config=org_config,
-                num_generator_workers=num_generator_workers,
-                num_loader_workers=num_loader_workers,
-                working_directory=working_directory,
-                subtask_configurator=self.subtask_configurator,
-                logger=self.logger,
-                results_reporter=self.results_reporter,
-                recipe_options=recipe_options,
-            )
+        channel = Channel(
+            project_config=self.project_config,
+            org_config=org_config,
+            num_generator_workers=num_generator_workers,
+            num_loader_workers=num_loader_workers,
+            working_directory=working_directory,
+            subtask_configurator=self.subtask_configurator,
+            logger=self.logger,
+            results_reporter=self.results_reporter,
+            job_events=self.job_events,
+            recipe_options=recipe_options,
+            persistent_workers=self.persistent_workers,
+            direct_load=self.direct_load,
         )
+        self.channels.append(channel)
+        if self.autoscale:
+            self.autoscalers.append(
+                ChannelAutoscaler(channel, WORKER_TO_LOADER_RATIO, self.logger)
+            )
 
     def tick(
         self,
@@ -161,6 +181,15 @@ class SnowfakeryChannelManager:
     def elapsed_seconds(self):
         return time.time() - self.start_time
 
+    def adjust_workers(self, lock_errors: int = 0):
+        """Let each channel's autoscaler react to the latest tick"""
+        for autoscaler in self.autoscalers:
+            autoscaler.adjust(lock_errors)
+
+    def telemetry(self) -> T.List[dict]:
+        """Machine-readable queue statistics for each channel"""
+        return [channel.stats() for channel in self.channels]
+
     def failure_descriptions(self) -> T.List[str]:
         """Log failures from sub-processes to main process"""
         ret = []
@@ -169,10 +198,44 @@ class SnowfakeryChannelManager:
         return ret
 
     def check_finished(self) -> bool:
+        self.wait_for_job_events(timeout=0)
         for channel in self.channels:
             channel.tick()
         return all([channel.check_finished() for channel in self.channels])
 
+    def wait_for_job_events(self, timeout: float) -> int:
+        """Wait up to `timeout` seconds for workers to finish jobs.
+
+        Returns as soon as there is news, after applying every event
+        that has arrived so far. Returns the number of events.
+
+        In direct_load mode the generators send their load results
+        on the same queue, ahead of their job events, and these are
+        passed on to the results_reporter."""
+        queues = {
+            str(q.inprogress_dir): q
+            for channel in self.channels
+            for q in (channel.data_gen_q, channel.load_data_q)
+        }
+        num_events = 0
+        try:
+            event = self.job_events.get(block=timeout > 0, timeout=timeout or None)
+            while True:
+                if "inprogress_dir" in event:
+                    queues[event["inprogress_dir"]].handle_job_event(event)
+                    num_events += 1
+                else:
+                    self.results_reporter.put(event)
+                event = self.job_events.get(block=False)
+        except queue.Empty:
+            pass
+        return num_events
+
+    def close(self):
+        """Stop the persistent workers of every channel"""
+        for channel in self.channels:
+            channel.close()
+
     def get_results_report(self, block=False):
         """
         This is a realtime reporting channel which could, in theory, be updated
@@ -199,6 +262,9 @@ class Channel:
         logger,
         recipe_options=None,
         results_reporter=None,
+        job_events=None,
+        persistent_workers: bool = False,
+        direct_load: bool = False,
     ):
         self.project_config = project_config
         self.org_config = org_config
@@ -209,8 +275,11 @@ class Channel:
         self.run_until = subtask_configurator.run_until
         self.logger = logger
         self.results_reporter = results_reporter
+        self.job_events = job_events
         self.filesystem_lock = Lock()
         self.job_counter = 0
+        self.persistent_workers = persistent_workers
+        self.direct_load = direct_load
         recipe_options = recipe_options or {}
         self._configure_queues(recipe_options)
 
@@ -229,6 +298,20 @@ class Channel:
                 *args, recipe_options=recipe_options, **kwargs
             )
 
+        def generate_and_load_opts_callback(*args, **kwargs):
+            return self.subtask_configurator.generate_and_load_opts(
+                *args, recipe_options=recipe_options, **kwargs
+            )
+
+        if self.direct_load:
+            # generators load their own portions, so the load queue
+            # stays empty
+            data_gen_task_class = GenerateAndLoadPortion
+            data_gen_opts_callback = generate_and_load_opts_callback
+        else:
+            data_gen_task_class = GenerateDataFromYaml
+            data_gen_opts_callback = data_generator_opts_callback
+
         data_gen_q_config = WorkerQueueConfig(
             project_config=self.project_config,
             org_config=self.org_config,
@@ -238,10 +321,11 @@ class Channel:
             spawn_class=WorkerQueue.Process,
             parent_dir=self.working_directory,
             name="data_gen",
-            task_class=GenerateDataFromYaml,
-            make_task_options=data_generator_opts_callback,
+            task_class=data_gen_task_class,
+            make_task_options=data_gen_opts_callback,
             queue_size=0,
             num_workers=self.num_generator_workers,
+            persistent_workers=self.persistent_workers,
         )
         # datagen queues do not get a result reporter because
         # a) we are less curious about how many records have
@@ -249,7 +333,16 @@ class Channel:
         # b) finding a queue type which is not prone to race conditions
         #    or perf slowdowns with "Process" task types (sub-processes)
         # is a challenge.
-        self.data_gen_q = WorkerQueue(data_gen_q_config, self.filesystem_lock)
+        #
+        # In direct_load mode the generators report their load results
+        # on the job_events queue, which works across processes and
+        # keeps each result ahead of the event for its job.
+        self.data_gen_q = WorkerQueue(
+            data_gen_q_config,
+            self.filesystem_lock,
+            self.job_events if self.direct_load else None,
+            self.job_events,
+        )
 
         load_data_q_config = WorkerQueueConfig(
             project_config=self.project_config,
@@ -264,12 +357,17 @@ class Channel:
             queue_size=LOAD_QUEUE_SIZE,
             num_workers=self.num_loader_workers,
             rename_directory=self.data_loader_new_directory_name,
+            persistent_workers=self.persistent_workers,
         )
         self.load_data_q = WorkerQueue(
-            load_data_q_config, self.filesystem_lock, self.results_reporter
+            load_data_q_config,
+            self.filesystem_lock,
+            self.results_reporter,
+            self.job_events,
         )
 
-        self.data_gen_q.feeds_data_to(self.load_data_q)
+        if not self.direct_load:
+            self.data_gen_q.feeds_data_to(self.load_data_q)
         return self.data_gen_q, self.load_data_q
 
     def data_loader_new_directory_name(self, working_directory):
@@ -345,8 +443,17 @@ class Channel:
                 "max_num_loader_workers": self.num_loader_workers,
                 "max_num_generator_workers": self.num_generator_workers,
                 # todo: use row-level result from org load for better accuracy
-                "sets_finished": set_count_from_names(self.load_data_q.outbox_jobs),
-                "sets_failed": len(self.load_data_q.failed_jobs),
+                "sets_finished": set_count_from_names(
+                    self.load_data_q.outbox_jobs
+                    + (self.data_gen_q.outbox_jobs if self.direct_load else [])
+                ),
+                # the queues can share a failures dir
+                "sets_failed": len(
+                    set(
+                        self.load_data_q.failed_jobs
+                        + (self.data_gen_q.failed_jobs if self.direct_load else [])
+                    )
+                ),
                 # TODO: are these two redundant?
                 "inprogress_generator_jobs": len(self.data_gen_q.inprogress_jobs),
                 "inprogress_loader_jobs": len(self.load_data_q.inprogress_jobs),
@@ -372,18 +479,35 @@ class Channel:
         self.data_gen_q.tick()
         with self.filesystem_lock:
             still_running = (
-                len(
-                    self.data_gen_q.workers
-                    + self.data_gen_q.queued_job_dirs
+                self.data_gen_q.num_busy_workers
+                + len(
+                    self.data_gen_q.queued_job_dirs
                     + self.data_gen_q.inprogress_jobs
-                    + self.load_data_q.workers
                     + self.load_data_q.inprogress_jobs
                     + self.load_data_q.queued_job_dirs
                 )
+                + self.load_data_q.num_busy_workers
                 > 0
             )
         return not still_running
 
+    def resize(self, num_generator_workers: int, num_loader_workers: int):
+        self.num_generator_workers = num_generator_workers
+        self.num_loader_workers = num_loader_workers
+        self.data_gen_q.resize(num_generator_workers)
+        self.load_data_q.resize(num_loader_workers)
+
+    def stats(self) -> dict:
+        return {
+            "org": self.org_config.name,
+            "data_gen": self.data_gen_q.stats(),
+            "data_load": self.load_data_q.stats(),
+        }
+
+    def close(self):
+        self.data_gen_q.close()
+        self.load_data_q.close()
+
 
 # TODO: This function is actually based on the number generated,
 #       because it is called before the load.
@@ -62,3 +62,14 @@ class SubtaskConfigurator:
             # don't need to pass loading_rules because they are merged into mapping
         }
         return options
+
+    def generate_and_load_opts(self, working_dir, recipe_options=None):
+        """Generate task options for a worker that generates and loads a portion"""
+        wd = SnowfakeryWorkingDirectory(working_dir)
+        return {
+            "database_file": str(wd.database_file),
+            "generator_options": self.data_generator_opts(
+                working_dir, recipe_options=recipe_options
+            ),
+            "loader_options": self.data_loader_opts(working_dir),
+        }
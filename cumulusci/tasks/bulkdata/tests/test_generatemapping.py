@@ -272,6 +272,7 @@ class TestMappingGenerator:
             assert ["Parent"] == t.mapping["Insert Child__c"]["lookups"]["Account__c"][
                 "table"
             ]
+            assert t.return_values == {"load_levels": [["Parent"], ["Child__c"]]}
 
     @responses.activate
     def test_collect_objects__simple_custom_objects(self):
@@ -768,6 +769,38 @@ class TestMappingGenerator:
 
         assert ["Account", "Contact", "Opportunity", "Custom__c"] == stack
 
+    def test_split_dependencies__levels(self):
+        t = _make_task(GenerateMapping, {"options": {"path": "t"}})
+
+        stack = t._split_dependencies(
+            ["Account", "Contact", "Lead", "Opportunity"],
+            {
+                "Contact": {"Account": {"AccountId": _Field("AccountId", {})}},
+                "Opportunity": {"Account": {"AccountId": _Field("AccountId", {})}},
+            },
+        )
+
+        assert ["Account", "Lead", "Contact", "Opportunity"] == stack
+        assert [["Account", "Lead"], ["Contact", "Opportunity"]] == t.load_levels
+
+    @mock.patch("click.prompt")
+    def test_split_dependencies__asks_only_about_cycles(self, prompt):
+        t = _make_task(GenerateMapping, {"options": {"path": "t"}})
+        prompt.return_value = "Contact"
+
+        # Account is waiting on the Contact/Custom__c cycle but is not in it
+        stack = t._split_dependencies(
+            ["Account", "Contact", "Custom__c"],
+            {
+                "Account": {"Contact": {"Contact__c": _Field("Contact__c", {})}},
+                "Contact": {"Custom__c": {"Custom__c": _Field("Custom__c", {})}},
+                "Custom__c": {"Contact": {"Contact__c": _Field("Contact__c", {})}},
+            },
+        )
+
+        assert ["Contact", "Account", "Custom__c"] == stack
+        assert ["Contact", "Custom__c"] == list(prompt.call_args.kwargs["type"].choices)
+
     @mock.patch("click.prompt")
     def test_split_dependencies__interviews_for_cycles(self, prompt):
         t = _make_task(GenerateMapping, {"options": {"path": "t"}})
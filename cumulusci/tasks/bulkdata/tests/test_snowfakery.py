@@ -1,3 +1,4 @@
+import json
 import re
 import typing as T
 from collections import Counter
@@ -19,6 +20,11 @@ from cumulusci.tasks.bulkdata.snowfakery import (
     Snowfakery,
     SnowfakeryWorkingDirectory,
 )
+from cumulusci.tasks.bulkdata.snowfakery_utils.autoscaler import (
+    BACKOFF_TICKS,
+    ChannelAutoscaler,
+)
+from cumulusci.tasks.bulkdata.snowfakery_utils.queue_manager import Channel
 from cumulusci.tasks.bulkdata.tests.integration_test_utils import ensure_accounts
 from cumulusci.tasks.bulkdata.tests.utils import _make_task
 from cumulusci.tasks.salesforce.BaseSalesforceApiTask import BaseSalesforceApiTask
@@ -158,6 +164,9 @@ def mock_load_data(
     ), mock.patch(
         "cumulusci.tasks.bulkdata.snowfakery_utils.queue_manager.LoadData",
         fake_load_data,
+    ), mock.patch(
+        "cumulusci.tasks.bulkdata.snowfakery_utils.generate_and_load_portion.LoadData",
+        fake_load_data,
     ):
         fake_load_data.reset()
 
@@ -352,6 +361,102 @@ class TestSnowfakery:
         for call in mock_load_data.mock_calls:
             assert call.task_config.config["options"]["drop_missing_schema"] is True
 
+    @mock.patch("cumulusci.tasks.bulkdata.snowfakery.MIN_PORTION_SIZE", 3)
+    def test_small__persistent_workers(
+        self, mock_load_data, threads_instead_of_processes, create_task_fixture
+    ):
+        task = create_task_fixture(
+            Snowfakery,
+            {
+                "recipe": sample_yaml,
+                "run_until_recipe_repeated": "13",
+                "num_processes": 2,
+                "persistent_workers": True,
+            },
+        )
+        task()
+        # one initial batch plus four parallel batches
+        assert len(mock_load_data.mock_calls) == 5, mock_load_data.mock_calls
+        # Both generators were started once and reused
+        assert len(threads_instead_of_processes.mock_calls) == 2
+        for call in threads_instead_of_processes.mock_calls:
+            assert call.kwargs["target"].__name__ == "run_jobs_in_worker"
+
+    @mock.patch("cumulusci.tasks.bulkdata.snowfakery.MIN_PORTION_SIZE", 3)
+    def test_small__direct_load(
+        self, mock_load_data, threads_instead_of_processes, create_task_fixture
+    ):
+        task = create_task_fixture(
+            Snowfakery,
+            {
+                "recipe": sample_yaml,
+                "run_until_recipe_repeated": "7",
+                "direct_load": True,
+            },
+        )
+        task()
+        # one initial batch plus two parallel batches
+        assert len(mock_load_data.mock_calls) == 3, mock_load_data.mock_calls
+        # generators load their own portions, without loader threads
+        assert len(threads_instead_of_processes.mock_calls) == 2
+        for call in mock_load_data.mock_calls[1:]:
+            assert call.options["database_url"].startswith("sqlite:///file:portion_")
+            assert call.values_loaded["Account"]
+        # the load results of the generators were counted
+        assert task.sobject_counts["Account"].successes == 2 + 3 + 2
+
+    @mock.patch("cumulusci.tasks.bulkdata.snowfakery.MIN_PORTION_SIZE", 3)
+    def test_small__direct_load_fails(
+        self, mock_load_data, threads_instead_of_processes, create_task_fixture
+    ):
+        # the first load is the initial batch; the second is in a generator
+        mock_load_data.reset(fake_exception_on_request=2)
+        task = create_task_fixture(
+            Snowfakery,
+            {
+                "recipe": sample_yaml,
+                "run_until_records_loaded": "Account:10",
+                "direct_load": True,
+            },
+        )
+        with mock.patch.object(task, "logger") as logger:
+            with pytest.raises(exc.BulkDataException, match="Errors exceeded"):
+                task()
+        # the generator's failed load was reported
+        assert "You asked me to raise an exception" in str(logger.mock_calls)
+
+    @mock.patch("cumulusci.tasks.bulkdata.snowfakery.MIN_PORTION_SIZE", 3)
+    def test_small__telemetry_and_autoscale(
+        self,
+        mock_load_data,
+        threads_instead_of_processes,
+        create_task_fixture,
+        tmp_path,
+    ):
+        telemetry_file = tmp_path / "telemetry.jsonl"
+        task = create_task_fixture(
+            Snowfakery,
+            {
+                "recipe": sample_yaml,
+                "run_until_recipe_repeated": "7",
+                "autoscale": True,
+                "telemetry_file": str(telemetry_file),
+            },
+        )
+        task()
+        assert len(mock_load_data.mock_calls) == 3, mock_load_data.mock_calls
+        assert task.queue_manager.autoscalers
+
+        records = [json.loads(line) for line in telemetry_file.read_text().splitlines()]
+        assert len(records) > 1
+        final = records[-1]
+        assert final["sobjects"]["Account"]["successes"] == 2 + 3 + 2
+        assert final["sets_loaded"] == final["sets_generated"] == 7
+        (channel,) = final["channels"]
+        assert channel["data_gen"]["queued_jobs"] == 0
+        assert channel["data_load"]["inprogress_jobs"] == 0
+        assert channel["data_load"]["average_job_seconds"] is not None
+
     @mock.patch("cumulusci.tasks.bulkdata.snowfakery.MIN_PORTION_SIZE", 3)
     def test_multi_part(
         self, threads_instead_of_processes, mock_load_data, create_task_fixture
@@ -1153,3 +1258,105 @@ class TestSnowfakery:
     #         self._run_snowfakery_and_inspect_mapping(
     #             generator_yaml=simple_snowfakery_yaml, loading_rules=str(loading_rules)
     #         )
+
+
+class FakeWorkerQueue:
+    def __init__(self, num_workers):
+        self.num_workers = num_workers
+        self.queued_jobs = []
+        self.busy = 0
+
+    @property
+    def num_free_workers(self):
+        return max(self.num_workers - self.busy, 0)
+
+    def resize(self, num_workers):
+        self.num_workers = num_workers
+
+
+class FakeChannel:
+    def __init__(self, num_generator_workers, num_loader_workers):
+        self.num_generator_workers = num_generator_workers
+        self.num_loader_workers = num_loader_workers
+        self.data_gen_q = FakeWorkerQueue(num_generator_workers)
+        self.load_data_q = FakeWorkerQueue(num_loader_workers)
+
+    def resize(self, num_generator_workers, num_loader_workers):
+        self.data_gen_q.resize(num_generator_workers)
+        self.load_data_q.resize(num_loader_workers)
+
+
+class TestChannel:
+    @pytest.mark.parametrize("direct_load,sets_failed", [(False, 1), (True, 2)])
+    def test_get_upload_status__failed_jobs(self, direct_load, sets_failed):
+        channel = Channel.__new__(Channel)
+        channel.filesystem_lock = Lock()
+        channel.num_generator_workers = channel.num_loader_workers = 1
+        channel.direct_load = direct_load
+        channel.data_gen_q = mock.Mock(
+            queued_jobs=[],
+            inprogress_jobs=[],
+            outbox_jobs=[],
+            failed_jobs=["1_3", "2_3"],
+            num_free_workers=1,
+        )
+        channel.load_data_q = mock.Mock(
+            queued_jobs=[], inprogress_jobs=[], outbox_jobs=[], failed_jobs=["1_3"]
+        )
+
+        status = channel.get_upload_status_for_channel()
+
+        # jobs in both queues' failures are only counted once
+        assert status["sets_failed"] == sets_failed
+
+
+class TestChannelAutoscaler:
+    def make_autoscaler(self, num_generator_workers=2, num_loader_workers=8):
+        channel = FakeChannel(num_generator_workers, num_loader_workers)
+        autoscaler = ChannelAutoscaler(channel, 4, mock.Mock())
+        return autoscaler, channel.data_gen_q, channel.load_data_q
+
+    def test_load_backlog__shifts_generators_to_loaders(self):
+        autoscaler, gen_q, load_q = self.make_autoscaler()
+        gen_q.busy, load_q.busy = 2, 8
+        load_q.queued_jobs = ["a", "b"]
+
+        assert autoscaler.adjust() == (
+            "Autoscaling (load backlog): 1 data generators, 12 loaders"
+        )
+        load_q.busy = 12
+        # the last generator is never given up
+        assert autoscaler.adjust() is None
+        assert (gen_q.num_workers, load_q.num_workers) == (1, 12)
+
+    def test_idle_loaders__shift_back_to_generators(self):
+        autoscaler, gen_q, load_q = self.make_autoscaler()
+        gen_q.busy, load_q.busy = 2, 8
+        load_q.queued_jobs = ["a"]
+        autoscaler.adjust()
+
+        gen_q.busy, load_q.busy = 1, 2
+        load_q.queued_jobs = []
+        assert autoscaler.adjust()
+        assert (gen_q.num_workers, load_q.num_workers) == (2, 8)
+        # never more generators than we started with
+        gen_q.busy = 2
+        assert autoscaler.adjust() is None
+
+    def test_lock_contention__backs_off_then_regrows(self):
+        autoscaler, gen_q, load_q = self.make_autoscaler()
+        assert "lock contention" in autoscaler.adjust(lock_errors=3)
+        assert load_q.num_workers == 4
+
+        gen_q.busy, load_q.busy = 2, 4
+        load_q.queued_jobs = ["a"]
+        for _ in range(BACKOFF_TICKS):
+            assert autoscaler.adjust() is None
+        assert load_q.num_workers == 4
+
+        # regrow the loaders before giving up generators
+        autoscaler.adjust()
+        assert (gen_q.num_workers, load_q.num_workers) == (2, 8)
+        load_q.busy = 8
+        autoscaler.adjust()
+        assert (gen_q.num_workers, load_q.num_workers) == (1, 12)
@@ -1,18 +1,29 @@
+import json
 import os
 import re
 import shutil
 import urllib.parse
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from logging import Logger, getLogger
 from pathlib import Path
+from typing import Dict, List, Optional
 
 import yaml
 
+from cumulusci import __version__
 from cumulusci.core.tasks import BaseTask
 from cumulusci.utils import elementtree_parse_file
 from cumulusci.utils.xml import metadata_tree
 
 __location__ = os.path.dirname(os.path.realpath(__file__))
 
+PACKAGE_XML_CACHE_FILENAME = "package_xml_cache.json"
+
+# Below this many files, starting worker processes costs more than it saves
+PARALLEL_PARSE_MIN_FILES = 200
+
 
 def metadata_sort_key(name):
     sections = []
@@ -44,6 +55,85 @@ class MetadataParserMissingError(Exception):
     pass
 
 
+@lru_cache()
+def load_metadata_map() -> dict:
+    """Returns the parser configuration for each metadata directory"""
+    with open(__location__ + "/metadata_map.yml", "r", encoding="utf-8") as f:
+        return yaml.safe_load(f)
+
+
+def package_xml_cache_file(project_config) -> Optional[Path]:
+    """Returns where to cache parsed metadata for a project, if it has a repo"""
+    if project_config.repo_root:
+        return project_config.cache_dir / PACKAGE_XML_CACHE_FILENAME
+
+
+class MetadataParseCache:
+    """Remembers the members that each metadata file contains, by metadata type.
+
+    An entry is only used while the file's size and modification time are
+    unchanged. If a path is given, the cache is loaded from and saved to it
+    so that files which haven't changed aren't parsed again on the next run."""
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = path
+        self.files = {}
+        self.changed = False
+        self._current = {}  # path -> (key, stat, entry) as of this run
+        if path and path.exists():
+            try:
+                cache = json.loads(path.read_text(encoding="utf-8"))
+            except ValueError:
+                cache = {}
+            # Parsers can change between versions
+            if cache.get("version") == __version__:
+                self.files = cache["files"]
+
+    def _lookup(self, path: str):
+        if path not in self._current:
+            key = os.path.abspath(path)
+            stat = os.stat(path)
+            stat = [stat.st_size, stat.st_mtime_ns]
+            entry = self.files.get(key)
+            if entry and entry["stat"] != stat:
+                entry = None
+            self._current[path] = (key, stat, entry)
+        return self._current[path]
+
+    def get(self, path: str, metadata_type: str) -> Optional[List[str]]:
+        entry = self._lookup(path)[2]
+        if entry:
+            return entry["members"].get(metadata_type)
+
+    def set(self, path: str, members: Dict[str, List[str]]):
+        key, stat, entry = self._lookup(path)
+        if not entry:
+            entry = self.files[key] = {"stat": stat, "members": {}}
+            self._current[path] = (key, stat, entry)
+        entry["members"].update(members)
+        self.changed = True
+
+    def save(self):
+        if not self.path or not self.changed:
+            return
+        self.files = {
+            path: entry for path, entry in self.files.items() if os.path.exists(path)
+        }
+        self.path.write_text(
+            json.dumps({"version": __version__, "files": self.files}), encoding="utf-8"
+        )
+        self.changed = False
+
+
+def parse_metadata_file(path: str, parsers: list) -> Dict[str, List[str]]:
+    """Parse a file once and return its members for each of the parsers.
+
+    This runs in worker processes when a lot of files need to be parsed."""
+    root = elementtree_parse_file(path)
+    item = os.path.basename(path)
+    return {parser.metadata_type: parser.get_members(root, item) for parser in parsers}
+
+
 class PackageXmlGenerator(object):
     def __init__(
         self,
@@ -56,11 +146,10 @@ class PackageXmlGenerator(object):
         uninstall_class=None,
         types=None,
         logger=None,
+        cache_file=None,
+        processes=None,
     ):
-        with open(
-            __location__ + "/metadata_map.yml", "r", encoding="utf-8"
-        ) as f_metadata_map:
-            self.metadata_map = yaml.safe_load(f_metadata_map)
+        self.metadata_map = load_metadata_map()
         self.directory = directory
         self.api_version = api_version
         self.package_name = package_name
@@ -70,6 +159,8 @@ class PackageXmlGenerator(object):
         self.uninstall_class = uninstall_class
         self.types = types or []
         self.logger = logger
+        self.cache = MetadataParseCache(cache_file)
+        self.processes = processes
 
     def __call__(self):
         if not self.types:
@@ -100,8 +191,41 @@ class PackageXmlGenerator(object):
                     self.logger,  # Logger
                     **options,  # Extra kwargs
                 )
+                if isinstance(parser, MetadataXmlElementParser):
+                    parser.cache = self.cache
                 self.types.append(parser)
 
+        self.parse_xml_files()
+        self.cache.save()
+
+    def parse_xml_files(self):
+        """Parse the XML files that aren't cached, in parallel if there are many.
+
+        Files are parsed once for all of the parsers that need them. The
+        parsers then read their members from the cache."""
+        parsers_by_path = defaultdict(list)
+        for parser in self.types:
+            if not isinstance(parser, MetadataXmlElementParser):
+                continue
+            for item in parser.list_items():
+                path = parser.directory + "/" + item
+                if self.cache.get(path, parser.metadata_type) is None:
+                    parsers_by_path[path].append(parser)
+        if not parsers_by_path:
+            return
+
+        paths = list(parsers_by_path)
+        parsers = [parsers_by_path[path] for path in paths]
+        if len(paths) >= PARALLEL_PARSE_MIN_FILES and self.processes != 1:
+            with ProcessPoolExecutor(self.processes) as executor:
+                results = list(
+                    executor.map(parse_metadata_file, paths, parsers, chunksize=50)
+                )
+        else:
+            results = map(parse_metadata_file, paths, parsers)
+        for path, members in zip(paths, results):
+            self.cache.set(path, members)
+
     def render_xml(self):
         lines = []
 
@@ -165,7 +289,11 @@ class BaseMetadataParser(object):
         return excludes
 
     def parse_items(self):
-        # Loop through items
+        for item in self.list_items():
+            self.parse_item(item)
+
+    def list_items(self):
+        """Yields the names of the files and directories to parse"""
         for item in sorted(os.listdir(self.directory)):
             # on Macs this file is generated by the OS. Shouldn't be in the package.xml
             if item.startswith("."):
@@ -184,7 +312,7 @@ class BaseMetadataParser(object):
             if self.check_delete_excludes(item):
                 continue
 
-            self.parse_item(item)
+            yield item
 
     def check_delete_excludes(self, item):
         if not self.delete:
@@ -348,15 +476,30 @@ class MetadataXmlElementParser(BaseMetadataParser):
         if not name_xpath:
             name_xpath = "./sf:fullName"
         self.name_xpath = name_xpath
+        self.cache: Optional[MetadataParseCache] = None
+
+    def __getstate__(self):
+        # Parsers are sent to worker processes without the cache
+        state = self.__dict__.copy()
+        state["cache"] = None
+        return state
 
     def _parse_item(self, item):
-        root = elementtree_parse_file(self.directory + "/" + item)
+        path = self.directory + "/" + item
+        if self.cache is not None:
+            members = self.cache.get(path, self.metadata_type)
+            if members is not None:
+                return members
+        return self.get_members(elementtree_parse_file(path), item)
+
+    def get_members(self, root, item):
+        """Returns the members found in the parsed file `item`"""
         members = []
 
         parent = self.strip_extension(item)
 
-        for item in self.get_item_elements(root):
-            members.append(self.get_item_name(item, parent))
+        for element in self.get_item_elements(root):
+            members.append(self.get_item_name(element, parent))
 
         return members
 
@@ -580,6 +723,7 @@ class UpdatePackageXml(BaseTask):
             uninstall_class=self.options.get(
                 "uninstall_class", self.project_config.project__package__uninstall_class
             ),
+            cache_file=package_xml_cache_file(self.project_config),
         )
 
     def _run_task(self):
@@ -1,3 +1,4 @@
+import json
 import os
 from unittest import mock
 
@@ -9,6 +10,7 @@ from cumulusci.core.config import (
     TaskConfig,
     UniversalConfig,
 )
+from cumulusci.tasks.metadata import package
 from cumulusci.tasks.metadata.package import (
     BaseMetadataParser,
     BundleParser,
@@ -19,6 +21,7 @@ from cumulusci.tasks.metadata.package import (
     LWCBundleParser,
     MetadataFilenameParser,
     MetadataFolderParser,
+    MetadataParseCache,
     MetadataParserMissingError,
     MetadataXmlElementParser,
     MissingNameElementError,
@@ -27,6 +30,7 @@ from cumulusci.tasks.metadata.package import (
     RecordTypeParser,
     UpdatePackageXml,
     metadata_sort_key,
+    package_xml_cache_file,
 )
 from cumulusci.utils import temporary_dir, touch
 
@@ -113,6 +117,104 @@ EXPECTED_MANAGED = """<?xml version="1.0" encoding="UTF-8"?>
 </Package>"""
 
 
+OBJECT_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<CustomObject xmlns="http://soap.sforce.com/2006/04/metadata">
+    <fields>
+        <fullName>{field}</fullName>
+    </fields>
+    <listViews>
+        <fullName>All</fullName>
+    </listViews>
+</CustomObject>
+"""
+
+
+def write_objects(path, count=2, field="Field__c"):
+    objects = path / "objects"
+    objects.mkdir(exist_ok=True)
+    for i in range(count):
+        (objects / f"Object{i}__c.object").write_text(OBJECT_XML.format(field=field))
+
+
+class TestPackageXmlGeneratorCache:
+    def test_cache(self, tmp_path):
+        src = tmp_path / "src"
+        src.mkdir()
+        write_objects(src)
+        cache_file = tmp_path / "cache.json"
+
+        with mock.patch.object(
+            package, "elementtree_parse_file", wraps=package.elementtree_parse_file
+        ) as parse:
+            expected = PackageXmlGenerator(str(src), "55.0", cache_file=cache_file)()
+            # each file is parsed once for all of the types in it
+            assert parse.call_count == 2
+            assert "<members>Object1__c.Field__c</members>" in expected
+            assert "<members>Object0__c.All</members>" in expected
+
+            parse.reset_mock()
+            assert (
+                PackageXmlGenerator(str(src), "55.0", cache_file=cache_file)()
+                == expected
+            )
+            parse.assert_not_called()
+
+            (src / "objects" / "Object1__c.object").write_text(
+                OBJECT_XML.format(field="Changed__c")
+            )
+            result = PackageXmlGenerator(str(src), "55.0", cache_file=cache_file)()
+            assert parse.call_count == 1
+            assert "<members>Object1__c.Changed__c</members>" in result
+
+    def test_cache__parallel(self, tmp_path):
+        write_objects(tmp_path, count=5)
+        expected = PackageXmlGenerator(str(tmp_path), "55.0")()
+
+        with mock.patch.object(package, "PARALLEL_PARSE_MIN_FILES", 2):
+            generator = PackageXmlGenerator(str(tmp_path), "55.0", processes=2)
+            assert generator() == expected
+
+        assert generator.cache.get(
+            str(tmp_path / "objects" / "Object4__c.object"), "CustomField"
+        ) == ["Object4__c.Field__c"]
+
+    def test_cache__other_version(self, tmp_path):
+        write_objects(tmp_path)
+        cache_file = tmp_path / "cache.json"
+        PackageXmlGenerator(str(tmp_path), "55.0", cache_file=cache_file)()
+        assert MetadataParseCache(cache_file).files
+
+        cache = json.loads(cache_file.read_text())
+        cache["version"] = "1.0"
+        cache_file.write_text(json.dumps(cache))
+        assert MetadataParseCache(cache_file).files == {}
+
+        cache_file.write_text("{")
+        assert MetadataParseCache(cache_file).files == {}
+
+    def test_cache__save_drops_missing_files(self, tmp_path):
+        write_objects(tmp_path)
+        cache_file = tmp_path / "cache.json"
+        PackageXmlGenerator(str(tmp_path), "55.0", cache_file=cache_file)()
+
+        (tmp_path / "objects" / "Object1__c.object").unlink()
+        cache = MetadataParseCache(cache_file)
+        cache.changed = True
+        cache.save()
+
+        assert list(json.loads(cache_file.read_text())["files"]) == [
+            str(tmp_path / "objects" / "Object0__c.object")
+        ]
+
+    def test_package_xml_cache_file(self, tmp_path):
+        project_config = mock.Mock(repo_root=str(tmp_path), cache_dir=tmp_path)
+        assert package_xml_cache_file(project_config) == tmp_path / (
+            "package_xml_cache.json"
+        )
+        project_config.repo_root = None
+        assert package_xml_cache_file(project_config) is None
+
+
 class TestBaseMetadataParser:
     def test_parse_items__skips_files(self):
         with temporary_dir() as path:
@@ -12,8 +12,12 @@ from cumulusci.salesforce_api.metadata import ApiRetrieveUnpackaged
 from cumulusci.tasks.metadata.package import PackageXmlGenerator
 from cumulusci.utils import inject_namespace
 from cumulusci.utils.xml import metadata_tree
+from cumulusci.utils.xml.metadata_stream import transform_children
 from cumulusci.utils.xml.metadata_tree import MetadataElement
 
+# Files at least this big are streamed by tasks which support it
+STREAMING_MIN_FILE_SIZE = 10 * 1024 * 1024
+
 
 class MetadataOperation(StrEnum):
     DEPLOY = "deploy"
@@ -272,11 +276,18 @@ class MetadataSingleEntityTransformTask(BaseMetadataTransformTask, metaclass=ABC
         should be deployed, or None to suppress deployment of this entity."""
         pass
 
-    def _transform(self):
-        # call _transform_entity once per retrieved entity
-        # if the entity is an XML file, provide a parsed version
-        # and write the returned metadata into the deploy directory
+    def _get_child_transforms(self, api_name):
+        """Optionally return the changes made by _transform_entity() as a
+        tuple of a dict mapping top-level tag names to functions that modify
+        one child in place, and a function to append new children (see
+        `metadata_stream.transform_children`), or None.
+
+        Tasks which implement this can transform large files without
+        loading them into memory."""
+        return None
 
+    def _get_entity_location(self):
+        """Return the directory and file extension of this task's entity."""
         parser = PackageXmlGenerator(
             None, self.api_version
         )  # We'll use it for its metadata_map
@@ -304,10 +315,9 @@ class MetadataSingleEntityTransformTask(BaseMetadataTransformTask, metaclass=ABC
                 f"MetadataSingleEntityTransformTask only supports manipulating complete, file-based XML entities (not {self.entity})"
             )
 
-        extension = configuration["extension"]
-        directory = entity_configurations[0]
-        source_metadata_dir = self.retrieve_dir / directory
+        return entity_configurations[0], configuration["extension"]
 
+    def _expand_api_names(self, source_metadata_dir, extension):
         if "*" in self.api_names:
             # Walk the retrieved directory to get the actual suite
             # of API names retrieved and rebuild our api_names list.
@@ -318,6 +328,14 @@ class MetadataSingleEntityTransformTask(BaseMetadataTransformTask, metaclass=ABC
                 if metadata_file.suffix == f".{extension}"
             )
 
+    def _transform(self):
+        # call _transform_entity once per retrieved entity
+        # if the entity is an XML file, provide a parsed version
+        # and write the returned metadata into the deploy directory
+        directory, extension = self._get_entity_location()
+        source_metadata_dir = self.retrieve_dir / directory
+        self._expand_api_names(source_metadata_dir, extension)
+
         removed_api_names = set()
 
         for api_name in self.api_names:
@@ -328,20 +346,16 @@ class MetadataSingleEntityTransformTask(BaseMetadataTransformTask, metaclass=ABC
             unquoted_api_name = unquote(api_name)
 
             path = source_metadata_dir / f"{api_name}.{extension}"
-            if not path.exists():
-                raise CumulusCIException(f"Cannot find metadata file {path}")
-
-            try:
-                tree = metadata_tree.parse(str(path))
-            except SyntaxError as err:
-                err.filename = path
-                raise err
+            parent_dir = self.deploy_dir / directory
+            destination_path = parent_dir / f"{api_name}.{extension}"
+            if self._stream_entity(path, destination_path, unquoted_api_name):
+                continue
+
+            tree = _parse_metadata_file(path)
             transformed_xml = self._transform_entity(tree, unquoted_api_name)
             if transformed_xml:
-                parent_dir = self.deploy_dir / directory
                 if not parent_dir.exists():
                     parent_dir.mkdir()
-                destination_path = parent_dir / f"{api_name}.{extension}"
 
                 with destination_path.open(mode="w", encoding="utf-8") as f:
                     f.write(transformed_xml.tostring(xml_declaration=True))
@@ -351,6 +365,35 @@ class MetadataSingleEntityTransformTask(BaseMetadataTransformTask, metaclass=ABC
 
         self.api_names = self.api_names - removed_api_names
 
+    def _stream_entity(self, source, destination, api_name):
+        """Transform a large file without parsing all of it at once, if
+        this task supports that. Returns True if the file was transformed."""
+        if not source.exists() or source.stat().st_size < STREAMING_MIN_FILE_SIZE:
+            return False
+        child_transforms = self._get_child_transforms(api_name)
+        if child_transforms is None:
+            return False
+
+        self.logger.info(f"Streaming {source.name}")
+        destination.parent.mkdir(exist_ok=True)
+        try:
+            transform_children(source, destination, *child_transforms)
+        except SyntaxError as err:
+            err.filename = source
+            raise err
+        return True
+
+
+def _parse_metadata_file(path):
+    if not path.exists():
+        raise CumulusCIException(f"Cannot find metadata file {path}")
+
+    try:
+        return metadata_tree.parse(str(path))
+    except SyntaxError as err:
+        err.filename = path
+        raise err
+
 
 class UpdateMetadataFirstChildTextTask(MetadataSingleEntityTransformTask):
     task_docs = """
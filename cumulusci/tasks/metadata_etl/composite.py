@@ -0,0 +1,178 @@
+from collections import defaultdict
+from urllib.parse import unquote
+
+from cumulusci.core.config import TaskConfig
+from cumulusci.core.exceptions import TaskOptionsError
+from cumulusci.tasks.metadata_etl.base import (
+    BaseMetadataETLTask,
+    BaseMetadataTransformTask,
+    MetadataSingleEntityTransformTask,
+    _parse_metadata_file,
+)
+
+# Methods that a step must not override, because the composite task
+# does their work for all of the steps at once
+STEP_METHODS = ("_generate_package_xml", "_get_package_xml_content", "_transform")
+
+
+class CompositeMetadataETLTask(BaseMetadataTransformTask):
+    task_docs = """
+Runs several Metadata ETL tasks with a single retrieve and a single deploy.
+
+Each step names a Metadata ETL task that transforms one entity type (a
+subclass of ``MetadataSingleEntityTransformTask``, such as
+``add_permission_set_perms`` or ``add_picklist_entries``) and, optionally,
+options for it. Tasks that retrieve extra metadata or transform it in
+their own way, such as ``update_admin_profile``, can't be steps. The metadata that all of the steps need is retrieved at
+once. The steps then transform the retrieved metadata in order, so a step
+sees the changes made by the steps before it, and everything that changed
+is deployed at once.
+
+Example
+-------
+
+.. code-block::  yaml
+
+  tasks:
+      configure_org_metadata:
+          class_path: cumulusci.tasks.metadata_etl.composite.CompositeMetadataETLTask
+          options:
+              steps:
+                  - task: add_permission_set_perms
+                    options:
+                        api_names: Custom_PermSet
+                        field_permissions: ...
+                  - task: add_picklist_entries
+                    options:
+                        picklists: Account.Type
+                        entries: ...
+"""
+
+    task_options = {
+        "steps": {
+            "description": "A list of steps, each with the name of a Metadata ETL "
+            "``task`` and optionally ``options`` for it. The task's options "
+            "from cumulusci.yml are used as defaults.",
+            "required": True,
+        },
+        **BaseMetadataETLTask.task_options,
+    }
+
+    def _init_options(self, kwargs):
+        super()._init_options(kwargs)
+
+        steps = self.options.get("steps")
+        if not steps or not isinstance(steps, list):
+            raise TaskOptionsError("The steps option must be a list of tasks")
+        self.steps = [self._init_step(step) for step in steps]
+        self.deploy_entities = None
+
+    def _init_step(self, step):
+        if isinstance(step, str):
+            step = {"task": step}
+        if not isinstance(step, dict) or "task" not in step:
+            raise TaskOptionsError(f"Each step needs a task name (not {step})")
+
+        task_config = self.project_config.get_task(step["task"])
+        task_class = task_config.get_class()
+        if not issubclass(task_class, MetadataSingleEntityTransformTask):
+            raise TaskOptionsError(
+                f"Task {step['task']} can't be a step: only Metadata ETL tasks "
+                "that transform a single metadata entity are supported."
+            )
+        # Steps share one retrieve and one transform loop, so a step can't
+        # retrieve extra metadata or transform it in its own way.
+        overridden = [
+            method
+            for method in STEP_METHODS
+            if getattr(task_class, method)
+            is not getattr(MetadataSingleEntityTransformTask, method)
+        ]
+        if overridden:
+            raise TaskOptionsError(
+                f"Task {step['task']} can't be a step: it customizes "
+                f"{', '.join(overridden)}."
+            )
+        # The steps share this task's namespace settings unless they override them
+        shared_options = {
+            option: self.options[option]
+            for option in (
+                "api_version",
+                "namespace_inject",
+                "managed",
+                "namespaced_org",
+            )
+            if self.options.get(option) is not None
+        }
+        options = {
+            **shared_options,
+            **(task_config.options or {}),
+            **(step.get("options") or {}),
+        }
+        task = task_class(
+            task_config.project_config or self.project_config,
+            TaskConfig({**task_config.config, "options": options}),
+            self.org_config,
+            logger=self.logger,
+        )
+        return step["task"], task
+
+    def _init_task(self):
+        super()._init_task()
+        # Some steps talk to the org after the deploy
+        for _, task in self.steps:
+            task._init_task()
+
+    def _get_entities(self):
+        """Return the entities of all the steps, or the ones to deploy once known"""
+        if self.deploy_entities is not None:
+            return self.deploy_entities
+
+        entities = defaultdict(set)
+        for _, task in self.steps:
+            for entity, api_names in task._get_entities().items():
+                entities[entity].update(api_names)
+        return {
+            entity: {"*"} if "*" in api_names else api_names
+            for entity, api_names in entities.items()
+        }
+
+    def _transform(self):
+        # Every file is parsed once and transformed by each step in turn.
+        trees = {}
+        changed = {}  # path -> (entity, directory, api_name)
+        step_results = []
+
+        for number, (name, task) in enumerate(self.steps, start=1):
+            self.logger.info(f"Step {number}/{len(self.steps)}: {name}")
+            directory, extension = task._get_entity_location()
+            source_metadata_dir = self.retrieve_dir / directory
+            task._expand_api_names(source_metadata_dir, extension)
+
+            transformed_api_names = []
+            for api_name in sorted(task.api_names):
+                path = source_metadata_dir / f"{api_name}.{extension}"
+                if path not in trees:
+                    trees[path] = _parse_metadata_file(path)
+                transformed_xml = task._transform_entity(trees[path], unquote(api_name))
+                if transformed_xml:
+                    trees[path] = transformed_xml
+                    changed.setdefault(path, (task.entity, directory, api_name))
+                    transformed_api_names.append(unquote(api_name))
+            step_results.append(
+                {"task": name, "entity": task.entity, "changed": transformed_api_names}
+            )
+
+        self.deploy_entities = defaultdict(set)
+        for path, (entity, directory, api_name) in changed.items():
+            self.deploy_entities[entity].add(api_name)
+            destination_path = self.deploy_dir / directory / path.name
+            destination_path.parent.mkdir(exist_ok=True)
+            destination_path.write_text(
+                trees[path].tostring(xml_declaration=True), encoding="utf-8"
+            )
+        self.return_values = {"steps": step_results}
+
+    def _post_deploy(self, result):
+        for _, task in self.steps:
+            task._post_deploy(result)
@@ -233,6 +233,72 @@ class TestMetadataSingleEntityTransformTask:
 
             assert len(task._transform_entity.call_args_list) == 1
 
+    @mock.patch("cumulusci.tasks.metadata_etl.base.STREAMING_MIN_FILE_SIZE", 0)
+    def test_transform__streaming(self):
+        task = create_task(
+            ConcreteMetadataSingleEntityTransformTask,
+            {"managed": False, "api_version": "47.0", "api_names": "Test,Other"},
+        )
+
+        task.entity = "CustomApplication"
+        task._transform_entity = mock.Mock(side_effect=lambda tree, api_name: tree)
+
+        def set_label(label):
+            label.text = "Changed"
+
+        def get_child_transforms(api_name):
+            if api_name == "Test":
+                return {"label": set_label}, None
+
+        task._get_child_transforms = get_child_transforms
+
+        input_xml = """<?xml version="1.0" encoding="UTF-8"?>
+<CustomApplication xmlns="http://soap.sforce.com/2006/04/metadata">
+    <label>Test</label>
+</CustomApplication>
+"""
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            task._create_directories(tmpdir)
+
+            test_path = task.retrieve_dir / "applications"
+            test_path.mkdir()
+            (test_path / "Test.app").write_text(input_xml)
+            (test_path / "Other.app").write_text(input_xml)
+
+            task._transform()
+
+            # only tasks with child transforms stream
+            task._transform_entity.assert_called_once()
+            assert task._transform_entity.call_args[0][1] == "Other"
+            output = task.deploy_dir / "applications"
+            assert (output / "Test.app").read_text() == input_xml.replace(
+                ">Test<", ">Changed<"
+            )
+            assert (output / "Other.app").read_text() == input_xml
+
+    @mock.patch("cumulusci.tasks.metadata_etl.base.STREAMING_MIN_FILE_SIZE", 0)
+    def test_transform__streaming_parse_error(self):
+        task = create_task(
+            ConcreteMetadataSingleEntityTransformTask,
+            {"managed": False, "api_version": "47.0", "api_names": "Test"},
+        )
+
+        task.entity = "CustomApplication"
+        task._get_child_transforms = mock.Mock(return_value=({}, None))
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            task._create_directories(tmpdir)
+
+            test_path = task.retrieve_dir / "applications"
+            test_path.mkdir()
+            test_path = test_path / "Test.app"
+
+            test_path.write_text(">>>>>NOT XML<<<<<")
+            with pytest.raises(etree.ParseError) as e:
+                task._transform()
+            assert e.value.filename == test_path
+
     def test_transform__bad_entity(self):
         task = create_task(
             ConcreteMetadataSingleEntityTransformTask,
@@ -0,0 +1,182 @@
+import tempfile
+from unittest import mock
+
+import pytest
+
+from cumulusci.core.exceptions import CumulusCIException, TaskOptionsError
+from cumulusci.tasks.metadata_etl.composite import CompositeMetadataETLTask
+from cumulusci.tasks.salesforce.tests.util import create_task
+from cumulusci.utils.xml import metadata_tree
+
+OBJECT_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<CustomObject xmlns="http://soap.sforce.com/2006/04/metadata">
+    <label>Test</label>
+</CustomObject>
+"""
+
+
+def first_child_step(api_names, tag, value):
+    return {
+        "task": "update_metadata_first_child_text",
+        "options": {
+            "metadata_type": "CustomObject",
+            "api_names": api_names,
+            "tag": tag,
+            "value": value,
+        },
+    }
+
+
+STEPS = [
+    first_child_step("Test__c", "compactLayoutAssignment", "Compact"),
+    first_child_step("Test__c,Other__c", "description", "Changed"),
+]
+
+
+class TestCompositeMetadataETLTask:
+    def test_init_options(self):
+        task = create_task(
+            CompositeMetadataETLTask,
+            {"steps": STEPS, "api_version": "47.0", "managed": False},
+        )
+
+        assert [name for name, _ in task.steps] == [
+            "update_metadata_first_child_text",
+            "update_metadata_first_child_text",
+        ]
+        assert task.steps[1][1].options["tag"] == "description"
+        assert task.steps[1][1].logger is task.logger
+
+    def test_init_options__invalid(self):
+        with pytest.raises(TaskOptionsError, match="must be a list"):
+            create_task(CompositeMetadataETLTask, {"steps": "deploy"})
+        with pytest.raises(TaskOptionsError, match="needs a task name"):
+            create_task(CompositeMetadataETLTask, {"steps": [{"options": {}}]})
+        with pytest.raises(TaskOptionsError, match="Task deploy can't be a step"):
+            create_task(CompositeMetadataETLTask, {"steps": ["deploy"]})
+
+    def test_init_options__profile_step(self):
+        # The admin profile task retrieves the objects, classes and tabs
+        # it grants access to along with the profile.
+        with pytest.raises(
+            TaskOptionsError,
+            match="Task update_admin_profile can't be a step: "
+            "it customizes _generate_package_xml",
+        ):
+            create_task(
+                CompositeMetadataETLTask,
+                {"steps": STEPS + ["update_admin_profile"], "api_version": "47.0"},
+            )
+
+    def test_get_entities(self):
+        task = create_task(
+            CompositeMetadataETLTask,
+            {
+                "steps": STEPS
+                + [
+                    {
+                        "task": "add_permission_set_perms",
+                        "options": {"api_names": "PS1"},
+                    }
+                ],
+                "api_version": "47.0",
+            },
+        )
+
+        assert task._get_entities() == {
+            "CustomObject": {"Test__c", "Other__c"},
+            "PermissionSet": {"PS1"},
+        }
+
+    def test_get_entities__wildcard(self):
+        task = create_task(
+            CompositeMetadataETLTask,
+            {"steps": STEPS + [first_child_step("*", "description", "All")]},
+        )
+
+        assert task._get_entities() == {"CustomObject": {"*"}}
+
+    def test_transform(self):
+        task = create_task(
+            CompositeMetadataETLTask,
+            {"steps": STEPS, "api_version": "47.0", "managed": False},
+        )
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            task._create_directories(tmpdir)
+            objects = task.retrieve_dir / "objects"
+            objects.mkdir()
+            (objects / "Test__c.object").write_text(OBJECT_XML)
+            (objects / "Other__c.object").write_text(OBJECT_XML)
+
+            with mock.patch.object(
+                metadata_tree, "parse", wraps=metadata_tree.parse
+            ) as parse:
+                task._transform()
+
+            # each file is parsed once, even though two steps change it
+            assert parse.call_count == 2
+            tree = metadata_tree.parse(str(task.deploy_dir / "objects/Test__c.object"))
+            assert tree.compactLayoutAssignment.text == "Compact"
+            assert tree.description.text == "Changed"
+            assert (task.deploy_dir / "objects/Other__c.object").exists()
+
+        assert task._get_entities() == {"CustomObject": {"Test__c", "Other__c"}}
+        assert task.return_values == {
+            "steps": [
+                {
+                    "task": "update_metadata_first_child_text",
+                    "entity": "CustomObject",
+                    "changed": ["Test__c"],
+                },
+                {
+                    "task": "update_metadata_first_child_text",
+                    "entity": "CustomObject",
+                    "changed": ["Other__c", "Test__c"],
+                },
+            ]
+        }
+
+    def test_transform__missing_file(self):
+        task = create_task(
+            CompositeMetadataETLTask,
+            {"steps": STEPS, "api_version": "47.0", "managed": False},
+        )
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            task._create_directories(tmpdir)
+            (task.retrieve_dir / "objects").mkdir()
+
+            with pytest.raises(CumulusCIException, match="Cannot find metadata file"):
+                task._transform()
+
+    @mock.patch("cumulusci.tasks.salesforce.Deploy")
+    @mock.patch("cumulusci.tasks.metadata_etl.base.ApiRetrieveUnpackaged")
+    def test_run_task(self, retrieve_mock, deploy_mock):
+        task = create_task(
+            CompositeMetadataETLTask,
+            {"steps": STEPS, "api_version": "47.0", "managed": False},
+        )
+
+        def extractall(path):
+            objects = path / "objects"
+            objects.mkdir()
+            (objects / "Test__c.object").write_text(OBJECT_XML)
+            (objects / "Other__c.object").write_text(OBJECT_XML)
+
+        retrieve_mock.return_value.return_value.extractall.side_effect = extractall
+        for _, step in task.steps:
+            step._post_deploy = mock.Mock()
+
+        task()
+
+        retrieve_mock.assert_called_once()
+        package_xml = retrieve_mock.call_args[0][1]
+        assert "<members>Other__c</members>" in package_xml
+        assert "<members>Test__c</members>" in package_xml
+        deploy_mock.assert_called_once()
+        deploy_mock.return_value.assert_called_once_with()
+        for _, step in task.steps:
+            step._post_deploy.assert_called_once_with(
+                deploy_mock.return_value.return_value
+            )
@@ -1,5 +1,9 @@
 import json
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from functools import lru_cache
+from pathlib import Path
 
 from simple_salesforce import SalesforceMalformedRequest
 
@@ -19,6 +23,66 @@ def batch_list(data, batch_size):
     return batch_list
 
 
+class PushScheduleLedger(object):
+    """Records which orgs have been added to a push request in a file,
+    so that scheduling can be resumed after an interruption
+    without adding the same orgs again.
+
+    Each line of the file is a JSON object. The first names the push request,
+    and each of the others lists the orgs of one batch which were scheduled
+    or skipped as invalid."""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.request_id = None
+        self.version = None
+        self.scheduled_orgs = set()
+        self.invalid_orgs = set()
+        self._lock = threading.Lock()
+        if self.path.exists():
+            self._load()
+
+    def _load(self):
+        text = self.path.read_text(encoding="utf-8")
+        for line in text.splitlines():
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                # A batch which was being recorded when scheduling was
+                # interrupted. Its orgs are added again.
+                continue
+            if "request_id" in entry:
+                self.request_id = entry["request_id"]
+                self.version = entry["version"]
+            else:
+                self.scheduled_orgs.update(entry["scheduled"])
+                self.invalid_orgs.update(entry["invalid"])
+        if not text.endswith("\n"):
+            # Start the next batch on a new line
+            with self.path.open("a", encoding="utf-8") as f:
+                f.write("\n")
+
+    def start(self, request_id, version):
+        self.request_id = request_id
+        self.version = version
+        self.scheduled_orgs = set()
+        self.invalid_orgs = set()
+        self.path.write_text(
+            json.dumps({"request_id": request_id, "version": version}) + "\n",
+            encoding="utf-8",
+        )
+
+    def record_batch(self, scheduled, invalid):
+        with self._lock:
+            self.scheduled_orgs.update(scheduled)
+            self.invalid_orgs.update(invalid)
+            with self.path.open("a", encoding="utf-8") as f:
+                f.write(
+                    json.dumps({"scheduled": list(scheduled), "invalid": list(invalid)})
+                    + "\n"
+                )
+
+
 class BasePushApiObject(object):
     def format_where(self, id_field, where=None):
         base_where = "%s = '%s'" % (id_field, self.sf_id)
@@ -246,7 +310,14 @@ class SalesforcePushApi(object):
     """API Wrapper for the Salesforce Push API"""
 
     def __init__(
-        self, sf, logger, lazy=None, default_where=None, batch_size=None, bulk=None
+        self,
+        sf,
+        logger,
+        lazy=None,
+        default_where=None,
+        batch_size=None,
+        bulk=None,
+        concurrency=None,
     ):
         self.sf = sf
         self.logger = logger
@@ -265,6 +336,11 @@ class SalesforcePushApi(object):
 
         self.bulk = bulk
 
+        # How many batches of orgs are added to a push request at once
+        if not concurrency:
+            concurrency = 1
+        self.concurrency = concurrency
+
     def return_query_records(self, query, field_names=None, sobject=None):
         res = []
         if self.bulk and field_names and sobject:
@@ -553,42 +629,108 @@ class SalesforcePushApi(object):
             push_errors[push_error.sf_id] = push_error
         return push_errors
 
-    def create_push_request(self, version, orgs, start):
+    def get_push_request_job_results(self, push_request):
+        """Fetch the jobs of a push request with their errors.
+
+        Rather than querying the errors of each job, this runs one query
+        for the jobs and one for the errors, and joins them in memory.
+        The jobs are not linked to their subscriber orgs (`org` is None),
+        which saves a query per org that the results report does not need.
 
-        # Create the request
-        res = self.sf.PackagePushRequest.create(
-            {
-                "PackageVersionId": version,
-                "ScheduledStartTime": start.isoformat(timespec="seconds"),
-            }
+        Returns the jobs and a dict of lists of errors by job id."""
+        request_id = push_request.sf_id
+        jobs = self.get_push_jobs(f"PackagePushRequestId = '{request_id}'")
+        errors = self.get_push_errors(
+            "PackagePushJobId IN (SELECT Id FROM PackagePushJob "
+            f"WHERE PackagePushRequestId = '{request_id}')"
         )
-        request_id = res["id"]
+
+        push_jobs = {}
+        for job in jobs:
+            push_jobs[job["Id"]] = PackagePushJob(
+                push_api=self,
+                request=push_request,
+                org=None,
+                status=job["Status"],
+                sf_id=job["Id"],
+            )
+
+        errors_by_job_id = defaultdict(list)
+        for push_error in errors:
+            job_id = push_error["PackagePushJobId"]
+            errors_by_job_id[job_id].append(
+                PackagePushError(
+                    push_api=self,
+                    job=push_jobs.get(job_id),
+                    severity=push_error["ErrorSeverity"],
+                    error_type=push_error["ErrorType"],
+                    title=push_error["ErrorTitle"],
+                    message=push_error["ErrorMessage"],
+                    details=push_error["ErrorDetails"],
+                    sf_id=push_error["Id"],
+                )
+            )
+        return list(push_jobs.values()), errors_by_job_id
+
+    def create_push_request(self, version, orgs, start, ledger_path=None):
+        ledger = PushScheduleLedger(ledger_path) if ledger_path else None
+        if ledger and ledger.request_id and ledger.version == version:
+            request_id = ledger.request_id
+            self.logger.info(
+                "Resuming scheduling of push request {} ({} orgs already added)".format(
+                    request_id, len(ledger.scheduled_orgs)
+                )
+            )
+        else:
+            # Create the request
+            res = self.sf.PackagePushRequest.create(
+                {
+                    "PackageVersionId": version,
+                    "ScheduledStartTime": start.isoformat(timespec="seconds"),
+                }
+            )
+            request_id = res["id"]
+            if ledger:
+                ledger.start(request_id, version)
 
         # remove duplicates
         n_orgs_pre = len(orgs)
         self.logger.info("Found {} orgs".format(n_orgs_pre))
-        orgs = set(orgs)
+        orgs = list(dict.fromkeys(orgs))
         if len(orgs) < n_orgs_pre:
             self.logger.warning(
                 "Removed {} duplicate orgs ({} remain)".format(
                     n_orgs_pre - len(orgs), len(orgs)
                 )
             )
+        scheduled_orgs = 0
+        if ledger:
+            done_orgs = ledger.scheduled_orgs | ledger.invalid_orgs
+            orgs = [org for org in orgs if org not in done_orgs]
+            scheduled_orgs = len(ledger.scheduled_orgs)
 
         # Schedule the orgs
         batches = batch_list(orgs, self.batch_size)
-        scheduled_orgs = 0
-        for batch_num, batch in enumerate(batches):
+
+        def add_batch(batch_num, batch):
             self.logger.info(
                 "Batch {} of {}: Attempting to add {} orgs".format(
                     batch_num + 1, len(batches), len(batch)
                 )
             )
-            valid_batch = self._add_batch(batch, request_id)
-            scheduled_orgs += len(valid_batch)
+            valid_batch = self._add_batch(list(batch), request_id)
             self.logger.info(
                 "{} orgs successfully added to batch".format(len(valid_batch))
             )
+            if ledger:
+                valid_orgs = set(valid_batch)
+                ledger.record_batch(
+                    valid_batch, [org for org in batch if org not in valid_orgs]
+                )
+            return len(valid_batch)
+
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            scheduled_orgs += sum(executor.map(add_batch, range(len(batches)), batches))
         self.logger.info(
             "Push request {} is populated with {} orgs".format(
                 request_id, scheduled_orgs
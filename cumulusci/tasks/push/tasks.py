@@ -126,7 +126,12 @@ class BaseSalesforcePushTask(BaseSalesforceApiTask):
         success_jobs = []
         canceled_jobs = []
 
-        jobs = self.push_request.get_push_job_objs()
+        # Fetch all the jobs and errors at once (using the Bulk API)
+        # instead of querying the errors of each failed job.
+        push_results = SalesforcePushApi(self.sf, self.logger, bulk=self.bulk)
+        jobs, errors_by_job_id = push_results.get_push_request_job_results(
+            self.push_request
+        )
         for job in jobs:
             if job.status == "Failed":
                 failed_jobs.append(job)
@@ -143,8 +148,7 @@ class BaseSalesforcePushTask(BaseSalesforceApiTask):
 
         failed_by_error = {}
         for job in failed_jobs:
-            errors = job.get_push_error_objs()
-            for error in errors:
+            for error in errors_by_job_id.get(job.sf_id, []):
                 error_key = (
                     error.error_type,
                     error.title,
@@ -241,11 +245,29 @@ class SchedulePushOrgList(BaseSalesforcePushTask):
                 + " Defaults to 200."
             )
         },
+        "concurrency": {
+            "description": (
+                "The number of batches of orgs to add to the push request at once."
+                + " Defaults to 1."
+            )
+        },
+        "ledger_file": {
+            "description": (
+                "Path to a file which records the orgs added to the push request."
+                + " If scheduling is interrupted, running the task again with the"
+                + " same file resumes the same push request with the remaining orgs."
+            )
+        },
     }
 
     def _init_task(self):
         super(SchedulePushOrgList, self)._init_task()
-        self.push = SalesforcePushApi(self.sf, self.logger, self.options["batch_size"])
+        self.push = SalesforcePushApi(
+            self.sf,
+            self.logger,
+            batch_size=self.options["batch_size"],
+            concurrency=self.options["concurrency"],
+        )
 
     def _init_options(self, kwargs):
         super(SchedulePushOrgList, self)._init_options(kwargs)
@@ -266,9 +288,18 @@ class SchedulePushOrgList(BaseSalesforcePushTask):
             ] = self.project_config.project__package__metadata_package_id
         if "batch_size" not in self.options:
             self.options["batch_size"] = 200
+        self._init_concurrency_option()
         if "csv" not in self.options and "csv_field_name" in self.options:
             raise TaskOptionsError("Please provide a csv file for this task to run.")
 
+    def _init_concurrency_option(self):
+        try:
+            self.options["concurrency"] = int(self.options.get("concurrency") or 1)
+        except ValueError:
+            raise TaskOptionsError(f"Invalid concurrency {self.options['concurrency']}")
+        if self.options["concurrency"] < 1:
+            raise TaskOptionsError("concurrency must be at least 1")
+
     def _get_orgs(self):
         if "csv" in self.options:
             with open(self.options.get("csv"), newline="", encoding="utf-8") as csvfile:
@@ -323,7 +354,7 @@ class SchedulePushOrgList(BaseSalesforcePushTask):
             return
 
         self.request_id, num_scheduled_orgs = self.push.create_push_request(
-            version, orgs, start_time
+            version, orgs, start_time, ledger_path=self.options.get("ledger_file")
         )
 
         self.return_values["request_id"] = self.request_id
@@ -395,6 +426,19 @@ class SchedulePushOrgQuery(SchedulePushOrgList):
         "dry_run": {
             "description": "If True, log how many orgs were selected but skip creating a PackagePushRequest.  Defaults to False"
         },
+        "concurrency": {
+            "description": (
+                "The number of batches of orgs to add to the push request at once."
+                + " Defaults to 1."
+            )
+        },
+        "ledger_file": {
+            "description": (
+                "Path to a file which records the orgs added to the push request."
+                + " If scheduling is interrupted, running the task again with the"
+                + " same file resumes the same push request with the remaining orgs."
+            )
+        },
     }
 
     def _init_options(self, kwargs):
@@ -405,6 +449,7 @@ class SchedulePushOrgQuery(SchedulePushOrgList):
             self.options["namespace"] = self.project_config.project__package__namespace
         if "batch_size" not in self.options:
             self.options["batch_size"] = 200
+        self._init_concurrency_option()
         self.options["dry_run"] = process_bool_arg(self.options.get("dry_run", False))
 
     def _get_orgs(self):
@@ -13,6 +13,7 @@ from cumulusci.tasks.push.push_api import (
     PackagePushJob,
     PackagePushRequest,
     PackageSubscriber,
+    PushScheduleLedger,
     SalesforcePushApi,
     batch_list,
 )
@@ -532,6 +533,50 @@ def test_sf_push_get_push_errors_by_id(sf_push_api, package_push_error):
     assert push_error_expected == push_error_result
 
 
+def test_sf_push_get_push_request_job_results(sf_push_api, package_push_request):
+    sf_push_api.get_push_jobs = mock.Mock(
+        return_value=[
+            {"Id": "job1", "SubscriberOrganizationKey": "bar", "Status": "Failed"},
+            {"Id": "job2", "SubscriberOrganizationKey": "baz", "Status": "Failed"},
+            {"Id": "job3", "SubscriberOrganizationKey": "qux", "Status": "Succeeded"},
+        ]
+    )
+    sf_push_api.get_push_errors = mock.Mock(
+        return_value=[
+            {
+                "Id": "error1",
+                "PackagePushJobId": "job1",
+                "ErrorSeverity": "Error",
+                "ErrorType": "bar",
+                "ErrorTitle": "foo_bar",
+                "ErrorMessage": "The foo hit the bar",
+                "ErrorDetails": "",
+            }
+        ]
+    )
+    sf_push_api.get_subscriber_objs = mock.Mock()
+
+    jobs, errors_by_job_id = sf_push_api.get_push_request_job_results(
+        package_push_request
+    )
+
+    sf_push_api.get_push_jobs.assert_called_once_with(
+        f"PackagePushRequestId = '{SF_ID}'"
+    )
+    sf_push_api.get_push_errors.assert_called_once_with(
+        "PackagePushJobId IN (SELECT Id FROM PackagePushJob "
+        f"WHERE PackagePushRequestId = '{SF_ID}')"
+    )
+    sf_push_api.get_subscriber_objs.assert_not_called()
+    assert [job.sf_id for job in jobs] == ["job1", "job2", "job3"]
+    assert [job.status for job in jobs] == ["Failed", "Failed", "Succeeded"]
+    assert jobs[0].org is None
+    assert jobs[0].request is package_push_request
+    assert list(errors_by_job_id) == ["job1"]
+    assert errors_by_job_id["job1"][0].title == "foo_bar"
+    assert errors_by_job_id["job1"][0].job is jobs[0]
+
+
 def test_sf_push_cancel_push_request(sf_push_api):
     ref_id = "12"
     sf_push_api.cancel_push_request(ref_id)
@@ -576,6 +621,58 @@ def test_sf_push_create_push_request(sf_push_api, metadata_package_version):
     assert 2 == actual_org_count
 
 
+def test_sf_push_create_push_request__concurrent(sf_push_api):
+    sf_push_api.batch_size = 2
+    sf_push_api.concurrency = 3
+    orgs = [f"00D00000000000{i}" for i in range(5)]
+    sf_push_api.sf.PackagePushRequest.create.return_value = {"id": "0DV1"}
+    # The second org of each batch is invalid
+    sf_push_api._add_batch = mock.Mock(side_effect=lambda batch, request_id: batch[:1])
+
+    request_id, org_count = sf_push_api.create_push_request(
+        "04t1", orgs + orgs[:1], datetime.datetime.now()
+    )
+
+    assert request_id == "0DV1"
+    assert org_count == 3
+    assert sorted(call.args[0] for call in sf_push_api._add_batch.call_args_list) == [
+        orgs[0:2],
+        orgs[2:4],
+        orgs[4:],
+    ]
+
+
+def test_sf_push_create_push_request__ledger(sf_push_api, tmp_path):
+    ledger_path = tmp_path / "push_ledger.jsonl"
+    sf_push_api.batch_size = 2
+    orgs = ["00D000000001", "00D000000002", "00D000000003", "00D000000004"]
+    sf_push_api.sf.PackagePushRequest.create.return_value = {"id": "0DV1"}
+    sf_push_api._add_batch = mock.Mock(
+        side_effect=[[orgs[0]], KeyboardInterrupt, orgs[2:]]
+    )
+
+    with pytest.raises(KeyboardInterrupt):
+        sf_push_api.create_push_request(
+            "04t1", orgs, datetime.datetime.now(), ledger_path=ledger_path
+        )
+    ledger = PushScheduleLedger(ledger_path)
+    assert ledger.request_id == "0DV1"
+    assert ledger.scheduled_orgs == {orgs[0]}
+    assert ledger.invalid_orgs == {orgs[1]}
+
+    # Resuming adds only the remaining orgs to the same request
+    with ledger_path.open("a") as f:
+        f.write('{"scheduled": ["00D0')
+    request_id, org_count = sf_push_api.create_push_request(
+        "04t1", orgs, datetime.datetime.now(), ledger_path=ledger_path
+    )
+
+    sf_push_api.sf.PackagePushRequest.create.assert_called_once()
+    sf_push_api._add_batch.assert_called_with(orgs[2:], "0DV1")
+    assert request_id == "0DV1"
+    assert org_count == 3
+
+
 def test_sf_push_add_push_batch(sf_push_api, metadata_package_version):
     push_request_id = "0DV?xxxxxx?"
     metadata_package_version.sf_id = "0KM?xxxxx?"
@@ -353,8 +353,24 @@ def test_schedule_push_org_list_init_options(org_file):
     task._init_task()
     assert task.options["namespace"] == task.project_config.project__package__namespace
     assert task.options["batch_size"] == 200
+    assert task.options["concurrency"] == 1
     assert task.options["orgs"] == ORG_FILE
     assert task.options["version"] == VERSION
+    assert task.push.batch_size == 200
+    assert task.push.concurrency == 1
+
+
+@pytest.mark.parametrize("concurrency", ["0", "many"])
+def test_schedule_push_org_list_init_options__bad_concurrency(org_file, concurrency):
+    with pytest.raises(TaskOptionsError, match="concurrency"):
+        create_task(
+            SchedulePushOrgList,
+            options={
+                "orgs": ORG_FILE,
+                "version": VERSION,
+                "concurrency": concurrency,
+            },
+        )
 
 
 # Should set csv_field_name to OrganizationId by default
@@ -432,14 +448,27 @@ def test_get_push_request_job_results(
     task.sf = mock.MagicMock()
     task.push_report = mock.MagicMock()
     task.push_request = mock.MagicMock()
-    task.push_request.get_push_job_objs.return_value = [
-        package_push_job_success,
-        package_push_job_failure,
-        package_push_job_cancel,
-    ]
-    task._get_push_request_job_results()
-    task.push_request.get_push_job_objs.assert_called_once()
+    task.bulk = mock.Mock()
+    error = mock.Mock(
+        error_type="ApexTestFailure", title="Boom", message="Failed", details=""
+    )
+    with mock.patch.object(
+        SalesforcePushApi,
+        "get_push_request_job_results",
+        return_value=(
+            [
+                package_push_job_success,
+                package_push_job_failure,
+                package_push_job_cancel,
+            ],
+            {package_push_job_failure.sf_id: [error]},
+        ),
+    ) as get_results:
+        task._get_push_request_job_results()
+    get_results.assert_called_once_with(task.push_request)
     assert "Push complete: 1 succeeded, 1 failed, 1 canceled" in caplog.text
+    assert "1 failed with..." in caplog.text
+    assert "Title = Boom" in caplog.text
 
 
 def test_schedule_push_org_query_get_org_error():
@@ -575,6 +604,7 @@ def test_schedule_push_org_list_run_task_with_isofmt_assertion(org_file):
         mock.ANY,
         ["00DS0000003TJJ6MAO", "00DS0000003TJJ6MAL"],
         target_dt,
+        ledger_path=None,
     )
 
 
@@ -611,7 +641,7 @@ def test_schedule_push_org_list_run_task_without_orgs(empty_org_file):
     task.push.create_push_request.return_value = ("0DV000000000001", 0)
     task._run_task()
     task.push.create_push_request.assert_called_once_with(
-        mock.ANY, [], target_date.replace(tzinfo=tz.UTC)
+        mock.ANY, [], target_date.replace(tzinfo=tz.UTC), ledger_path=None
     )
 
 
@@ -637,11 +667,12 @@ def test_schedule_push_org_list_run_task_many_orgs(org_file):
         mock.ANY,
         ["00DS0000003TJJ6MAO", "00DS0000003TJJ6MAL"],
         target_date.replace(tzinfo=tz.UTC),
+        ledger_path=None,
     )
 
 
 def test_schedule_push_org_list_run_task_many_orgs_now(org_file):
-    query = "SELECT Id, PackagePushRequestId, SubscriberOrganizationKey, Status FROM PackagePushJob WHERE Id = '0DV1R000000k9dEWAQ'"
+    query = "SELECT Id, PackagePushJobId, ErrorSeverity, ErrorType, ErrorTitle, ErrorMessage, ErrorDetails FROM PackagePushError WHERE PackagePushJobId IN (SELECT Id FROM PackagePushJob WHERE PackagePushRequestId = '0DV1R000000k9dEWAQ')"
     task = create_task(
         SchedulePushOrgList,
         options={
@@ -654,6 +685,7 @@ def test_schedule_push_org_list_run_task_many_orgs_now(org_file):
     task.push = mock.MagicMock()
     task.sf = mock.MagicMock()
     task.sf.query_all.return_value = PACKAGE_OBJS
+    task.bulk = None
     task.push.create_push_request.return_value = ("0DV000000000001", 1001)
     task._run_task()
     task.sf.query_all.assert_called_with(query)
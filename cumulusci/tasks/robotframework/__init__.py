@@ -1,3 +1,4 @@
 from cumulusci.tasks.robotframework.robotframework import Robot  # noqa: F401
 from cumulusci.tasks.robotframework.robotframework import RobotTestDoc  # noqa: F401
 from cumulusci.tasks.robotframework.libdoc import RobotLibDoc  # noqa: F401
+from cumulusci.tasks.robotframework.perf_baseline import RobotPerfBaseline  # noqa: F401
@@ -0,0 +1,214 @@
+import json
+import logging
+import os
+import statistics
+import typing as T
+from pathlib import Path
+
+from robot.api import ExecutionResult, ResultVisitor, TestSuiteBuilder
+
+from cumulusci.cli.runtime import CliRuntime
+from cumulusci.core.config import TaskConfig
+from cumulusci.core.exceptions import RobotTestFailure
+from cumulusci.core.utils import process_list_of_pairs_dict_arg
+
+# Options of the Robot task that only make sense in the parent process
+PARENT_OPTIONS = ("processes", "runner", "orgs", "durations_file", "xunit", "name")
+
+# The state of a worker process, set up once by `init_worker`
+_worker = None
+
+
+class WorkItem(T.NamedTuple):
+    """A suite file, or one test in it, to run in a worker"""
+
+    source: str
+    test: T.Optional[str]
+    duration: float
+
+    @property
+    def key(self) -> str:
+        return duration_key(self.source, self.test)
+
+
+def duration_key(source: str, test: T.Optional[str] = None) -> str:
+    # relative, so that the durations can move between checkouts
+    source = os.path.relpath(source)
+    return f"{source}::{test}" if test else source
+
+
+def build_suite(
+    suites: T.List[str],
+    include: T.Optional[T.List[str]] = None,
+    exclude: T.Optional[T.List[str]] = None,
+    test: T.Optional[T.List[str]] = None,
+):
+    """Parse the suites and drop the tests that would not run"""
+    suite = TestSuiteBuilder().build(*suites)
+    suite.filter(included_tests=test, included_tags=include, excluded_tags=exclude)
+    return suite
+
+
+def collect_work_items(
+    suite, testlevelsplit: bool, durations: T.Dict[str, float]
+) -> T.List[WorkItem]:
+    """Split a suite into work items, longest first.
+
+    Items we have no history for are expected to take the median
+    duration of the items we know about. Running the longest items
+    first keeps one slow suite from finishing long after the rest."""
+    items = []
+    for child in _suites_with_tests(suite):
+        source = str(child.source)
+        if testlevelsplit:
+            items.extend((source, test.name) for test in child.tests)
+        else:
+            items.append((source, None))
+
+    known = [
+        durations[duration_key(*item)]
+        for item in items
+        if duration_key(*item) in durations
+    ]
+    default = statistics.median(known) if known else 1.0
+    work_items = [
+        WorkItem(source, test, durations.get(duration_key(source, test), default))
+        for source, test in items
+    ]
+    return sorted(work_items, key=lambda item: -item.duration)
+
+
+def _suites_with_tests(suite):
+    if suite.tests:
+        yield suite
+    for child in suite.suites:
+        yield from _suites_with_tests(child)
+
+
+def combine_outputs(
+    suite, items: T.List[WorkItem], outputs: T.List[str], output_dir: Path
+) -> T.List[str]:
+    """Combine the outputs of the work items from each suite file, so that
+    a suite split into tests appears once in the merged results.
+
+    Returns the outputs to merge, in the order of the suites. Items that
+    did not write an output are left out."""
+    outputs_by_source = {}
+    for item, output in zip(items, outputs):
+        if Path(output).exists():
+            outputs_by_source.setdefault(item.source, []).append((item.test, output))
+
+    combined = []
+    for number, child in enumerate(_suites_with_tests(suite)):
+        source_outputs = outputs_by_source.get(str(child.source))
+        if not source_outputs:
+            continue
+        if len(source_outputs) == 1:
+            combined.append(source_outputs[0][1])
+            continue
+        test_names = [test.name for test in child.tests]
+        source_outputs.sort(key=lambda test_output: test_names.index(test_output[0]))
+        result = ExecutionResult(source_outputs[0][1])
+        for _, output in source_outputs[1:]:
+            result.suite.tests.extend(ExecutionResult(output).suite.tests)
+        path = output_dir / f"suite-{number}.xml"
+        result.save(str(path))
+        combined.append(str(path))
+    return combined
+
+
+class DurationCollector(ResultVisitor):
+    """Collect how long each test and suite file took"""
+
+    def __init__(self):
+        self.durations = {}
+
+    def visit_test(self, test):
+        seconds = test.elapsedtime / 1000
+        suite_key = duration_key(str(test.source))
+        self.durations[duration_key(str(test.source), test.name)] = seconds
+        self.durations[suite_key] = self.durations.get(suite_key, 0) + seconds
+
+
+def read_durations(path: T.Optional[Path]) -> T.Dict[str, float]:
+    if path and path.exists():
+        return json.loads(path.read_text(encoding="utf-8"))
+    return {}
+
+
+def update_durations(path: Path, output_xml: Path):
+    """Merge the durations of a run into the durations file"""
+    collector = DurationCollector()
+    ExecutionResult(str(output_xml)).visit(collector)
+    durations = read_durations(path)
+    durations.update(collector.durations)
+    path.write_text(json.dumps(durations, indent=2, sort_keys=True), encoding="utf-8")
+
+
+class RobotWorker:
+    """Runs work items in a worker process.
+
+    The project config, keychain and org are loaded once when the process
+    starts, and the CumulusCI library finds them through the Robot task
+    that runs each item, instead of loading them again for every suite."""
+
+    def __init__(self, repo_info: dict, org_name: str, task_options: dict):
+        from cumulusci.tasks.robotframework.robotframework import Robot
+
+        runtime = CliRuntime(repo_info=repo_info)
+        self.task_class = Robot
+        self.project_config = runtime.project_config
+        self.org_name = org_name
+        self.org_config = runtime.keychain.get_org(org_name)
+        self.task_options = task_options
+        self.logger = logging.getLogger(__name__)
+
+    def run(self, item: WorkItem, output_xml: Path) -> str:
+        """Run one item and return the name of the org it ran against"""
+        options = {
+            key: value
+            for key, value in self.task_options.items()
+            if key not in PARENT_OPTIONS
+        }
+        options["suites"] = item.source
+        options["options"] = {
+            "console": "none",
+            **process_list_of_pairs_dict_arg(options.get("options") or {}),
+            "outputdir": str(output_xml.parent),
+            "output": output_xml.name,
+            "log": "NONE",
+            "report": "NONE",
+        }
+        if item.test:
+            # passed straight to robot, so that commas in names are kept
+            options.pop("test", None)
+            options["options"]["test"] = item.test
+        task = self.task_class(
+            project_config=self.project_config,
+            task_config=TaskConfig({"options": options}),
+            org_config=self.org_config,
+            logger=self.logger,
+        )
+        try:
+            task()
+        except RobotTestFailure:
+            # The failures are reported when the outputs are merged
+            pass
+        return self.org_name
+
+
+def init_worker(repo_info: dict, org_names, task_options: dict):
+    """Set up a worker process with the next org from the pool"""
+    global _worker
+    try:
+        _worker = RobotWorker(repo_info, org_names.get(), task_options)
+    except Exception as e:
+        # An exception here would only break the pool, so we report
+        # it from the first item instead.
+        _worker = e
+
+
+def run_work_item(item: WorkItem, output_xml: str) -> str:
+    if isinstance(_worker, Exception):
+        raise _worker
+    return _worker.run(item, Path(output_xml))
@@ -0,0 +1,267 @@
+import json
+import statistics
+import typing as T
+from datetime import datetime, timezone
+from pathlib import Path
+
+from cumulusci.core.exceptions import RobotTestFailure, TaskOptionsError
+from cumulusci.core.tasks import BaseTask
+from cumulusci.core.utils import process_bool_arg, process_list_arg
+from cumulusci.utils.xml.robot_xml import perf_summaries_from_xml
+
+SPARK_CHARS = "▁▂▃▄▅▆▇█"
+
+
+class MetricBaseline(T.NamedTuple):
+    """One metric of one test, compared to the runs before it"""
+
+    test: str
+    metric: str
+    value: float
+    history: T.List[float]
+    median: T.Optional[float]
+    stdev: T.Optional[float]
+    regressed: bool
+
+    @property
+    def change_percent(self) -> T.Optional[float]:
+        if not self.median:
+            return None
+        return (self.value - self.median) / self.median * 100
+
+    @property
+    def status(self) -> str:
+        if self.median is None:
+            return "new"
+        return "REGRESSED" if self.regressed else "ok"
+
+
+def compute_baselines(
+    current: T.Dict[str, T.Dict[str, float]],
+    history: T.List[dict],
+    min_runs: int,
+    threshold_percent: float,
+    threshold_stdev: float,
+) -> T.List[MetricBaseline]:
+    """Compare the metrics of the current run with the runs in `history`.
+
+    A metric has regressed when it is larger than the median of the earlier
+    runs by more than `threshold_percent` percent *and* by more than
+    `threshold_stdev` standard deviations, so that neither a small change
+    to a very stable metric nor the usual noise of a jittery one fails the
+    build. Metrics with fewer than `min_runs` earlier values are new."""
+    baselines = []
+    for test, metrics in current.items():
+        for metric, value in metrics.items():
+            values = [
+                run["results"][test][metric]
+                for run in history
+                if metric in run["results"].get(test, {})
+            ]
+            if len(values) < min_runs:
+                baselines.append(
+                    MetricBaseline(test, metric, value, values, None, None, False)
+                )
+                continue
+            median = statistics.median(values)
+            stdev = statistics.stdev(values)
+            regressed = (
+                value > median * (1 + threshold_percent / 100)
+                and value > median + threshold_stdev * stdev
+            )
+            baselines.append(
+                MetricBaseline(test, metric, value, values, median, stdev, regressed)
+            )
+    return baselines
+
+
+def sparkline(values: T.List[float]) -> str:
+    low, high = min(values), max(values)
+    scale = (len(SPARK_CHARS) - 1) / (high - low) if high > low else 0
+    return "".join(SPARK_CHARS[round((value - low) * scale)] for value in values)
+
+
+def render_trend_report(baselines: T.List[MetricBaseline], title: str) -> str:
+    """Render the baselines as a Markdown table"""
+    lines = [
+        f"# {title}",
+        "",
+        "| Test | Metric | Value | Baseline | Change | Trend | Status |",
+        "| --- | --- | ---: | ---: | ---: | --- | --- |",
+    ]
+    for baseline in baselines:
+        median = "" if baseline.median is None else f"{baseline.median:g}"
+        change = baseline.change_percent
+        change = "" if change is None else f"{change:+.1f}%"
+        trend = sparkline(baseline.history + [baseline.value])
+        lines.append(
+            f"| {baseline.test} | {baseline.metric} | {baseline.value:g} "
+            f"| {median} | {change} | {trend} | {baseline.status} |"
+        )
+    return "\n".join(lines) + "\n"
+
+
+class RobotPerfBaseline(BaseTask):
+    task_docs = """
+    Collects the performance metrics of a Robot run from its ``output.xml``
+    and compares them with the previous runs stored in ``history_file``.
+
+    The metrics are the ones set with the ``Set Test Metric``, ``Set Test
+    Elapsed Time`` and ``Stop Performance Timer`` keywords, along with the
+    setup, teardown and total time of each test that has metrics. Larger
+    values are treated as worse.
+
+    The history file holds one JSON object per run. To track metrics
+    across CI builds, keep the history file between builds.
+    """
+    task_options = {
+        "output_xml": {
+            "description": "Path to the output.xml file of the Robot run",
+            "required": True,
+        },
+        "history_file": {
+            "description": "Path to the JSON lines file with the metrics of "
+            "earlier runs. Defaults to perf_history.jsonl next to output_xml."
+        },
+        "run_name": {
+            "description": "A name for this run in the history, such as a "
+            "build number or commit. Defaults to the current time."
+        },
+        "metrics": {
+            "description": "Only track these metrics (e.g. elapsed_time). "
+            "Defaults to all of them."
+        },
+        "baseline_runs": {
+            "description": "Number of earlier runs to compute baselines from. "
+            "Defaults to 10."
+        },
+        "min_runs": {
+            "description": "Number of earlier values a metric needs before it "
+            "is checked for regressions. Defaults to 3."
+        },
+        "threshold_percent": {
+            "description": "How far above its baseline median a metric can go, "
+            "in percent, before it is a regression. Defaults to 20."
+        },
+        "threshold_stdev": {
+            "description": "How far above its baseline median a metric can go, "
+            "in standard deviations, before it is a regression. Defaults to 3."
+        },
+        "record": {
+            "description": "If True, add this run to the history file. "
+            "Defaults to True."
+        },
+        "fail_on_regression": {
+            "description": "If True, fail the task when a metric has regressed. "
+            "Defaults to True."
+        },
+        "report_file": {
+            "description": "If set, write a Markdown trend report to this path."
+        },
+    }
+
+    def _init_options(self, kwargs):
+        super()._init_options(kwargs)
+        self.options["output_xml"] = Path(self.options["output_xml"])
+        self.options["history_file"] = Path(
+            self.options.get("history_file")
+            or self.options["output_xml"].parent / "perf_history.jsonl"
+        )
+        self.options["metrics"] = process_list_arg(self.options.get("metrics"))
+        try:
+            for option, default in (("baseline_runs", 10), ("min_runs", 3)):
+                self.options[option] = int(self.options.get(option, default))
+            for option, default in (("threshold_percent", 20), ("threshold_stdev", 3)):
+                self.options[option] = float(self.options.get(option, default))
+        except (TypeError, ValueError) as e:
+            raise TaskOptionsError(f"Invalid number: {e}") from e
+        for option in ("baseline_runs", "threshold_percent", "threshold_stdev"):
+            if self.options[option] < 0:
+                raise TaskOptionsError(f"{option} must not be negative")
+        if self.options["min_runs"] < 2:
+            raise TaskOptionsError("min_runs must be at least 2")
+        for option in ("record", "fail_on_regression"):
+            self.options[option] = process_bool_arg(self.options.get(option, True))
+
+    def _run_task(self):
+        current = self._collect_metrics()
+        if not current:
+            self.logger.warning(
+                f"No performance metrics found in {self.options['output_xml']}"
+            )
+        baseline_runs = self.options["baseline_runs"]
+        history = self._read_history()[-baseline_runs:] if baseline_runs else []
+        baselines = compute_baselines(
+            current,
+            history,
+            self.options["min_runs"],
+            self.options["threshold_percent"],
+            self.options["threshold_stdev"],
+        )
+        self._log_baselines(baselines, len(history))
+
+        if self.options.get("report_file"):
+            report = render_trend_report(baselines, "Robot Performance Trends")
+            Path(self.options["report_file"]).write_text(report, encoding="utf-8")
+            self.logger.info(f"Wrote trend report to {self.options['report_file']}")
+        if self.options["record"] and current:
+            self._append_history(current)
+
+        regressions = [baseline for baseline in baselines if baseline.regressed]
+        self.return_values = {
+            "regressions": [
+                {"test": b.test, "metric": b.metric, "value": b.value}
+                for b in regressions
+            ]
+        }
+        if regressions and self.options["fail_on_regression"]:
+            raise RobotTestFailure(
+                f"{len(regressions)} performance metric(s) regressed: "
+                + ", ".join(f"{b.test} ({b.metric})" for b in regressions)
+            )
+
+    def _collect_metrics(self) -> T.Dict[str, T.Dict[str, float]]:
+        metrics_filter = self.options["metrics"]
+        return {
+            summary.test.longname: {
+                metric: value
+                for metric, value in summary.metrics.items()
+                if not metrics_filter or metric in metrics_filter
+            }
+            for summary in perf_summaries_from_xml(str(self.options["output_xml"]))
+        }
+
+    def _read_history(self) -> T.List[dict]:
+        history_file = self.options["history_file"]
+        if not history_file.exists():
+            return []
+        with history_file.open(encoding="utf-8") as f:
+            return [json.loads(line) for line in f if line.strip()]
+
+    def _append_history(self, current: T.Dict[str, T.Dict[str, float]]):
+        timestamp = datetime.now(timezone.utc).isoformat()
+        run = {
+            "run": self.options.get("run_name") or timestamp,
+            "timestamp": timestamp,
+            "results": current,
+        }
+        history_file = self.options["history_file"]
+        history_file.parent.mkdir(parents=True, exist_ok=True)
+        with history_file.open("a", encoding="utf-8") as f:
+            f.write(json.dumps(run) + "\n")
+
+    def _log_baselines(self, baselines: T.List[MetricBaseline], num_runs: int):
+        self.logger.info(f"Comparing performance metrics with {num_runs} earlier runs")
+        for baseline in baselines:
+            message = f"  {baseline.test} {baseline.metric}: {baseline.value:g}"
+            if baseline.median is not None:
+                message += (
+                    f" (baseline {baseline.median:g}, "
+                    f"{baseline.change_percent or 0:+.1f}%) {baseline.status}"
+                )
+            else:
+                message += " (no baseline yet)"
+            if baseline.regressed:
+                self.logger.error(message)
+            else:
+                self.logger.info(message)
@@ -1,11 +1,15 @@
 import fnmatch
 import json
+import multiprocessing
 import os
 import shlex
+import shutil
 import subprocess
 import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 
+from robot import rebot
 from robot import run as robot_run
 from robot.testdoc import testdoc
 
@@ -23,6 +27,15 @@ from cumulusci.core.utils import (
 )
 from cumulusci.robotframework.utils import set_pdb_trace
 from cumulusci.tasks.robotframework.debugger import DebugListener
+from cumulusci.tasks.robotframework.parallel import (
+    build_suite,
+    collect_work_items,
+    combine_outputs,
+    init_worker,
+    read_durations,
+    run_work_item,
+    update_durations,
+)
 from cumulusci.tasks.salesforce import BaseSalesforceTask
 from cumulusci.utils.xml.robot_xml import log_perf_summary_from_xml
 
@@ -89,6 +102,30 @@ class Robot(BaseSalesforceTask):
             ),
             "default": "1",
         },
+        "runner": {
+            "description": (
+                "*experimental* How to run tests when processes is 2 or greater. "
+                "'pabot' (the default) runs them with pabot. 'native' runs them "
+                "in a pool of worker processes that each load the CumulusCI "
+                "project and org once, schedules the longest suites first based "
+                "on earlier runs, and merges the results with rebot."
+            ),
+            "default": "pabot",
+        },
+        "orgs": {
+            "description": (
+                "A list of org names for the native runner. Each worker process "
+                "runs its tests against its own org from this list, so there are "
+                "never more workers than orgs. Defaults to the org of the task."
+            ),
+        },
+        "durations_file": {
+            "description": (
+                "A JSON file with the durations of earlier runs, used by the native "
+                "runner to schedule the longest suites first. It is updated after "
+                "each run. Defaults to robot_durations.json in the output directory."
+            ),
+        },
         "testlevelsplit": {
             "description": (
                 "If true, split parallel execution at the test level rather "
@@ -134,6 +171,12 @@ class Robot(BaseSalesforceTask):
                 "Please specify an integer for the `processes` option."
             )
 
+        self.options["runner"] = self.options.get("runner") or "pabot"
+        if self.options["runner"] not in ("pabot", "native"):
+            raise TaskOptionsError("The `runner` option must be 'pabot' or 'native'.")
+        if "orgs" in self.options:
+            self.options["orgs"] = process_list_arg(self.options["orgs"])
+
         if self.options["processes"] > 1:
             self.options["testlevelsplit"] = process_bool_arg(
                 self.options.get("testlevelsplit", False)
@@ -224,7 +267,10 @@ class Robot(BaseSalesforceTask):
             Path(cumulusci.robotframework.__path__[0]) / "javascript"
         )
 
-        if self.options["processes"] > 1:
+        if self.options["processes"] > 1 and self.options["runner"] == "native":
+            num_failed = self._run_native(options)
+
+        elif self.options["processes"] > 1:
             # Since pabot runs multiple robot processes, and because
             # those processes aren't cci tasks, we have to set up the
             # environment to match what we do with a cci task. Specifically,
@@ -320,6 +366,79 @@ class Robot(BaseSalesforceTask):
         elif num_failed >= 255:
             raise RobotTestFailure("Unexpected internal error")
 
+    def _run_native(self, options):
+        """Run the suites in a pool of worker processes and merge the results"""
+        output_dir = Path(options["outputdir"])
+        durations_file = Path(
+            self.options.get("durations_file") or output_dir / "robot_durations.json"
+        )
+        suite = build_suite(
+            self.options["suites"],
+            include=options.get("include"),
+            exclude=options.get("exclude"),
+            test=options.get("test"),
+        )
+        items = collect_work_items(
+            suite,
+            self.options.get("testlevelsplit", False),
+            read_durations(durations_file),
+        )
+        if not items:
+            self.logger.error("No tests to run.")
+            return 252
+
+        orgs = self.options.get("orgs") or [self.org_config.name]
+        num_workers = min(self.options["processes"], len(items))
+        if self.options.get("orgs"):
+            num_workers = min(num_workers, len(orgs))
+        context = multiprocessing.get_context("spawn")
+        org_names = context.Queue()
+        for i in range(num_workers):
+            org_names.put(orgs[i % len(orgs)])
+        self.logger.info(
+            f"Running {len(items)} suites or tests in {num_workers} worker processes"
+        )
+
+        # Outputs left by an earlier run must not be merged into this one
+        worker_dir = output_dir / "workers"
+        shutil.rmtree(worker_dir, ignore_errors=True)
+        worker_dir.mkdir(parents=True)
+        outputs = [str(worker_dir / f"output-{i}.xml") for i in range(len(items))]
+        with ProcessPoolExecutor(
+            num_workers,
+            mp_context=context,
+            initializer=init_worker,
+            initargs=(
+                self.project_config.repo_info,
+                org_names,
+                dict(self.task_config.options or {}),
+            ),
+        ) as executor:
+            futures = {
+                executor.submit(run_work_item, item, output): item
+                for item, output in zip(items, outputs)
+            }
+            for future in as_completed(futures):
+                org_name = future.result()
+                self.logger.info(f"Finished {futures[future].key} in org {org_name}")
+
+        rebot_options = {
+            key: options[key] for key in ("xunit", "tagstatexclude") if options.get(key)
+        }
+        num_failed = rebot(
+            *combine_outputs(suite, items, outputs, worker_dir),
+            name=options.get("name") or suite.name,
+            outputdir=str(output_dir),
+            output="output.xml",
+            stdout=sys.stdout,
+            stderr=sys.stderr,
+            **rebot_options,
+        )
+        output_xml = output_dir / "output.xml"
+        if output_xml.exists():
+            update_durations(durations_file, output_xml)
+        return num_failed
+
 
 class RobotTestDoc(BaseTask):
     task_options = {
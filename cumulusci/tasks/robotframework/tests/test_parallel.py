@@ -0,0 +1,252 @@
+"""
+Tests for running robot tests with the native parallel runner
+"""
+
+import json
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from unittest import mock
+
+import pytest
+from robot.api import ExecutionResult
+
+from cumulusci.core.config import BaseProjectConfig, OrgConfig, UniversalConfig
+from cumulusci.core.exceptions import OrgNotFound, RobotTestFailure, TaskOptionsError
+from cumulusci.tasks.robotframework import Robot, parallel
+from cumulusci.tasks.robotframework.parallel import (
+    RobotWorker,
+    WorkItem,
+    build_suite,
+    collect_work_items,
+    duration_key,
+    update_durations,
+)
+from cumulusci.tasks.salesforce.tests.util import create_task
+from cumulusci.tests.util import DummyKeychain
+
+FAST_SUITE = """
+*** Test Cases ***
+Quick One
+    [Tags]  quick
+    Log  ${ORG}
+
+Quick Two
+    Log  hello
+"""
+
+SLOW_SUITE = """
+*** Test Cases ***
+Slow One
+    Sleep  0.2s
+
+Failing One
+    [Tags]  fails
+    Fail  Oops
+"""
+
+
+@pytest.fixture
+def suites(tmp_path):
+    tests = tmp_path / "tests"
+    tests.mkdir()
+    (tests / "fast.robot").write_text(FAST_SUITE)
+    (tests / "slow.robot").write_text(SLOW_SUITE)
+    return tests
+
+
+@pytest.fixture
+def mock_runtime(tmp_path):
+    def get_org(name):
+        return OrgConfig(
+            {
+                "instance_url": "https://test.salesforce.com",
+                "access_token": "TOKEN",
+                "org_id": "ORG_ID",
+            },
+            name,
+            keychain=DummyKeychain(),
+        )
+
+    project_config = BaseProjectConfig(
+        UniversalConfig(),
+        config={"project": {"package": {}}},
+        repo_info={"root": str(tmp_path)},
+    )
+    project_config.keychain = DummyKeychain()
+    with mock.patch.object(parallel, "CliRuntime") as runtime, mock.patch.object(
+        OrgConfig, "refresh_oauth_token"
+    ):
+        runtime.return_value.project_config = project_config
+        runtime.return_value.keychain.get_org.side_effect = get_org
+        yield runtime
+
+
+class InProcessExecutor(ThreadPoolExecutor):
+    """Stand-in for the process pool that runs everything in one thread"""
+
+    def __init__(self, max_workers, mp_context, initializer, initargs):
+        super().__init__(1, initializer=initializer, initargs=initargs)
+
+
+class TestCollectWorkItems:
+    def test_collect_work_items(self, suites):
+        fast, slow = str(suites / "fast.robot"), str(suites / "slow.robot")
+        suite = build_suite([str(suites)])
+
+        items = collect_work_items(suite, False, {duration_key(slow): 10})
+
+        # no history for fast.robot, so it gets the median of the others
+        # (and ties keep their original order)
+        assert items == [WorkItem(fast, None, 10), WorkItem(slow, None, 10)]
+
+    def test_collect_work_items__testlevelsplit(self, suites):
+        fast = str(suites / "fast.robot")
+        durations = {
+            duration_key(fast, "Quick One"): 1,
+            duration_key(fast, "Quick Two"): 3,
+        }
+        suite = build_suite([str(suites)], exclude=["fails"])
+
+        items = collect_work_items(suite, True, durations)
+
+        assert [(item.test, item.duration) for item in items] == [
+            ("Quick Two", 3),
+            ("Slow One", 2),
+            ("Quick One", 1),
+        ]
+
+    def test_build_suite__filters(self, suites):
+        suite = build_suite([str(suites)], include=["quick"])
+        items = collect_work_items(suite, True, {})
+        assert [item.test for item in items] == ["Quick One"]
+
+
+class TestRobotWorker:
+    def test_run(self, suites, tmp_path, mock_runtime):
+        parallel.init_worker(
+            {"root": str(tmp_path)},
+            mock.Mock(**{"get.return_value": "qa"}),
+            {
+                "suites": "ignored",
+                "processes": 4,
+                "options": "loglevel:DEBUG",
+            },
+        )
+        output_xml = tmp_path / "out" / "output-0.xml"
+        item = WorkItem(str(suites / "slow.robot"), "Failing One", 1)
+
+        assert parallel.run_work_item(item, str(output_xml)) == "qa"
+
+        assert output_xml.exists()
+        assert not (tmp_path / "out" / "log.html").exists()
+        update_durations(tmp_path / "durations.json", output_xml)
+        durations = json.loads((tmp_path / "durations.json").read_text())
+        assert list(durations) == [
+            duration_key(item.source),
+            duration_key(item.source, "Failing One"),
+        ]
+
+    def test_init__error(self, tmp_path, mock_runtime):
+        mock_runtime.return_value.keychain.get_org.side_effect = OrgNotFound("qa")
+        parallel.init_worker({"root": str(tmp_path)}, mock.Mock(), {})
+
+        with pytest.raises(OrgNotFound):
+            parallel.run_work_item(WorkItem("a.robot", None, 1), "output.xml")
+
+    def test_init(self, tmp_path, mock_runtime):
+        worker = RobotWorker({"root": str(tmp_path)}, "qa", {})
+        mock_runtime.assert_called_once_with(repo_info={"root": str(tmp_path)})
+        assert worker.project_config is mock_runtime.return_value.project_config
+        assert worker.org_config.name == "qa"
+
+
+@mock.patch(
+    "cumulusci.tasks.robotframework.robotframework.ProcessPoolExecutor",
+    InProcessExecutor,
+)
+class TestRobotNativeRunner:
+    def test_run_native(self, suites, tmp_path, mock_runtime):
+        outputdir = tmp_path / "results"
+        task = create_task(
+            Robot,
+            {
+                "suites": str(suites),
+                "processes": 2,
+                "runner": "native",
+                "testlevelsplit": True,
+                "orgs": "qa1,qa2,qa3",
+                "options": {"outputdir": str(outputdir)},
+            },
+        )
+        # a stale output from an earlier run
+        (outputdir / "workers").mkdir(parents=True)
+        (outputdir / "workers" / "output-4.xml").write_text("<robot/>")
+        with pytest.raises(RobotTestFailure, match="1 test failed"):
+            task()
+
+        # the tests of each suite are combined, in their original order
+        result = ExecutionResult(str(outputdir / "output.xml"))
+        assert [
+            (suite.name, [test.name for test in suite.tests])
+            for suite in result.suite.suites
+        ] == [
+            ("Fast", ["Quick One", "Quick Two"]),
+            ("Slow", ["Slow One", "Failing One"]),
+        ]
+        assert not (outputdir / "workers" / "output-4.xml").exists()
+
+        # the pool is limited to the number of processes, not orgs
+        assert mock_runtime.return_value.keychain.get_org.mock_calls == [
+            mock.call("qa1")
+        ]
+        assert (outputdir / "output.xml").exists()
+        assert (outputdir / "log.html").exists()
+        assert len(list((outputdir / "workers").glob("output-*.xml"))) == 4
+        durations = json.loads((outputdir / "robot_durations.json").read_text())
+        assert durations[duration_key(str(suites / "slow.robot"), "Slow One")] >= 0.2
+
+    def test_run_native__no_tests(self, suites, tmp_path, mock_runtime):
+        task = create_task(
+            Robot,
+            {
+                "suites": str(suites),
+                "processes": 2,
+                "runner": "native",
+                "include": "nothing",
+                "options": {"outputdir": str(tmp_path)},
+            },
+        )
+        with pytest.raises(RobotTestFailure, match="Invalid test data"):
+            task()
+
+    def test_run_native__durations_file(self, suites, tmp_path, mock_runtime):
+        durations_file = tmp_path / "durations.json"
+        durations_file.write_text(
+            json.dumps({duration_key(str(suites / "fast.robot")): 100})
+        )
+        task = create_task(
+            Robot,
+            {
+                "suites": str(suites),
+                "processes": 2,
+                "runner": "native",
+                "exclude": "fails",
+                "durations_file": str(durations_file),
+                "options": {"outputdir": str(tmp_path)},
+            },
+        )
+        with mock.patch(
+            "cumulusci.tasks.robotframework.robotframework.run_work_item",
+            wraps=parallel.run_work_item,
+        ) as run_work_item:
+            task()
+
+        first_item = run_work_item.mock_calls[0].args[0]
+        assert Path(first_item.source).name == "fast.robot"
+        durations = json.loads(durations_file.read_text())
+        assert durations[duration_key(str(suites / "fast.robot"))] < 100
+
+
+def test_invalid_runner():
+    with pytest.raises(TaskOptionsError, match="runner"):
+        create_task(Robot, {"suites": "tests", "runner": "fast"})
@@ -0,0 +1,200 @@
+import json
+from pathlib import Path
+from unittest import mock
+
+import pytest
+import robot
+
+from cumulusci.core.exceptions import RobotTestFailure, TaskOptionsError
+from cumulusci.tasks.robotframework import RobotPerfBaseline
+from cumulusci.tasks.robotframework.perf_baseline import (
+    compute_baselines,
+    render_trend_report,
+    sparkline,
+)
+from cumulusci.tasks.salesforce.tests.util import create_task
+
+SUITE = """
+*** Settings ***
+Library         cumulusci.robotframework.Performance
+
+*** Test Cases ***
+Fast Test
+    Set Test Metric    queries    ${QUERIES}
+
+Timed Test
+    Set Test Elapsed Time    ${ELAPSED}
+"""
+
+
+def run_suite(path: Path, queries=10, elapsed=5):
+    suite = path / "perf.robot"
+    suite.write_text(SUITE)
+    robot.run(
+        str(suite),
+        outputdir=str(path),
+        log="NONE",
+        report="NONE",
+        variable=[f"QUERIES:{queries}", f"ELAPSED:{elapsed}"],
+        stdout=None,
+        console="none",
+    )
+    return path / "output.xml"
+
+
+def history_run(queries, elapsed):
+    return {
+        "results": {
+            "Perf.Fast Test": {"queries": queries},
+            "Perf.Timed Test": {"elapsed_time": elapsed},
+        }
+    }
+
+
+class TestComputeBaselines:
+    def test_compute_baselines(self):
+        history = [history_run(10, 5), history_run(11, 5.5), history_run(9, 4.5)]
+        current = {
+            "Perf.Fast Test": {"queries": 20},
+            "Perf.Timed Test": {"elapsed_time": 5.2},
+            "Perf.New Test": {"queries": 1},
+        }
+
+        baselines = compute_baselines(current, history, 3, 20, 3)
+
+        queries, elapsed, new = baselines
+        assert queries.median == 10 and queries.regressed
+        assert queries.change_percent == 100
+        assert elapsed.median == 5 and not elapsed.regressed
+        assert elapsed.status == "ok"
+        assert new.median is None and new.status == "new"
+
+    def test_compute_baselines__noise(self):
+        # 30% slower, but within the usual spread of this test
+        history = [history_run(10, elapsed) for elapsed in (2, 8, 4, 6)]
+        current = {"Perf.Timed Test": {"elapsed_time": 6.5}}
+
+        (elapsed,) = compute_baselines(current, history, 3, 20, 3)
+
+        assert not elapsed.regressed
+
+    def test_render_trend_report(self):
+        history = [history_run(10, 5), history_run(11, 5.5), history_run(9, 4.5)]
+        baselines = compute_baselines(
+            {"Perf.Fast Test": {"queries": 20}}, history, 3, 20, 3
+        )
+
+        report = render_trend_report(baselines, "Trends")
+
+        assert report.startswith("# Trends\n")
+        assert (
+            "| Perf.Fast Test | queries | 20 | 10 | +100.0% | ▂▂▁█ | REGRESSED |"
+            in (report)
+        )
+
+    def test_sparkline__flat(self):
+        assert sparkline([3, 3, 3]) == "▁▁▁"
+
+
+class TestRobotPerfBaseline:
+    def test_run_task(self, tmp_path):
+        history_file = tmp_path / "history" / "perf.jsonl"
+        for queries in (10, 11, 9):
+            output_xml = run_suite(tmp_path, queries=queries)
+            task = create_task(
+                RobotPerfBaseline,
+                {"output_xml": output_xml, "history_file": history_file},
+            )
+            task()
+            assert task.return_values == {"regressions": []}
+
+        output_xml = run_suite(tmp_path, queries=30)
+        task = create_task(
+            RobotPerfBaseline,
+            {
+                "output_xml": output_xml,
+                "history_file": history_file,
+                "run_name": "build 4",
+                "report_file": tmp_path / "report.md",
+            },
+        )
+        with pytest.raises(RobotTestFailure, match=r"Perf.Fast Test \(queries\)"):
+            task()
+
+        assert task.return_values == {
+            "regressions": [
+                {"test": "Perf.Fast Test", "metric": "queries", "value": 30}
+            ]
+        }
+        runs = [json.loads(line) for line in history_file.read_text().splitlines()]
+        assert len(runs) == 4
+        assert runs[-1]["run"] == "build 4"
+        assert runs[-1]["results"]["Perf.Timed Test"]["elapsed_time"] == 5
+        assert "total_time" in runs[-1]["results"]["Perf.Timed Test"]
+        assert "REGRESSED" in (tmp_path / "report.md").read_text()
+
+    def test_run_task__options(self, tmp_path):
+        output_xml = run_suite(tmp_path)
+        task = create_task(
+            RobotPerfBaseline,
+            {
+                "output_xml": output_xml,
+                "metrics": "queries",
+                "record": False,
+                "fail_on_regression": False,
+            },
+        )
+        assert task.options["history_file"] == tmp_path / "perf_history.jsonl"
+
+        with mock.patch(
+            "cumulusci.tasks.robotframework.perf_baseline.compute_baselines",
+            return_value=[],
+        ) as compute:
+            task()
+
+        assert compute.mock_calls[0].args[0] == {
+            "Perf.Fast Test": {"queries": 10},
+            "Perf.Timed Test": {},
+        }
+        assert not (tmp_path / "perf_history.jsonl").exists()
+
+    def test_run_task__zero_options(self, tmp_path):
+        history_file = tmp_path / "perf.jsonl"
+        history_file.write_text(
+            "\n".join(json.dumps(history_run(10, 5)) for _ in range(3))
+        )
+        task = create_task(
+            RobotPerfBaseline,
+            {
+                "output_xml": run_suite(tmp_path, queries=11),
+                "history_file": history_file,
+                "baseline_runs": 0,
+                "threshold_percent": 0,
+                "threshold_stdev": 0,
+                "record": False,
+            },
+        )
+        assert task.options["baseline_runs"] == 0
+        assert task.options["threshold_percent"] == 0.0
+        assert task.options["threshold_stdev"] == 0.0
+
+        # no earlier runs are used, so nothing can regress
+        task()
+        assert task.return_values == {"regressions": []}
+
+        task.options["baseline_runs"] = 3
+        with pytest.raises(RobotTestFailure, match=r"Perf.Fast Test \(queries\)"):
+            task()
+
+    def test_invalid_options(self, tmp_path):
+        with pytest.raises(TaskOptionsError, match="Invalid number"):
+            create_task(
+                RobotPerfBaseline, {"output_xml": "output.xml", "min_runs": "a few"}
+            )
+        with pytest.raises(TaskOptionsError, match="min_runs"):
+            create_task(RobotPerfBaseline, {"output_xml": "output.xml", "min_runs": 1})
+        with pytest.raises(TaskOptionsError, match="threshold_stdev must not"):
+            create_task(
+                RobotPerfBaseline,
+                {"output_xml": "output.xml", "threshold_stdev": "-1"},
+            )
@@ -16,7 +16,19 @@ class BaseSalesforceApiTask(BaseSalesforceTask):
         self.tooling = self._init_api("tooling")
         self._init_class()
 
+    # An OrgConnectionPool shared with other tasks outside of a flow,
+    # e.g. by a persistent worker process
+    connection_pool = None
+
+    @property
+    def _connection_pool(self):
+        return self.flow.connection_pool if self.flow else self.connection_pool
+
     def _init_api(self, base_url=None):
+        if self._connection_pool:
+            return self._connection_pool.get_connection(
+                self.project_config, api_version=self.api_version, base_url=base_url
+            )
         rv = get_simple_salesforce_connection(
             self.project_config,
             self.org_config,
@@ -30,6 +42,8 @@ class BaseSalesforceApiTask(BaseSalesforceTask):
         version = self.api_version or self.project_config.project__package__api_version
         if not version:
             raise ConfigError("Cannot find Salesforce version")
+        if self._connection_pool:
+            return self._connection_pool.get_bulk_connection(version)
         return SalesforceBulk(
             host=self.org_config.instance_url.replace("https://", "").rstrip("/"),
             sessionId=self.org_config.access_token,
@@ -1,3 +1,4 @@
+from cumulusci.tasks.bulkdata.mapping_parser import describe_data
 from cumulusci.tasks.salesforce import BaseSalesforceTask
 
 
@@ -14,5 +15,7 @@ class BaseSalesforceMetadataApiTask(BaseSalesforceTask):
         if api:
             result = api()
             self.org_config.reset_installed_packages()
+            # Describes cached by earlier tasks may predate schema changes
+            describe_data.cache_clear()
             self.return_values = result
         return result
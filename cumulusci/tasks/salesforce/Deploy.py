@@ -1,4 +1,5 @@
 import pathlib
+import threading
 from typing import List, Optional, Union
 
 from defusedxml.minidom import parseString
@@ -21,6 +22,9 @@ from cumulusci.tasks.salesforce.BaseSalesforceMetadataApiTask import (
 )
 from cumulusci.utils.xml import metadata_tree
 
+# Some source transforms change the working directory, which all threads share
+_package_zip_lock = threading.Lock()
+
 
 class Deploy(BaseSalesforceMetadataApiTask):
     api_class = ApiDeploy
@@ -234,12 +238,13 @@ class Deploy(BaseSalesforceMetadataApiTask):
             #############
             if not is_collision:
                 context = TaskContext(self.org_config, self.project_config, self.logger)
-                package_zip = MetadataPackageZipBuilder(
-                    path=src_path,
-                    context=context,
-                    options=options,
-                    transforms=self.transforms,
-                )
+                with _package_zip_lock:
+                    package_zip = MetadataPackageZipBuilder(
+                        path=src_path,
+                        context=context,
+                        options=options,
+                        transforms=self.transforms,
+                    )
 
                 # If the package is empty, do nothing.
                 if not package_zip.zf.namelist():
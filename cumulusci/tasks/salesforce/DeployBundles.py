@@ -1,17 +1,57 @@
+import base64
 import copy
+import io
 import os
+import zipfile
+from collections import defaultdict
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 
+from cumulusci.core.exceptions import TaskOptionsError
+from cumulusci.core.utils import process_list_arg
 from cumulusci.tasks.salesforce import Deploy
+from cumulusci.utils.xml import metadata_tree
 
 deploy_options = copy.deepcopy(Deploy.task_options)
 deploy_options["path"][
     "description"
 ] = "The path to the parent directory containing the metadata bundles directories"
+deploy_options["parallel"] = {
+    "description": "The number of bundles to deploy at once. Defaults to 1, which "
+    "deploys the bundles one at a time in alphabetical order. Otherwise, bundles "
+    "whose package.xml list the same components are still deployed in "
+    "alphabetical order, and bundle_dependencies declares any other ordering."
+}
+deploy_options["bundle_dependencies"] = {
+    "description": "Used with parallel. A dict mapping the name of a bundle "
+    "directory to a list of the bundles which must be deployed before it."
+}
 
 
 class DeployBundles(Deploy):
     task_options = deploy_options
 
+    def _init_options(self, kwargs):
+        super()._init_options(kwargs)
+
+        parallel = self.options.get("parallel")
+        try:
+            self.parallel = 1 if parallel is None else int(parallel)
+        except ValueError:
+            self.parallel = 0
+        if self.parallel < 1:
+            raise TaskOptionsError("The parallel option must be a positive integer.")
+
+        bundle_dependencies = self.options.get("bundle_dependencies") or {}
+        if not isinstance(bundle_dependencies, dict):
+            raise TaskOptionsError(
+                "The bundle_dependencies option must be a dict of bundle names "
+                "to lists of bundle names."
+            )
+        self.bundle_dependencies = {
+            name: set(process_list_arg(dependencies))
+            for name, dependencies in bundle_dependencies.items()
+        }
+
     def _run_task(self):
         path = self.options["path"]
         pwd = os.getcwd()
@@ -24,11 +64,16 @@ class DeployBundles(Deploy):
             self.logger.warning("Path {} not found, skipping".format(path))
             return
 
-        for item in sorted(os.listdir(path)):
-            item_path = os.path.join(path, item)
-            if not os.path.isdir(item_path):
-                continue
+        bundles = {
+            item: os.path.join(path, item)
+            for item in sorted(os.listdir(path))
+            if os.path.isdir(os.path.join(path, item))
+        }
+        if self.parallel > 1:
+            self._deploy_bundles_in_parallel(bundles)
+            return
 
+        for item, item_path in bundles.items():
             self.logger.info(
                 "Deploying bundle: {}/{}".format(self.options["path"], item)
             )
@@ -39,6 +84,86 @@ class DeployBundles(Deploy):
         api = self._get_api(path)
         return api()
 
+    def _deploy_bundles_in_parallel(self, bundles):
+        named = set(self.bundle_dependencies).union(*self.bundle_dependencies.values())
+        unknown = named - set(bundles)
+        if unknown:
+            raise TaskOptionsError(
+                "bundle_dependencies refers to bundles that were not found: "
+                + ", ".join(sorted(unknown))
+            )
+
+        with ThreadPoolExecutor(max_workers=self.parallel) as executor:
+            # Building a package zip can call the org (for collision checks) or
+            # the Salesforce CLI (to convert SFDX source), so they are built at once.
+            apis = dict(zip(bundles, executor.map(self._get_api, bundles.values())))
+            dependencies = self._get_bundle_dependencies(apis)
+
+            pending = list(apis)
+            running = {}
+            deployed = set()
+            error = None
+            while pending or running:
+                for name in list(pending):
+                    if error or len(running) >= self.parallel:
+                        break
+                    if dependencies[name] <= deployed:
+                        pending.remove(name)
+                        self.logger.info(
+                            "Deploying bundle: {}/{}".format(self.options["path"], name)
+                        )
+                        running[executor.submit(self._call_api, apis[name])] = name
+                if not running:
+                    break
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    if future.exception():
+                        # Let the deploys in progress finish, but don't start more
+                        error = error or future.exception()
+                    else:
+                        deployed.add(name)
+
+        if error:
+            raise error
+
+    def _call_api(self, api):
+        if api is not None:
+            return api()
+
+    def _get_bundle_dependencies(self, apis):
+        """Return the names of the bundles each bundle must wait for: the ones
+        declared in bundle_dependencies, and any earlier bundles which deploy
+        some of the same components."""
+        components = {
+            name: _get_package_members(api.package_zip) if api is not None else {}
+            for name, api in apis.items()
+        }
+        dependencies = defaultdict(set)
+        names = list(apis)
+        for i, name in enumerate(names):
+            dependencies[name].update(self.bundle_dependencies.get(name, ()))
+            for earlier in names[:i]:
+                if _have_common_members(components[earlier], components[name]):
+                    dependencies[name].add(earlier)
+
+        # Make sure that every bundle can be deployed eventually
+        ordered = set()
+        while len(ordered) < len(names):
+            ready = {
+                name
+                for name in names
+                if name not in ordered and dependencies[name] <= ordered
+            }
+            if not ready:
+                raise TaskOptionsError(
+                    "bundle_dependencies has a cycle between these bundles: "
+                    + ", ".join(name for name in names if name not in ordered)
+                )
+            ordered |= ready
+        return dependencies
+
     def freeze(self, step):
         ui_options = self.task_config.config.get("ui_options", {})
         path = self.options["path"]
@@ -86,3 +211,23 @@ class DeployBundles(Deploy):
             )
             steps.append(ui_step)
         return steps
+
+
+def _get_package_members(package_zip):
+    """Return a dict of the metadata types in a base64 encoded package zip's
+    package.xml, with the set of members of each type."""
+    with zipfile.ZipFile(io.BytesIO(base64.b64decode(package_zip))) as zf:
+        package_xml = metadata_tree.fromstring(zf.read("package.xml"))
+    members = defaultdict(set)
+    for types in package_xml.findall("types"):
+        members[types.find("name").text].update(
+            member.text for member in types.findall("members")
+        )
+    return members
+
+
+def _have_common_members(first, second):
+    return any(
+        "*" in first[name] or "*" in second[name] or first[name] & second[name]
+        for name in first.keys() & second.keys()
+    )
@@ -1,4 +1,4 @@
-from cumulusci.tasks.metadata.package import PackageXmlGenerator
+from cumulusci.tasks.metadata.package import PackageXmlGenerator, package_xml_cache_file
 from cumulusci.tasks.salesforce import BaseUninstallMetadata
 
 
@@ -11,5 +11,6 @@ class UninstallLocal(BaseUninstallMetadata):
             directory=path,
             api_version=self.project_config.project__package__api_version,
             delete=True,
+            cache_file=package_xml_cache_file(self.project_config),
         )
         return generator()
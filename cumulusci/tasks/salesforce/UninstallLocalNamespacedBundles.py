@@ -1,5 +1,5 @@
 from cumulusci.core.utils import process_bool_arg
-from cumulusci.tasks.metadata.package import PackageXmlGenerator
+from cumulusci.tasks.metadata.package import PackageXmlGenerator, package_xml_cache_file
 from cumulusci.tasks.salesforce import UninstallLocalBundles
 
 
@@ -44,6 +44,7 @@ class UninstallLocalNamespacedBundles(UninstallLocalBundles):
             directory=path,
             api_version=self.project_config.project__package__api_version,
             delete=True,
+            cache_file=package_xml_cache_file(self.project_config),
         )
         namespace = ""
         if self.options["managed"]:
@@ -1,12 +1,72 @@
 import os
 from unittest import mock
 
+import pytest
+
+from cumulusci.core.exceptions import TaskOptionsError
 from cumulusci.core.flowrunner import StepSpec
 from cumulusci.tasks.salesforce import DeployBundles
+from cumulusci.tasks.salesforce.DeployBundles import _have_common_members
 from cumulusci.utils import temporary_dir
 
 from .util import create_task
 
+PACKAGE_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<Package xmlns="http://soap.sforce.com/2006/04/metadata">
+    <types>
+        <members>{member}</members>
+        <name>ApexClass</name>
+    </types>
+    <version>58.0</version>
+</Package>
+"""
+
+
+def write_bundle(path, name, member):
+    classes = path / name / "classes"
+    classes.mkdir(parents=True)
+    (path / name / "package.xml").write_text(PACKAGE_XML.format(member=member))
+    (classes / f"{member}.cls").write_text(f"public class {member} {{}}")
+
+
+@pytest.fixture
+def bundles(tmp_path):
+    write_bundle(tmp_path, "a", "Shared")
+    write_bundle(tmp_path, "b", "Shared")
+    write_bundle(tmp_path, "c", "Other")
+    write_bundle(tmp_path, "d", "Last")
+    return tmp_path
+
+
+class FakeDeploy:
+    def __init__(self, task, package_zip, **kwargs):
+        self.package_zip = package_zip
+        self.deployed = task.deployed
+
+    def __call__(self):
+        self.deployed.append(self.bundle)
+        if self.bundle == self.deployed.fail:
+            raise Exception("Deploy failed")
+
+
+class DeployedBundles(list):
+    fail = None
+
+
+def create_bundles_task(options):
+    task = create_task(DeployBundles, options)
+    task.api_class = FakeDeploy
+    task.deployed = DeployedBundles()
+
+    def get_api(path):
+        api = DeployBundles._get_api(task, path)
+        if api is not None:
+            api.bundle = os.path.basename(path)
+        return api
+
+    task._get_api = get_api
+    return task
+
 
 class TestDeployBundles:
     def test_run_task(self):
@@ -19,6 +79,74 @@ class TestDeployBundles:
             task()
             task._get_api.assert_called_once()
 
+    def test_run_task__parallel(self, bundles):
+        task = create_bundles_task(
+            {
+                "path": str(bundles),
+                "parallel": 2,
+                "bundle_dependencies": {"a": "c", "d": ["a", "b"]},
+            }
+        )
+        task()
+
+        # a waits for c, b for a (which deploys the same class), d for both
+        assert task.deployed == ["c", "a", "b", "d"]
+
+    def test_run_task__parallel_error(self, bundles):
+        task = create_bundles_task(
+            {"path": str(bundles), "parallel": 4, "bundle_dependencies": {"d": "a"}}
+        )
+        task.deployed.fail = "a"
+
+        with pytest.raises(Exception, match="Deploy failed"):
+            task()
+
+        # c was started with a; b and d wait for a, which failed
+        assert sorted(task.deployed) == ["a", "c"]
+
+    def test_run_task__parallel_cycle(self, bundles):
+        task = create_bundles_task(
+            {
+                "path": str(bundles),
+                "parallel": 2,
+                "bundle_dependencies": {"c": "d", "d": "c"},
+            }
+        )
+
+        with pytest.raises(TaskOptionsError, match="cycle between these bundles: c, d"):
+            task()
+        assert task.deployed == []
+
+    def test_run_task__parallel_unknown_bundle(self, bundles):
+        task = create_bundles_task(
+            {"path": str(bundles), "parallel": 2, "bundle_dependencies": {"c": "z"}}
+        )
+        with pytest.raises(TaskOptionsError, match="not found: z"):
+            task()
+
+    def test_run_task__parallel_empty_bundle(self, bundles):
+        (bundles / "e").mkdir()
+        task = create_bundles_task(
+            {"path": str(bundles), "parallel": 2, "bundle_dependencies": {"e": "d"}}
+        )
+        task()
+
+        assert sorted(task.deployed) == ["a", "b", "c", "d"]
+
+    @pytest.mark.parametrize(
+        "options",
+        [{"parallel": "many"}, {"parallel": 0}, {"bundle_dependencies": ["a"]}],
+    )
+    def test_init_options__invalid(self, options):
+        with pytest.raises(TaskOptionsError):
+            create_task(DeployBundles, {"path": "unpackaged", **options})
+
+    def test_have_common_members(self):
+        assert _have_common_members({"ApexClass": {"A", "B"}}, {"ApexClass": {"B"}})
+        assert _have_common_members({"ApexClass": {"*"}}, {"ApexClass": {"B"}})
+        assert not _have_common_members({"ApexClass": {"A"}}, {"ApexClass": {"B"}})
+        assert not _have_common_members({"ApexClass": {"*"}}, {"ApexPage": {"*"}})
+
     def test_run_task__path_not_found(self):
         with temporary_dir() as path:
             pass
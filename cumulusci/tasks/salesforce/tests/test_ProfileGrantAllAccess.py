@@ -329,6 +329,73 @@ def test_transforms_profile_with_layouts():
     assert xml_output.count("<layoutAssignments>") == 2
 
 
+@pytest.mark.parametrize("with_layouts", [False, True])
+def test_transforms_profile__streaming(tmp_path, with_layouts):
+    profile_before = ADMIN_PROFILE_BEFORE
+    if with_layouts:
+        profile_before = profile_before.replace(
+            b"<recordTypeVisibilities>",
+            b"""<layoutAssignments>
+        <layout>Account-Account Layout</layout>
+    </layoutAssignments>
+    <layoutAssignments>
+        <layout>Account-Business Account Layout</layout>
+        <recordType>Account.Business_Account</recordType>
+    </layoutAssignments>
+    <recordTypeVisibilities>""",
+            1,
+        )
+    record_types = [
+        {
+            "record_type": "Account.HH_Account",
+            "default": True,
+            "person_account_default": True,
+            "page_layout": "Account-Household Layout",
+        },
+        {
+            "record_type": "Account.Business_Account",
+            "page_layout": "Account-Account Layout",
+        },
+    ]
+    task = create_task(
+        ProfileGrantAllAccess,
+        {"api_names": ["Admin"], "record_types": record_types},
+    )
+    task._create_directories(str(tmp_path))
+    profiles = task.retrieve_dir / "profiles"
+    profiles.mkdir()
+    (profiles / "Admin.profile").write_bytes(profile_before)
+
+    with mock.patch(
+        "cumulusci.tasks.metadata_etl.base.STREAMING_MIN_FILE_SIZE", 0
+    ), mock.patch.object(task, "_transform_entity") as transform_entity:
+        task._transform()
+
+    transform_entity.assert_not_called()
+    expected = task._transform_entity(
+        metadata_tree.fromstring(profile_before), "Admin"
+    ).tostring(xml_declaration=True)
+    xml_output = (task.deploy_dir / "profiles" / "Admin.profile").read_text()
+    assert xml_output == expected
+    assert xml_output.count("<layoutAssignments>") == (3 if with_layouts else 2)
+
+
+def test_transforms_profile__streaming_record_type_not_found(tmp_path):
+    task = create_task(
+        ProfileGrantAllAccess,
+        {"api_names": ["Admin"], "record_types": [{"record_type": "DOESNT_EXIST"}]},
+    )
+    task._create_directories(str(tmp_path))
+    profiles = task.retrieve_dir / "profiles"
+    profiles.mkdir()
+    (profiles / "Admin.profile").write_bytes(ADMIN_PROFILE_BEFORE)
+
+    with mock.patch(
+        "cumulusci.tasks.metadata_etl.base.STREAMING_MIN_FILE_SIZE", 0
+    ), pytest.raises(TaskOptionsError):
+        task._transform()
+
+
 def test_expand_package_xml():
     task = create_task(ProfileGrantAllAccess, {"api_names": ["Admin"]})
     task.tooling = mock.Mock()
@@ -6,6 +6,9 @@ import pytest
 
 from cumulusci.core.config import OrgConfig, TaskConfig
 from cumulusci.core.exceptions import ServiceNotConfigured
+from cumulusci.core.flowrunner import FlowCoordinator
+from cumulusci.salesforce_api.utils import OrgConnectionPool
+from cumulusci.tasks.bulkdata.mapping_parser import describe_data
 from cumulusci.tasks.salesforce import (
     BaseRetrieveMetadata,
     BaseSalesforceApiTask,
@@ -62,6 +65,49 @@ class TestBaseSalesforceApiTask:
         task._init_task()
         assert not task.sf.sf_instance.endswith("/")
 
+    def test_init_task__connection_pool(self):
+        project_config = create_project_config()
+        project_config.keychain = mock.Mock()
+        project_config.keychain.get_service.side_effect = ServiceNotConfigured
+        project_config.config["project"]["package"]["api_version"] = "51.0"
+        org_config = OrgConfig(
+            {"instance_url": "https://foo/", "access_token": "TOKEN"}, "test"
+        )
+        flow = mock.Mock(spec=FlowCoordinator)
+        flow.logger = mock.Mock()
+        flow.connection_pool = OrgConnectionPool(org_config)
+
+        tasks = [
+            BaseSalesforceApiTask(
+                project_config, TaskConfig(), org_config=org_config, flow=flow
+            )
+            for _ in range(2)
+        ]
+        for task in tasks:
+            task._init_task()
+
+        assert tasks[0].sf is tasks[1].sf
+        assert tasks[0].tooling is tasks[1].tooling
+        assert tasks[0].bulk is tasks[1].bulk
+        assert tasks[0].sf.session is flow.connection_pool.session
+
+    def test_init_task__connection_pool_without_flow(self):
+        project_config = create_project_config()
+        project_config.keychain = mock.Mock()
+        project_config.keychain.get_service.side_effect = ServiceNotConfigured
+        project_config.config["project"]["package"]["api_version"] = "51.0"
+        org_config = OrgConfig(
+            {"instance_url": "https://foo/", "access_token": "TOKEN"}, "test"
+        )
+        task = BaseSalesforceApiTask(
+            project_config, TaskConfig(), org_config=org_config
+        )
+        task.connection_pool = OrgConnectionPool(org_config)
+
+        task._init_task()
+
+        assert task.sf.session is task.connection_pool.session
+
 
 class TestBaseSalesforceMetadataApiTask:
     def test_run_task(self):
@@ -71,6 +117,24 @@ class TestBaseSalesforceMetadataApiTask:
         task()
         api.assert_called_once()
 
+    def test_run_task__clears_describes(self):
+        sf = mock.Mock()
+        sf.Account.describe.return_value = {"fields": [{"name": "Name"}]}
+        describe_data("Account", sf)
+        describe_data("Account", sf)
+        assert sf.Account.describe.call_count == 1
+
+        task = create_task(BaseSalesforceMetadataApiTask)
+        task.api_class = mock.Mock()
+        task()
+
+        # The deploy may have added fields
+        sf.Account.describe.return_value = {
+            "fields": [{"name": "Name"}, {"name": "New__c"}]
+        }
+        assert "New__c" in describe_data("Account", sf)
+        assert sf.Account.describe.call_count == 2
+
 
 class TestBaseRetrieveMetadata:
     def test_process_namespace(self):
@@ -364,6 +364,90 @@ def test_install_dependency_installs_unmanaged():
     )
 
 
+def test_install_dependency_installs_unmanaged__prefetched():
+    task = create_task(
+        UpdateDependencies,
+        {
+            "dependencies": [
+                {
+                    "zip_url": "http://example.com/foo",
+                }
+            ]
+        },
+    )
+    task.dependencies[0].__config__.extra = pydantic.Extra.allow
+    task.dependencies[0].install = mock.Mock()
+    task.org_config = mock.Mock()
+    task.prefetcher = mock.Mock()
+
+    task._install_dependency(task.dependencies[0])
+    task.prefetcher.get_metadata_package_zip_builder.assert_called_once_with(
+        task.dependencies[0]
+    )
+    task.dependencies[0].install.assert_called_once_with(
+        task.project_config,
+        task.org_config,
+        task.prefetcher.get_metadata_package_zip_builder.return_value,
+    )
+
+
+@mock.patch(
+    "cumulusci.tasks.salesforce.update_dependencies.UnmanagedDependencyPrefetcher"
+)
+def test_run_task_prefetches_unmanaged(prefetcher):
+    task = create_task(
+        UpdateDependencies,
+        {
+            "dependencies": [
+                {"zip_url": "http://example.com/foo"},
+            ],
+            "prefetch_workers": "3",
+        },
+    )
+    installing_with = []
+    task._install_dependency = mock.Mock(
+        side_effect=lambda d: installing_with.append(task.prefetcher)
+    )
+    task()
+
+    prefetcher.assert_called_once_with(
+        task.project_config, task.org_config, task.dependencies, max_workers=3
+    )
+    assert installing_with == [prefetcher.return_value.__enter__.return_value]
+    assert task.prefetcher is None
+
+
+@mock.patch(
+    "cumulusci.tasks.salesforce.update_dependencies.UnmanagedDependencyPrefetcher"
+)
+def test_run_task_prefetch_disabled(prefetcher):
+    task = create_task(
+        UpdateDependencies,
+        {
+            "dependencies": [
+                {"zip_url": "http://example.com/foo"},
+            ],
+            "prefetch_workers": 0,
+        },
+    )
+    task._install_dependency = mock.Mock()
+    task()
+
+    prefetcher.assert_not_called()
+    task._install_dependency.assert_called_once()
+
+
+def test_init_options__bad_prefetch_workers():
+    with pytest.raises(TaskOptionsError):
+        create_task(
+            UpdateDependencies,
+            {
+                "dependencies": [{"zip_url": "http://example.com/foo"}],
+                "prefetch_workers": "lots",
+            },
+        )
+
+
 @mock.patch("cumulusci.tasks.salesforce.update_dependencies.get_static_dependencies")
 def test_freeze(get_static_dependencies):
     get_static_dependencies.return_value = [
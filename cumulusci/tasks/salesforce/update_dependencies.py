@@ -1,3 +1,4 @@
+import contextlib
 from typing import List
 
 import click
@@ -6,8 +7,10 @@ from cumulusci.core.dependencies.dependencies import (
     Dependency,
     PackageNamespaceVersionDependency,
     PackageVersionIdDependency,
+    UnmanagedDependency,
     parse_dependencies,
 )
+from cumulusci.core.dependencies.prefetch import UnmanagedDependencyPrefetcher
 from cumulusci.core.dependencies.resolvers import (
     DependencyResolutionStrategy,
     dependency_filter_ignore_deps,
@@ -64,8 +67,13 @@ class UpdateDependencies(BaseSalesforceTask):
         "base_package_url_format": {
             "description": "If `interactive` is set to True, display package Ids using a format string ({} will be replaced with the package Id)."
         },
+        "prefetch_workers": {
+            "description": "Number of background threads used to download and build upcoming "
+            "unmanaged dependencies while earlier dependencies are installed. Set to 0 to disable. Defaults to 2."
+        },
         **{k: v for k, v in PACKAGE_INSTALL_TASK_OPTIONS.items() if k != "password"},
     }
+    prefetcher = None
 
     def _init_options(self, kwargs):
         super(UpdateDependencies, self)._init_options(kwargs)
@@ -169,6 +177,11 @@ class UpdateDependencies(BaseSalesforceTask):
             self.options.get("base_package_url_format") or "{}"
         )
 
+        try:
+            self.prefetch_workers = int(self.options.get("prefetch_workers", 2))
+        except ValueError:
+            raise TaskOptionsError("The prefetch_workers option must be an integer.")
+
     def _filter_dependencies(self, deps: List[Dependency]) -> List[Dependency]:
         return [
             dep
@@ -220,8 +233,21 @@ class UpdateDependencies(BaseSalesforceTask):
             if not click.confirm("Continue to install dependencies?", default=True):
                 raise CumulusCIException("Dependency installation was canceled.")
 
-        for d in dependencies:
-            self._install_dependency(d)
+        with contextlib.ExitStack() as stack:
+            if self.prefetch_workers > 0:
+                # Download and build unmanaged dependencies while earlier ones install.
+                self.prefetcher = stack.enter_context(
+                    UnmanagedDependencyPrefetcher(
+                        self.project_config,
+                        self.org_config,
+                        dependencies,
+                        max_workers=self.prefetch_workers,
+                    )
+                )
+                stack.callback(setattr, self, "prefetcher", None)
+
+            for d in dependencies:
+                self._install_dependency(d)
 
         self.org_config.reset_installed_packages()
 
@@ -232,6 +258,12 @@ class UpdateDependencies(BaseSalesforceTask):
             dependency.install(
                 self.project_config, self.org_config, self.install_options
             )
+        elif self.prefetcher and isinstance(dependency, UnmanagedDependency):
+            dependency.install(
+                self.project_config,
+                self.org_config,
+                self.prefetcher.get_metadata_package_zip_builder(dependency),
+            )
         else:
             dependency.install(self.project_config, self.org_config)
 
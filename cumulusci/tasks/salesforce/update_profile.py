@@ -203,39 +203,51 @@ class ProfileGrantAllAccess(MetadataSingleEntityTransformTask, BaseSalesforceApi
                 )
 
     def _transform_entity(self, tree, api_name):
-        # Custom applications
-        self._set_elements_visible(tree, "applicationVisibilities", "visible")
-        # Apex classes
-        self._set_elements_visible(tree, "classAccesses", "enabled")
-        # Fields
-        self._set_elements_visible(tree, "fieldPermissions", "editable")
-        self._set_elements_visible(tree, "fieldPermissions", "readable")
-        # Visualforce pages
-        self._set_elements_visible(tree, "pageAccesses", "enabled")
-        # Custom tabs
-        self._set_elements_visible(
-            tree,
-            "tabVisibilities",
-            "visibility",
-            false_value="Hidden",
-            true_value="DefaultOn",
-        )
-        # Record Types
-        self._set_record_types(tree, api_name)
+        transforms, add_children = self._get_child_transforms(api_name)
+        for tag, transform in transforms.items():
+            for elem in tree.findall(tag):
+                transform(elem)
+        add_children(tree, None)
 
         return tree
 
-    def _set_elements_visible(
-        self, tree, outer_tag, inner_tag, false_value="false", true_value="true"
-    ):
-        for elem in tree.findall(outer_tag, **{inner_tag: false_value}):
-            elem.find(inner_tag).text = true_value
+    def _get_child_transforms(self, api_name):
+        transforms = {
+            # Custom applications
+            "applicationVisibilities": self._set_visible("visible"),
+            # Apex classes
+            "classAccesses": self._set_visible("enabled"),
+            # Fields
+            "fieldPermissions": self._set_visible("editable", "readable"),
+            # Visualforce pages
+            "pageAccesses": self._set_visible("enabled"),
+            # Custom tabs
+            "tabVisibilities": self._set_visible(
+                "visibility", false_value="Hidden", true_value="DefaultOn"
+            ),
+        }
+        # Record Types
+        record_type_transforms, add_children = self._set_record_types(api_name)
+        transforms.update(record_type_transforms)
+
+        return transforms, add_children
+
+    def _set_visible(self, *inner_tags, false_value="false", true_value="true"):
+        def set_visible(elem):
+            for inner_tag in inner_tags:
+                inner = elem.find(inner_tag)
+                if inner is not None and inner.text == false_value:
+                    inner.text = true_value
 
-    def _set_record_types(self, tree, api_name):
+        return set_visible
+
+    def _set_record_types(self, api_name):
         # Do namespace injection
         record_types = self.options.get("record_types") or []
         for rt in record_types:
             rt["record_type"] = rt["record_type"].format(**self.namespace_prefixes)
+        record_types_by_name = {rt["record_type"]: rt for rt in record_types}
+        found_record_types = set()
 
         # If defaults are specified, clear any pre-existing defaults
         # that apply to the same object
@@ -244,28 +256,37 @@ class ProfileGrantAllAccess(MetadataSingleEntityTransformTask, BaseSalesforceApi
             "person_account_default": "personAccountDefault",
         }
         objects_with_defaults = defaultdict(set)
-
-        for option, default_element in defaults.items():
+        for option in defaults:
             for rt in record_types:
                 if option in rt:
                     objects_with_defaults[option].add(rt["record_type"].split(".")[0])
 
-            for elem in tree.findall("recordTypeVisibilities"):
+        # We need page layouts to look like this:
+        # <layoutAssignments>
+        #   <layout>{page_layout}</layout>
+        #   <recordType>{record_type}</recordType>
+        # </layoutAssignments>
+        layouts = {
+            rt["record_type"]: rt["page_layout"]
+            for rt in record_types
+            if rt.get("page_layout")
+        }
+        found_layouts = set()
+
+        def set_record_type_visibility(elem):
+            record_type = elem.find("recordType")
+            record_type = record_type.text if record_type is not None else None
+            for option, default_element in defaults.items():
                 if (
                     elem.find(default_element)
-                    and elem.recordType.text.split(".")[0]
-                    in objects_with_defaults[option]
+                    and record_type.split(".")[0] in objects_with_defaults[option]
                 ):
                     elem.find(default_element).text = "false"
 
-        # Set recordTypeVisibilities
-        for rt in record_types:
-            # Look for the recordTypeVisibilities element
-            elem = tree.find("recordTypeVisibilities", recordType=rt["record_type"])
-            if elem is None:
-                raise TaskOptionsError(
-                    f"Record Type {rt['record_type']} not found in retrieved {api_name}.profile"
-                )
+            rt = record_types_by_name.get(record_type)
+            if rt is None:
+                return
+            found_record_types.add(record_type)
 
             # Set visible
             elem.visible.text = str(rt.get("visible", "true")).lower()
@@ -278,26 +299,35 @@ class ProfileGrantAllAccess(MetadataSingleEntityTransformTask, BaseSalesforceApi
             if pa_default is not None:
                 pa_default.text = str(rt.get("person_account_default", "false")).lower()
 
-        # Set page layout defaults for record types
-        for rt in record_types:
-            # We need it to look like this:
-            # <layoutAssignments>
-            #   <layout>{page_layout}</layout>
-            #   <recordType>{record_type}</recordType>
-            # </layoutAssignments>
-            layout_option = rt.get("page_layout", None)
-            if layout_option:
-                # Look for page layout definitions in the record type
-                found_layout = False
-                for elem in tree.findall("layoutAssignments"):
-                    if elem.find("recordType").text == rt["record_type"]:
-                        elem.layout.text = layout_option
-                        found_layout = True
-
-                if not found_layout:
+        def set_layout(elem):
+            # Set page layout defaults for record types
+            record_type = elem.find("recordType")
+            if record_type is not None and record_type.text in layouts:
+                elem.layout.text = layouts[record_type.text]
+                found_layouts.add(record_type.text)
+
+        def add_children(tree, tag):
+            if tag is None:
+                for rt in record_types:
+                    if rt["record_type"] not in found_record_types:
+                        raise TaskOptionsError(
+                            f"Record Type {rt['record_type']} not found in retrieved {api_name}.profile"
+                        )
+            # Add missing page layouts after the existing ones
+            if tag not in ("layoutAssignments", None):
+                return
+            for record_type, layout in layouts.items():
+                if record_type not in found_layouts:
                     assignment = tree.append(tag="layoutAssignments")
-                    assignment.append(tag="recordType", text=rt["record_type"])
-                    assignment.append(tag="layout", text=layout_option)
+                    assignment.append(tag="recordType", text=record_type)
+                    assignment.append(tag="layout", text=layout)
+                    found_layouts.add(record_type)
+
+        transforms = {
+            "recordTypeVisibilities": set_record_type_visibility,
+            "layoutAssignments": set_layout,
+        }
+        return transforms, add_children
 
 
 UpdateAdminProfile = UpdateProfile = ProfileGrantAllAccess
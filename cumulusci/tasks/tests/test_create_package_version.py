@@ -290,12 +290,11 @@ class TestCreatePackageVersion:
                 ],
             },
         )
-        # query dependency org for installed package 1
-        responses.add(
+        responses.add(  # query dependency org for installed package versions
             "GET",
             f"{self.scratch_base_url}/tooling/query/",
             json={
-                "size": 1,
+                "size": 2,
                 "records": [
                     {
                         "Id": "04t000000000002AAA",
@@ -304,16 +303,7 @@ class TestCreatePackageVersion:
                         "PatchVersion": 0,
                         "BuildNumber": 1,
                         "IsBeta": False,
-                    }
-                ],
-            },
-        )
-        responses.add(  # query dependency org for installed package 2)
-            "GET",
-            f"{self.scratch_base_url}/tooling/query/",
-            json={
-                "size": 1,
-                "records": [
+                    },
                     {
                         "Id": "04t000000000003AAA",
                         "MajorVersion": 1,
@@ -321,7 +311,7 @@ class TestCreatePackageVersion:
                         "PatchVersion": 0,
                         "BuildNumber": 1,
                         "IsBeta": False,
-                    }
+                    },
                 ],
             },
         )
@@ -396,6 +396,40 @@ Options\n------------------------------------------\n\n
         result = zf.read("test")
         assert b"test" in result
 
+    def test_download_extract_github_from_repo__cache(self):
+        f = io.BytesIO()
+        with zipfile.ZipFile(f, "w") as zf:
+            zf.writestr("top/", "top")
+            zf.writestr("top/src/test", "test")
+        zipbytes = f.getvalue()
+
+        def assign_bytes(archive_type, zip_content, ref=None):
+            zip_content.write(zipbytes)
+            return True
+
+        mock_repo = mock.Mock(default_branch="main")
+        mock_repo.archive.side_effect = assign_bytes
+        sha = "a" * 40
+        with utils.temporary_dir() as d:
+            zf = utils.download_extract_github_from_repo(
+                mock_repo, "src", ref=sha, cache_dir=d
+            )
+            assert zf.read("test") == b"test"
+            assert os.listdir(d) == [f"{sha}.zip"]
+
+            zf = utils.download_extract_github_from_repo(
+                mock_repo, "src", ref=sha, cache_dir=d
+            )
+            assert zf.read("test") == b"test"
+            mock_repo.archive.assert_called_once()
+
+            # Refs that aren't commit SHAs can move, so they are never cached
+            utils.download_extract_github_from_repo(
+                mock_repo, "src", ref="main", cache_dir=d
+            )
+            assert mock_repo.archive.call_count == 2
+            assert os.listdir(d) == [f"{sha}.zip"]
+
     def test_download_extract_github__failure(self):
         mock_repo = mock.Mock(default_branch="main")
         mock_github = mock.Mock()
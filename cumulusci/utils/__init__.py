@@ -32,6 +32,7 @@ CUMULUSCI_PATH = os.path.realpath(
 META_XML_CLEAN_DIRS = ("classes/", "triggers/", "pages/", "aura/", "components/")
 API_DATE_FORMAT = "%Y-%m-%dT%H:%M:%S.%f"
 DATETIME_LEN = len("2018-08-07T16:00:56.000")
+COMMIT_SHA_RE = re.compile(r"^[0-9a-f]{40}$")
 
 BREW_DEPRECATION_MSG = (
     "It looks like you have installed CumulusCI using brew."
@@ -148,18 +149,33 @@ def download_extract_github(
     )
 
 
-def download_extract_github_from_repo(github_repo, subfolder=None, ref=None):
+def download_extract_github_from_repo(
+    github_repo, subfolder=None, ref=None, cache_dir=None
+):
+    """Download a zipball of the repository at `ref`.
+
+    If `cache_dir` is given and `ref` is a full commit SHA, the zipball is
+    stored in (and reused from) `cache_dir`, since its content can't change."""
     if not ref:
         ref = github_repo.default_branch
-    zip_content = io.BytesIO()
-    if not github_repo.archive("zipball", zip_content, ref=ref):
-        raise CumulusCIException(
-            f"Unable to download an archive of the Git ref {ref} from "
-            f"{github_repo.full_name}. This can mean that the ref has "
-            "not been pushed to the server, that CumulusCI's credential "
-            "does not have permission to access it, or that your access "
-            "is restricted by an IP address allow list."
-        )
+    cache_path = None
+    if cache_dir and COMMIT_SHA_RE.match(ref):
+        cache_path = Path(cache_dir, f"{ref}.zip")
+
+    if cache_path and cache_path.exists():
+        zip_content = io.BytesIO(cache_path.read_bytes())
+    else:
+        zip_content = io.BytesIO()
+        if not github_repo.archive("zipball", zip_content, ref=ref):
+            raise CumulusCIException(
+                f"Unable to download an archive of the Git ref {ref} from "
+                f"{github_repo.full_name}. This can mean that the ref has "
+                "not been pushed to the server, that CumulusCI's credential "
+                "does not have permission to access it, or that your access "
+                "is restricted by an IP address allow list."
+            )
+        if cache_path:
+            _write_cache_file(cache_path, zip_content.getvalue())
     zip_file = zipfile.ZipFile(zip_content)
     path = sorted(zip_file.namelist())[0]
     if subfolder:
@@ -168,6 +184,20 @@ def download_extract_github_from_repo(github_repo, subfolder=None, ref=None):
     return zip_file
 
 
+def _write_cache_file(path: Path, content: bytes):
+    """Write a cache file atomically, so concurrent readers and writers
+    never see a partial file."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(content)
+        os.replace(tmp_path, path)
+    except Exception:
+        os.unlink(tmp_path)
+        raise
+
+
 def process_text_in_directory(path, process_file):
     """Process each file in a directory using the `process_file` function.
 
@@ -1,14 +1,30 @@
+import heapq
+import re
+import time
 import typing as T
-from concurrent.futures import as_completed
+from concurrent.futures import FIRST_COMPLETED, wait
 from itertools import chain
+from urllib.parse import quote
 
-from requests.exceptions import ReadTimeout
+from requests.exceptions import HTTPError, ReadTimeout
 from requests_futures.sessions import FuturesSession
 
 from cumulusci.utils.iterators import iterate_in_chunks, partition
 
 RECOVERABLE_ERRORS = (ReadTimeout, ConnectionError)
 
+# Responses to requests which the server turned away, and which can be sent again
+RETRY_STATUS_CODES = (429, 503)
+
+# API limits on the number of subrequests in one request
+COMPOSITE_CHUNK_SIZE = 25
+BATCH_CHUNK_SIZE = 25
+GRAPH_MAX_NODES = 500
+COLLECTION_CHUNK_SIZE = 200
+
+# e.g. Sforce-Limit-Info: api-usage=25/15000
+API_USAGE_PATTERN = re.compile(r"api-usage=(\d+)/(\d+)")
+
 
 class HTTPRequestError(T.NamedTuple):
     exception: Exception
@@ -16,11 +32,24 @@ class HTTPRequestError(T.NamedTuple):
 
 
 class ParallelHTTP:
-    """A parallelized HTTP client as a context manager"""
+    """A parallelized HTTP client as a context manager.
+
+    Responses with status codes in RETRY_STATUS_CODES are retried with an
+    exponential backoff (or after their Retry-After time), up to `max_retries`
+    times. The number of requests in flight starts at `max_workers`, is halved
+    each time the server turns one away, and grows again by one for each
+    request that succeeds."""
 
-    def __init__(self, base_url, max_workers=32):
+    def __init__(
+        self, base_url, max_workers=32, timeout=30, max_retries=3, backoff_factor=1
+    ):
         self.base_url = base_url
         self.max_workers = max_workers
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.concurrency = max_workers
+        self.api_usage = None  # (used, limit) from the last response that had it
 
     def __enter__(self, *args):
         self.session = FuturesSession(max_workers=self.max_workers)
@@ -39,7 +68,7 @@ class ParallelHTTP:
             url=self.base_url + url.lstrip("/"),
             headers=headers,
             json=json,
-            timeout=30,
+            timeout=self.timeout,
         )
 
     def do_requests(self, requests: T.Iterable[T.Dict]):
@@ -47,18 +76,75 @@ class ParallelHTTP:
 
         Returns a tuple with a sequence of successes and a sequence of failures.
         """
+        successes, errors = collate_results(self.do_requests_in_order(requests))
 
-        futures_to_requests = {
-            self._async_request(**request): request for request in requests
-        }
+        return successes, errors
 
-        results = (
-            future_with_exception_handling(future, futures_to_requests)
-            for future in as_completed(futures_to_requests.keys())
-        )
-        successes, errors = collate_results(results)
+    def do_requests_in_order(self, requests: T.Iterable[T.Dict]) -> T.List:
+        """Initiate requests and wait for them to complete.
 
-        return successes, errors
+        Returns a list with the response (or an HTTPRequestError) for each request.
+        """
+        requests = list(requests)
+        results = [None] * len(requests)
+        attempts = [0] * len(requests)
+        ready = list(range(len(requests)))[::-1]  # a stack of request indexes
+        delayed = []  # a heap of (time, index) for retries
+        in_flight = {}
+
+        while ready or delayed or in_flight:
+            while delayed and delayed[0][0] <= time.monotonic():
+                ready.append(heapq.heappop(delayed)[1])
+            while ready and len(in_flight) < self.concurrency:
+                index = ready.pop()
+                in_flight[self._async_request(**requests[index])] = index
+
+            if not in_flight:
+                time.sleep(max(0, delayed[0][0] - time.monotonic()))
+                continue
+            timeout = delayed[0][0] - time.monotonic() if delayed else None
+            done, _ = wait(
+                in_flight,
+                timeout=max(0, timeout) if timeout is not None else None,
+                return_when=FIRST_COMPLETED,
+            )
+
+            for future in done:
+                index = in_flight.pop(future)
+                result = future_with_exception_handling(
+                    future, {future: requests[index]}
+                )
+                if isinstance(result, HTTPRequestError):
+                    results[index] = result
+                    continue
+
+                self._track_api_usage(result)
+                if (
+                    result.status_code in RETRY_STATUS_CODES
+                    and attempts[index] < self.max_retries
+                ):
+                    self.concurrency = max(1, self.concurrency // 2)
+                    retry_at = time.monotonic() + self._get_backoff(
+                        result, attempts[index]
+                    )
+                    attempts[index] += 1
+                    heapq.heappush(delayed, (retry_at, index))
+                else:
+                    self.concurrency = min(self.max_workers, self.concurrency + 1)
+                    results[index] = result
+
+        return results
+
+    def _get_backoff(self, response, attempt: int) -> float:
+        retry_after = response.headers.get("Retry-After", "")
+        if retry_after.isdigit():
+            return int(retry_after)
+        return self.backoff_factor * 2**attempt
+
+    def _track_api_usage(self, response):
+        match = API_USAGE_PATTERN.search(response.headers.get("Sforce-Limit-Info", ""))
+        if match:
+            self.api_usage = (int(match[1]), int(match[2]))
 
 
 def future_with_exception_handling(future, futures_to_requests):
@@ -76,10 +162,10 @@ def collate_results(result_iterable: T.Sequence) -> T.Tuple[T.Generator, T.Gener
 class ParallelSalesforce(ParallelHTTP):
     """A context-managed HTTP client that can parallelize access to a Simple-Salesforce connection"""
 
-    def __init__(self, sf, max_workers=32):
+    def __init__(self, sf, max_workers=32, **kwargs):
         self.sf = sf
         base_url = self.sf.base_url.rstrip("/") + "/"
-        super().__init__(base_url, max_workers)
+        super().__init__(base_url, max_workers, **kwargs)
 
     def _async_request(
         self, url: str, method: str, json: object = None, httpHeaders: dict = None
@@ -115,21 +201,23 @@ IDEMPOTENT_METHODS = ("GET", "PUT")
 
 
 class CompositeParallelSalesforce:
-    """Salesforce Session which uses the Composite API multiple times
+    """Salesforce Session which uses the Composite APIs multiple times
     in parallel.
     """
 
     max_workers = 32
-    chunk_size = 25  # max composite batch size
+    chunk_size = COMPOSITE_CHUNK_SIZE
     psf = None
 
-    def __init__(self, sf, chunk_size=None, max_workers=None):
+    def __init__(self, sf, chunk_size=None, max_workers=None, **http_options):
+        """http_options are passed on to ParallelHTTP, e.g. timeout or max_retries"""
         self.sf = sf
         self.chunk_size = chunk_size or self.chunk_size
         self.max_workers = max_workers or self.max_workers
+        self.http_options = http_options
 
     def open(self):
-        self.psf = ParallelSalesforce(self.sf, self.max_workers)
+        self.psf = ParallelSalesforce(self.sf, self.max_workers, **self.http_options)
         self.psf.__enter__()
 
     def close(self):
@@ -142,14 +230,22 @@ class CompositeParallelSalesforce:
     def __exit__(self, *args):
         self.close()
 
-    def do_composite_requests(
-        self, requests
-    ) -> T.Tuple[T.Sequence, T.Sequence]:  # results, errors
+    @property
+    def api_usage(self) -> T.Optional[T.Tuple[int, int]]:
+        """The org's (used, limit) daily API requests, as of the last response"""
+        return self.psf.api_usage if self.psf else None
+
+    def _check_open(self):
         if not self.psf:
             raise AssertionError(
                 "Session was not opened. Please call open() or use as a context manager"
             )
 
+    def do_composite_requests(
+        self, requests
+    ) -> T.Tuple[T.Sequence, T.Sequence]:  # results, errors
+        self._check_open()
+
         composite_requests = create_composite_requests(requests, self.chunk_size)
         composite_results, errors = self.psf.do_requests(composite_requests)
         individual_results = parse_composite_results(composite_results)
@@ -199,10 +295,214 @@ class CompositeParallelSalesforce:
 
         return singleton_results, unrecoverable_errors + errors
 
+    def do_batch_requests(self, requests) -> T.Tuple[T.List, T.List]:
+        """Make requests with the Composite Batch API, which runs each one on
+        its own. Requests are dicts like Composite subrequests, with a method,
+        a url and optionally a body.
+
+        Returns a list with the result of each request (a dict with its
+        statusCode and result), or None if it could not be made, and a list
+        of errors. GET and PUT requests in batches that failed with a
+        recoverable error are retried one at a time."""
+        self._check_open()
+
+        batches = create_batch_requests(requests, BATCH_CHUNK_SIZE)
+        results = []
+        errors = []
+        for batch, response in zip(batches, self.psf.do_requests_in_order(batches)):
+            error = check_response(response, batch)
+            if error is None:
+                results.extend(response.json()["results"])
+            elif isinstance(error.exception, RECOVERABLE_ERRORS):
+                batch_results, batch_errors = self._retry_batch(error)
+                results.extend(batch_results)
+                errors.extend(batch_errors)
+            else:
+                results.extend([None] * len(batch["json"]["batchRequests"]))
+                errors.append(error)
+
+        return results, errors
+
+    def _retry_batch(self, error: HTTPRequestError):
+        "Retry the idempotent requests of a batch one at a time"
+        single_requests = split_requests(error.request)
+        retried = iter(
+            self.psf.do_requests_in_order(
+                request
+                for request in single_requests
+                if request["method"] in IDEMPOTENT_METHODS
+            )
+        )
+        results = []
+        errors = []
+        for request in single_requests:
+            response = (
+                next(retried) if request["method"] in IDEMPOTENT_METHODS else None
+            )
+            if response is None:
+                results.append(None)
+                errors.append(HTTPRequestError(error.exception, request))
+            elif isinstance(response, HTTPRequestError):
+                results.append(None)
+                errors.append(response)
+            else:
+                results.append(
+                    {
+                        "statusCode": response.status_code,
+                        "result": response_body(response),
+                    }
+                )
+        return results, errors
+
+    def do_graph_requests(self, graphs) -> T.Tuple[T.List, T.List]:
+        """Make requests with the Composite Graph API. Graphs are dicts with a
+        graphId and a compositeRequest list, and are sent as few requests as
+        the limit on the nodes in one request allows.
+
+        Returns a list of graph responses and a list of errors. Graphs are
+        not retried, since their requests might have been made."""
+        self._check_open()
+
+        graph_requests = create_graph_requests(graphs, GRAPH_MAX_NODES)
+        results = []
+        errors = []
+        for request, response in zip(
+            graph_requests, self.psf.do_requests_in_order(graph_requests)
+        ):
+            error = check_response(response, request)
+            if error is None:
+                results.extend(response.json()["graphs"])
+            else:
+                errors.append(error)
+
+        return results, errors
+
+    def save_records(
+        self, records, method: str = "POST", all_or_none: bool = False
+    ) -> T.Tuple[T.List, T.List]:
+        """Create (POST) or update (PATCH) records with the sObject Collections
+        API. Each record needs attributes with its type.
+
+        Returns a list with the save result of each record, or None if it
+        could not be saved, and a list of errors."""
+        requests = [
+            {
+                "url": "composite/sobjects",
+                "method": method,
+                "json": {"allOrNone": all_or_none, "records": list(chunk)},
+            }
+            for chunk in iterate_in_chunks(COLLECTION_CHUNK_SIZE, records)
+        ]
+        return self._do_collection_requests(
+            requests, [len(request["json"]["records"]) for request in requests]
+        )
+
+    def delete_records(self, ids, all_or_none: bool = False) -> T.Tuple[T.List, T.List]:
+        """Delete records with the sObject Collections API.
+
+        Returns a list with the delete result of each record, or None if it
+        could not be deleted, and a list of errors."""
+        chunks = list(iterate_in_chunks(COLLECTION_CHUNK_SIZE, ids))
+        requests = [
+            {
+                "url": f"composite/sobjects?ids={quote(','.join(chunk))}"
+                f"&allOrNone={str(all_or_none).lower()}",
+                "method": "DELETE",
+            }
+            for chunk in chunks
+        ]
+        return self._do_collection_requests(requests, [len(chunk) for chunk in chunks])
+
+    def _do_collection_requests(self, requests, sizes):
+        self._check_open()
+
+        results = []
+        errors = []
+        responses = self.psf.do_requests_in_order(requests)
+        for request, size, response in zip(requests, sizes, responses):
+            error = check_response(response, request)
+            if error is None:
+                results.extend(response.json())
+            else:
+                results.extend([None] * size)
+                errors.append(error)
+
+        return results, errors
+
+
+def check_response(response, request: dict) -> T.Optional[HTTPRequestError]:
+    "Return an HTTPRequestError for a failed request, or None"
+    if isinstance(response, HTTPRequestError):
+        return response
+    try:
+        response.raise_for_status()
+    except HTTPError as e:
+        return HTTPRequestError(exception=e, request=request)
+
+
+def response_body(response):
+    return response.json() if response.content else None
+
+
+def create_batch_requests(requests, chunk_size) -> T.List[dict]:
+    """Format Composite Batch messages"""
+    prefix = "/services/data/"
+
+    def batch_request(request):
+        batch_request = {
+            "method": request["method"],
+            "url": request["url"][len(prefix) :]
+            if request["url"].startswith(prefix)
+            else request["url"].lstrip("/"),
+        }
+        if request.get("body") is not None:
+            batch_request["richInput"] = request["body"]
+        return batch_request
+
+    return [
+        {
+            "url": "composite/batch",
+            "method": "POST",
+            "json": {
+                "batchRequests": [batch_request(request) for request in chunk],
+                "haltOnError": False,
+            },
+        }
+        for chunk in iterate_in_chunks(chunk_size, requests)
+    ]
+
+
+def create_graph_requests(graphs, max_nodes) -> T.List[dict]:
+    """Format Composite Graph messages with at most max_nodes nodes each
+    (unless a single graph has more)"""
+    chunks = []
+    nodes = 0
+    for graph in graphs:
+        size = len(graph["compositeRequest"])
+        if not chunks or nodes + size > max_nodes:
+            chunks.append([])
+            nodes = 0
+        chunks[-1].append(graph)
+        nodes += size
+
+    return [
+        {"url": "composite/graph", "method": "POST", "json": {"graphs": chunk}}
+        for chunk in chunks
+    ]
+
 
 def split_requests(composite_request: dict):
     # need to remove this prefix-pattern because it will be added again later
     prefix = "/services/data/"
+    if "batchRequests" in composite_request["json"]:
+        return [
+            {
+                "method": r["method"],
+                "url": "/" + r["url"].split("/", 1)[1],
+                "json": r.get("richInput"),
+            }
+            for r in composite_request["json"]["batchRequests"]
+        ]
     single_requests = [r.copy() for r in composite_request["json"]["compositeRequest"]]
     for request in single_requests:
         del request["referenceId"]
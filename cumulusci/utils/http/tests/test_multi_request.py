@@ -1,8 +1,17 @@
+import json
+from unittest import mock
+
 import pytest
 import responses
+from requests.exceptions import ReadTimeout
 
 from cumulusci.tests.util import FakeUnreliableRequestHandler
-from cumulusci.utils.http.multi_request import CompositeParallelSalesforce
+from cumulusci.utils.http import multi_request
+from cumulusci.utils.http.multi_request import (
+    CompositeParallelSalesforce,
+    ParallelSalesforce,
+    create_graph_requests,
+)
 
 COMPOSITE_RESPONSE = {
     "compositeResponse": [
@@ -253,3 +262,184 @@ class TestCompositeParallelSalesforce:
         # The POST should not.
         assert len(errors) == 1, str(errors)
         assert single_request_handler.counter == 1
+
+
+class TestParallelSalesforce:
+    @responses.activate
+    def test_retry_status_codes(self, sf):
+        url = f"{sf.base_url}limits"
+        responses.add(responses.GET, url, status=429, headers={"Retry-After": "0"})
+        responses.add(responses.GET, url, status=503, headers={"Retry-After": "0"})
+        responses.add(
+            responses.GET,
+            url,
+            json={},
+            headers={"Sforce-Limit-Info": "api-usage=18/5000"},
+        )
+
+        with ParallelSalesforce(sf, max_workers=4, backoff_factor=0) as psf:
+            results = psf.do_requests_in_order([{"url": "limits", "method": "GET"}])
+            # halved twice, then one success
+            assert psf.concurrency == 2
+
+        assert results[0].status_code == 200
+        assert len(responses.calls) == 3
+        assert psf.api_usage == (18, 5000)
+
+    @responses.activate
+    def test_retry_status_codes__give_up(self, sf):
+        url = f"{sf.base_url}limits"
+        responses.add(responses.GET, url, status=503)
+
+        with ParallelSalesforce(sf, max_retries=2, backoff_factor=0) as psf:
+            successes, errors = psf.do_requests(
+                [{"url": "limits", "method": "GET"}] * 2
+            )
+            assert [response.status_code for response in successes] == [503, 503]
+
+        assert len(responses.calls) == 6
+
+
+def batch_callback(request):
+    batch = json.loads(request.body)["batchRequests"]
+    results = [
+        {"statusCode": 200, "result": {"url": subrequest["url"]}}
+        for subrequest in batch
+    ]
+    return (200, {}, json.dumps({"hasErrors": False, "results": results}))
+
+
+class TestCompositeAPIs:
+    @responses.activate
+    def test_do_batch_requests(self, sf):
+        responses.add_callback(
+            responses.POST, f"{sf.base_url}composite/batch", callback=batch_callback
+        )
+        requests = [
+            {"method": "GET", "url": f"/services/data/v50.0/sobjects/Object{i}"}
+            for i in range(5)
+        ]
+
+        with mock.patch.object(multi_request, "BATCH_CHUNK_SIZE", 2):
+            with CompositeParallelSalesforce(sf, max_workers=2) as cpsf:
+                results, errors = cpsf.do_batch_requests(requests)
+
+        assert errors == []
+        assert [result["result"]["url"] for result in results] == [
+            f"v50.0/sobjects/Object{i}" for i in range(5)
+        ]
+        body = json.loads(responses.calls[0].request.body)
+        assert body["haltOnError"] is False
+
+    @responses.activate
+    def test_do_batch_requests__retry(self, sf):
+        responses.add(
+            responses.POST, f"{sf.base_url}composite/batch", body=ReadTimeout()
+        )
+        responses.add(
+            responses.GET, f"{sf.base_url}sobjects/Account", json={"name": "Account"}
+        )
+        requests = [
+            {"method": "GET", "url": "/services/data/v50.0/sobjects/Account"},
+            {
+                "method": "POST",
+                "url": "/services/data/v50.0/sobjects/Account",
+                "body": {"Name": "Acme"},
+            },
+        ]
+
+        with CompositeParallelSalesforce(sf) as cpsf:
+            results, errors = cpsf.do_batch_requests(requests)
+
+        # only the GET can be made again
+        assert results == [{"statusCode": 200, "result": {"name": "Account"}}, None]
+        assert len(errors) == 1
+        assert isinstance(errors[0].exception, ReadTimeout)
+        assert errors[0].request == {
+            "method": "POST",
+            "url": "/sobjects/Account",
+            "json": {"Name": "Acme"},
+        }
+
+    @responses.activate
+    def test_do_batch_requests__error(self, sf):
+        responses.add(responses.POST, f"{sf.base_url}composite/batch", status=400)
+
+        with CompositeParallelSalesforce(sf) as cpsf:
+            results, errors = cpsf.do_batch_requests(
+                [{"method": "GET", "url": "/services/data/v50.0/limits"}]
+            )
+
+        assert results == [None]
+        assert errors[0].exception.response.status_code == 400
+
+    @responses.activate
+    def test_do_graph_requests(self, sf):
+        responses.add(
+            responses.POST,
+            f"{sf.base_url}composite/graph",
+            json={"graphs": [{"graphId": "1", "isSuccessful": True}]},
+        )
+        graphs = [{"graphId": "1", "compositeRequest": [{}]}]
+
+        with CompositeParallelSalesforce(sf) as cpsf:
+            results, errors = cpsf.do_graph_requests(graphs)
+
+        assert results == [{"graphId": "1", "isSuccessful": True}]
+        assert errors == []
+        assert json.loads(responses.calls[0].request.body) == {"graphs": graphs}
+
+    def test_create_graph_requests(self):
+        graphs = [
+            {"graphId": str(size), "compositeRequest": [{}] * size}
+            for size in (2, 3, 6, 1)
+        ]
+
+        requests = create_graph_requests(graphs, 5)
+
+        assert [
+            [graph["graphId"] for graph in request["json"]["graphs"]]
+            for request in requests
+        ] == [["2", "3"], ["6"], ["1"]]
+
+    @responses.activate
+    def test_save_records(self, sf):
+        url = f"{sf.base_url}composite/sobjects"
+        responses.add(
+            responses.PATCH, url, json=[{"id": "001", "success": True, "errors": []}]
+        )
+        responses.add(responses.PATCH, url, status=400, json=[{"message": "Bad"}])
+        records = [
+            {"attributes": {"type": "Account"}, "Id": f"00{i}", "Name": "Acme"}
+            for i in range(2)
+        ]
+
+        with mock.patch.object(multi_request, "COLLECTION_CHUNK_SIZE", 1):
+            with CompositeParallelSalesforce(sf, max_workers=1) as cpsf:
+                results, errors = cpsf.save_records(records, method="PATCH")
+
+        assert results == [{"id": "001", "success": True, "errors": []}, None]
+        assert errors[0].request["json"]["records"] == [records[1]]
+        body = json.loads(responses.calls[0].request.body)
+        assert body == {"allOrNone": False, "records": [records[0]]}
+
+    @responses.activate
+    def test_delete_records(self, sf):
+        responses.add(
+            responses.DELETE,
+            f"{sf.base_url}composite/sobjects",
+            json=[
+                {"id": "001", "success": True, "errors": []},
+                {"id": "002", "success": True, "errors": []},
+            ],
+        )
+
+        with CompositeParallelSalesforce(sf) as cpsf:
+            results, errors = cpsf.delete_records(["001", "002"], all_or_none=True)
+            assert cpsf.api_usage is None
+
+        assert [result["id"] for result in results] == ["001", "002"]
+        assert errors == []
+        assert responses.calls[0].request.url.endswith(
+            "composite/sobjects?ids=001%2C002&allOrNone=true"
+        )
@@ -2,6 +2,7 @@ import json
 import logging
 import shutil
 import typing as T
+import uuid
 from contextlib import contextmanager
 from multiprocessing import Queue
 from pathlib import Path
@@ -19,6 +20,7 @@ from cumulusci.core.config import (
 )
 from cumulusci.core.keychain.subprocess_keychain import SubprocessKeychain
 from cumulusci.core.utils import import_global
+from cumulusci.salesforce_api.utils import OrgConnectionPool
 
 
 class SharedConfig(BaseModel):
@@ -97,11 +99,15 @@ def dotted_class_name(cls):
 class TaskWorker:
     """This class runs in a sub-thread or sub-process"""
 
-    def __init__(self, worker_dict, results_reporter, filesystem_lock):
+    # Shared by the Salesforce connections of the tasks, if set
+    connection_pool = None
+
+    def __init__(self, worker_dict, results_reporter, filesystem_lock, job_events=None):
         self.worker_config = WorkerConfig.from_dict(worker_dict)
         self.redirect_logging = worker_dict["redirect_logging"]
         self.results_reporter = results_reporter
         self.filesystem_lock = filesystem_lock
+        self.job_events = job_events
         assert filesystem_lock
 
     def __getattr__(self, name):
@@ -117,12 +123,15 @@ class TaskWorker:
         keychain = SubprocessKeychain(connected_app)
         self.project_config.set_keychain(keychain)
         self.org_config.keychain = keychain
-        return task_class(
+        task = task_class(
             project_config=self.project_config,
             task_config=task_config,
             org_config=self.org_config,
             logger=logger,
         )
+        if self.connection_pool:
+            task.connection_pool = self.connection_pool
+        return task
 
     def save_exception(self, e):
         """Write an exception to disk for later analysis"""
@@ -154,6 +163,7 @@ class TaskWorker:
                     shutil.move(str(self.working_dir), str(self.failures_dir))
                 if self.results_reporter:
                     self.results_reporter.put({"status": "error", "error": str(e)})
+                self.report_job_event("error")
                 raise
 
         try:
@@ -162,7 +172,29 @@ class TaskWorker:
                 shutil.move(str(self.working_dir), str(self.outbox_dir))
         except BaseException as e:
             self.save_exception(e)
+            if self.working_dir.exists():
+                try:
+                    with self.filesystem_lock:
+                        self.failures_dir.mkdir(exist_ok=True)
+                        shutil.move(str(self.working_dir), str(self.failures_dir))
+                except Exception:
+                    pass  # the job stays where it is, but is still reported
+            if self.results_reporter:
+                self.results_reporter.put({"status": "error", "error": str(e)})
+            self.report_job_event("error")
             raise
+        self.report_job_event("success")
+
+    def report_job_event(self, status):
+        """Tell the controller that the job has left its inprogress dir"""
+        if self.job_events is not None:
+            self.job_events.put(
+                {
+                    "inprogress_dir": str(self.working_dir.parent),
+                    "job": self.working_dir.name,
+                    "status": status,
+                }
+            )
 
     @contextmanager
     def make_logger(self):
@@ -180,12 +212,81 @@ class TaskWorker:
             yield logger, f
 
 
-def run_task_in_worker(worker_dict: dict, results_reporter: Queue, filesystem_lock):
+# Names the worker that took a job, so that the controller can fail
+# the job if the worker dies
+WORKER_ID_FILE = ".worker_id"
+
+
+class PersistentTaskWorker(TaskWorker):
+    """Runs the jobs it receives on a queue, one at a time, in a long-lived
+    sub-thread or sub-process.
+
+    The imports, project and org configs and Salesforce connections
+    are set up once and reused by every job."""
+
+    def __init__(
+        self,
+        worker_dict,
+        job_queue,
+        results_reporter,
+        filesystem_lock,
+        job_events=None,
+        worker_id=None,
+    ):
+        super().__init__(worker_dict, results_reporter, filesystem_lock, job_events)
+        self.job_queue = job_queue
+        self.worker_id = worker_id
+        self.shared_config = self.worker_config
+        self.connection_pool = OrgConnectionPool(self.org_config)
+
+    def take_job(self, job: dict):
+        """Make `job` the current job and claim its working dir"""
+        self.worker_config = self.shared_config.copy(
+            update={
+                "working_dir": Path(job["working_dir"]),
+                "task_options": job["task_options"],
+            }
+        )
+        if self.worker_id:
+            (self.working_dir / WORKER_ID_FILE).write_text(self.worker_id)
+
+    def run_jobs(self):
+        """Run jobs until the queue yields None"""
+        try:
+            for job in iter(self.job_queue.get, None):
+                self.take_job(job)
+                try:
+                    self.run()
+                except Exception:
+                    # The job was already moved to the failures directory.
+                    pass
+        finally:
+            self.connection_pool.close()
+
+
+def run_task_in_worker(
+    worker_dict: dict, results_reporter: Queue, filesystem_lock, job_events=None
+):
     assert filesystem_lock
-    worker = TaskWorker(worker_dict, results_reporter, filesystem_lock)
+    worker = TaskWorker(worker_dict, results_reporter, filesystem_lock, job_events)
     return worker.run()
 
 
+def run_jobs_in_worker(
+    worker_dict: dict,
+    job_queue: Queue,
+    results_reporter: Queue,
+    filesystem_lock,
+    job_events=None,
+    worker_id=None,
+):
+    assert filesystem_lock
+    worker = PersistentTaskWorker(
+        worker_dict, job_queue, results_reporter, filesystem_lock, job_events, worker_id
+    )
+    return worker.run_jobs()
+
+
 def simplify(x):
     if isinstance(x, Path):
         return str(x)
@@ -200,11 +301,13 @@ class ParallelWorker:
         worker_config: WorkerConfig,
         results_reporter: Queue,
         filesystem_lock,
+        job_events=None,
     ):
         self.spawn_class = spawn_class
         self.worker_config = worker_config
         self.results_reporter = results_reporter
         self.filesystem_lock = filesystem_lock
+        self.job_events = job_events
         assert filesystem_lock
 
     def _validate_worker_config_is_simple(self, worker_config):
@@ -218,7 +321,7 @@ class ParallelWorker:
         # under the covers, Python will pass this as Pickles.
         self.process = self.spawn_class(
             target=run_task_in_worker,
-            args=[dct, self.results_reporter, self.filesystem_lock],
+            args=[dct, self.results_reporter, self.filesystem_lock, self.job_events],
             # quit if the parent process decides to exit (e.g. after a timeout)
             daemon=True,
         )
@@ -236,3 +339,46 @@ class ParallelWorker:
 
     def __repr__(self):
         return f"<Worker {self.worker_config.task_class.__name__} {self.worker_config.working_dir.name} Alive: {self.is_alive()}>"
+
+
+class PersistentParallelWorker(ParallelWorker):
+    """Representation of a long-lived worker in the controller process.
+
+    Jobs are sent to the worker through `job_queue` rather than
+    starting a new sub-thread or sub-process for each of them."""
+
+    def __init__(
+        self,
+        spawn_class,
+        worker_config: WorkerConfig,
+        job_queue: Queue,
+        results_reporter: Queue,
+        filesystem_lock,
+        job_events=None,
+    ):
+        super().__init__(
+            spawn_class, worker_config, results_reporter, filesystem_lock, job_events
+        )
+        self.job_queue = job_queue
+        self.worker_id = uuid.uuid4().hex
+
+    def start(self):
+        dct = self.worker_config.as_dict()
+        self._validate_worker_config_is_simple(dct)
+
+        self.process = self.spawn_class(
+            target=run_jobs_in_worker,
+            args=[
+                dct,
+                self.job_queue,
+                self.results_reporter,
+                self.filesystem_lock,
+                self.job_events,
+                self.worker_id,
+            ],
+            daemon=True,
+        )
+        self.process.start()
+
+    def __repr__(self):
+        return f"<PersistentWorker {self.worker_config.task_class.__name__} Alive: {self.is_alive()}>"
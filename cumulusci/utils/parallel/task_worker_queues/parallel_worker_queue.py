@@ -4,14 +4,22 @@
 
 import logging
 import shutil
+import time
 import typing as T
+from collections import deque
 from multiprocessing import get_context
 from pathlib import Path
 from queue import Queue
 from tempfile import gettempdir
 from threading import Thread
 
-from .parallel_worker import ParallelWorker, SharedConfig, WorkerConfig
+from .parallel_worker import (
+    WORKER_ID_FILE,
+    ParallelWorker,
+    PersistentParallelWorker,
+    SharedConfig,
+    WorkerConfig,
+)
 
 logger = logging.getLogger(__file__)
 logger.setLevel(logging.DEBUG)
@@ -30,6 +38,9 @@ class WorkerQueueConfig(SharedConfig):
     # callable to generate task options
     make_task_options: T.Callable[..., T.Mapping[str, T.Any]]
     rename_directory: T.Optional[T.Callable]
+    # keep num_workers workers running and send them jobs, rather than
+    # starting a new worker for each job
+    persistent_workers: bool = False
 
     def __init__(self, **kwargs):
         kwargs.setdefault("failures_dir", kwargs["parent_dir"] / "failures")
@@ -52,6 +63,11 @@ class WorkerQueue:
 
     The use of file system folders makes the queue's work
     externally observable.
+
+    If the queue is given a `job_events` queue, workers report each job
+    that leaves the inprogress folder on it. The controller then tracks
+    the jobs of each folder in memory (see `handle_job_event`) instead
+    of listing the folders, and can wait for events rather than polling.
     """
 
     next_queue = None  # is there another queue in the pipeline?
@@ -69,7 +85,8 @@ class WorkerQueue:
         # multiprocessing.Queue seems prone to delays that cause
         # race conditions. See PR #3076 for more info.
         filesystem_lock,
-        results_reporter: Queue = None,
+        results_reporter=None,
+        job_events=None,
     ):
         self.config = queue_config
         # convenience access to names
@@ -77,6 +94,15 @@ class WorkerQueue:
         self.workers = []
         self.results_reporter = results_reporter
         self.filesystem_lock = filesystem_lock
+        self.job_queue = None
+        self.job_events = job_events
+        # job names by folder, when tracked in memory
+        self._queued_jobs = []
+        self._inprogress_jobs = []
+        self._outbox_jobs = []
+        # how long recent jobs took, when tracked in memory
+        self._job_start_times = {}
+        self.job_seconds = deque(maxlen=20)
 
     def __getattr__(self, name):
         """Convenience proxy for config values
@@ -124,14 +150,21 @@ class WorkerQueue:
 
     @property
     def num_free_workers(self) -> int:
-        return self.config.num_workers - self.num_busy_workers
+        # can be below zero for a while after the queue is resized
+        return max(self.config.num_workers - self.num_busy_workers, 0)
 
     @property
     def num_busy_workers(self) -> int:
+        if self.persistent_workers:
+            # Persistent workers stay alive between jobs. A worker moves
+            # its job out of the inprogress dir when it is done.
+            return len(self.inprogress_jobs)
         return len([w for w in self.workers if w.is_alive()])
 
     @property
     def queued_job_dirs(self):
+        if self.job_events is not None:
+            return [self.inbox_dir / job for job in self._queued_jobs]
         return list(self.inbox_dir.iterdir())
 
     @property
@@ -140,6 +173,8 @@ class WorkerQueue:
 
     @property
     def inprogress_job_dirs(self):
+        if self.job_events is not None:
+            return [self.inprogress_dir / job for job in self._inprogress_jobs]
         return list(self.inprogress_dir.iterdir())
 
     @property
@@ -148,6 +183,11 @@ class WorkerQueue:
 
     @property
     def outbox_job_dirs(self):
+        if self.job_events is not None:
+            if self.next_queue:
+                # my outbox is the next queue's inbox
+                return self.next_queue.queued_job_dirs
+            return [self.outbox_dir / job for job in self._outbox_jobs]
         return list(self.outbox_dir.iterdir())
 
     @property
@@ -190,11 +230,14 @@ class WorkerQueue:
     def _queue_job(self, job_dir: Path):
         """Enqueue a job"""
         shutil.move(str(job_dir), str(self.inbox_dir))
+        self._queued_jobs.append(job_dir.name)
 
     def _start_job(self, job_dir: Path):
         """Start a job"""
         self.inprogress_dir.mkdir(exist_ok=True)
         working_dir = Path(shutil.move(str(job_dir), str(self.inprogress_dir)))
+        if self.job_events is not None:
+            self._queued_jobs.remove(job_dir.name)
 
         # Jobs can rename their directories in case they store metadata
         # in directory names.
@@ -202,12 +245,33 @@ class WorkerQueue:
             old_working_dir = working_dir
             working_dir = self.rename_directory(old_working_dir)
             shutil.move(str(old_working_dir), str(working_dir))
+        if self.job_events is not None:
+            self._inprogress_jobs.append(working_dir.name)
+            self._job_start_times[working_dir.name] = time.monotonic()
 
         # Individual jobs can override or add task options to the ones
         # generic to jobs in this queue. E.g. the number of records to
         # generate in a datagen context.
         task_options = self.make_task_options(working_dir)
 
+        if self.persistent_workers:
+            self._start_persistent_workers()
+            self.job_queue.put(
+                {"working_dir": str(working_dir), "task_options": task_options}
+            )
+            return
+
+        worker = ParallelWorker(
+            self.config.spawn_class,
+            self._make_worker_config(working_dir, task_options),
+            self.results_reporter,
+            self.filesystem_lock,
+            self.job_events,
+        )
+        worker.start()
+        self.workers.append(worker)
+
+    def _make_worker_config(self, working_dir: Path, task_options: T.Mapping):
         worker_config_data = self.config.__dict__.copy()
         worker_config_data.update(
             {
@@ -216,25 +280,119 @@ class WorkerQueue:
                 "task_options": task_options,
             }
         )
-
-        worker_config = WorkerConfig(
-            **worker_config_data,
+        return WorkerConfig(**worker_config_data)
+
+    def _start_persistent_workers(self):
+        """Start workers until there are num_workers of them alive"""
+        self._remove_dead_workers()
+        if not self.job_queue:
+            # be careful to use a Queue compatible with the spawn class
+            self.job_queue = (
+                self.context.Queue() if self.spawn_class is self.Process else Queue()
+            )
+        # Jobs get their own working dirs and options when they are sent
+        worker_config = self._make_worker_config(self.inprogress_dir, {})
+        while len(self.workers) < self.num_workers:
+            worker = PersistentParallelWorker(
+                self.config.spawn_class,
+                worker_config,
+                self.job_queue,
+                self.results_reporter,
+                self.filesystem_lock,
+                self.job_events,
+            )
+            worker.start()
+            self.workers.append(worker)
+
+    def _remove_dead_workers(self):
+        """Forget workers that have exited.
+
+        A persistent worker that dies in the middle of a job never moves
+        the job out of the inprogress dir, so fail the job on its behalf."""
+        dead_workers = [w for w in self.workers if not w.is_alive()]
+        if not dead_workers:
+            return
+        self.workers = [w for w in self.workers if w not in dead_workers]
+        if not self.persistent_workers:
+            return
+        dead_worker_ids = {w.worker_id for w in dead_workers}
+        for job_dir in self.inprogress_job_dirs:
+            worker_id_file = job_dir / WORKER_ID_FILE
+            if (
+                worker_id_file.exists()
+                and worker_id_file.read_text() in dead_worker_ids
+            ):
+                self._fail_orphaned_job(job_dir)
+
+    def _fail_orphaned_job(self, job_dir: Path):
+        """Move the job of a dead worker to the failures dir"""
+        error = "The worker running this job exited unexpectedly"
+        logger.warning(f"{error}: {job_dir}")
+        (job_dir / "exception.txt").write_text(error)
+        with self.filesystem_lock:
+            self.failures_dir.mkdir(exist_ok=True)
+            shutil.move(str(job_dir), str(self.failures_dir))
+        if self.results_reporter:
+            self.results_reporter.put({"status": "error", "error": error})
+        if self.job_events is not None:
+            self.handle_job_event({"job": job_dir.name, "status": "error"})
+
+    def handle_job_event(self, event: dict):
+        """Update the jobs tracked in memory when a worker reports
+        that it moved a job out of the inprogress dir"""
+        self._inprogress_jobs.remove(event["job"])
+        self.job_seconds.append(
+            time.monotonic() - self._job_start_times.pop(event["job"])
         )
+        if event["status"] != "success":
+            return  # the job is in the failures dir
+        if self.next_queue:
+            self.next_queue._queued_jobs.append(event["job"])
+        else:
+            self._outbox_jobs.append(event["job"])
 
-        worker = ParallelWorker(
-            self.config.spawn_class,
-            worker_config,
-            self.results_reporter,
-            self.filesystem_lock,
-        )
-        worker.start()
-        self.workers.append(worker)
+    @property
+    def average_job_seconds(self) -> T.Optional[float]:
+        if not self.job_seconds:
+            return None
+        return sum(self.job_seconds) / len(self.job_seconds)
+
+    def resize(self, num_workers: int):
+        """Change the number of workers.
+
+        Running jobs are not interrupted, so shrinking takes effect
+        as jobs finish. Extra persistent workers stay idle until the
+        queue is closed."""
+        self.config.num_workers = num_workers
+
+    def stats(self) -> dict:
+        """A machine-readable summary of the queue, e.g. for telemetry"""
+        return {
+            "num_workers": self.num_workers,
+            "busy_workers": self.num_busy_workers,
+            "queued_jobs": len(self.queued_jobs),
+            "inprogress_jobs": len(self.inprogress_jobs),
+            "average_job_seconds": self.average_job_seconds,
+        }
+
+    def close(self):
+        """Tell persistent workers to exit once the jobs sent to them are done"""
+        if self.job_queue:
+            for worker in self.workers:
+                self.job_queue.put(None)
+            self.workers = []
+            # the workers keep their own reference to the queue
+            self.job_queue = None
 
     def tick(self):
         """Things are moved from place to place in the 'tick'.
         The tick runs in the parent/controller/original process
         so there are no threading/locking issues."""
-        self.workers = [w for w in self.workers if w.is_alive()]
+        self._remove_dead_workers()
+        if self.persistent_workers and self.job_queue:
+            # Replace dead workers even when every job is in progress:
+            # jobs that no worker took yet are still waiting in job_queue.
+            self._start_persistent_workers()
 
         for idx, job_dir in zip(range(self.num_free_workers), self.queued_job_dirs):
             logger.info(f"Starting job {job_dir}")
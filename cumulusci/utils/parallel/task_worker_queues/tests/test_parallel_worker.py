@@ -1,3 +1,6 @@
+import queue
+import shutil
+import time
 from contextlib import contextmanager
 from logging import getLogger
 from multiprocessing import Lock
@@ -12,6 +15,7 @@ from cumulusci.core.config import BaseProjectConfig, OrgConfig, UniversalConfig
 from cumulusci.tasks.util import Sleep
 from cumulusci.utils.parallel.task_worker_queues.parallel_worker import (
     ParallelWorker,
+    PersistentTaskWorker,
     SubprocessKeychain,
     TaskWorker,
     WorkerConfig,
@@ -54,17 +58,16 @@ class DelaySpawner:
 
 class TestWorkerQueue:
     @contextmanager
-    def configure_worker_queue(self, parent_dir, **kwargs):
+    def configure_worker_queue(self, parent_dir, job_events=None, **kwargs):
         config = WorkerQueueConfig(
             project_config=dummy_project_config,
             org_config=dummy_org_config,
             connected_app=None,
             redirect_logging=True,
-            spawn_class=DelaySpawner,
             parent_dir=Path(parent_dir),
-            **kwargs,
+            **{"spawn_class": DelaySpawner, **kwargs},
         )
-        q = WorkerQueue(config, filesystem_lock=Lock())
+        q = WorkerQueue(config, filesystem_lock=Lock(), job_events=job_events)
 
         yield q
 
@@ -173,6 +176,115 @@ class TestWorkerQueue:
             assert q.num_free_workers == 0
             assert len(q.queued_job_dirs) == 3
 
+    def test_worker_queue__persistent_workers(self, tmpdir):
+        def make_task_options(path: Path, *args, **kwargs):
+            return {"seconds": "bad" if path.name == "b" else 0}
+
+        with self.configure_worker_queue(
+            parent_dir=tmpdir,
+            name="start",
+            task_class=Sleep,
+            make_task_options=make_task_options,
+            queue_size=3,
+            num_workers=2,
+            persistent_workers=True,
+            spawn_class=WorkerQueue.Thread,
+        ) as q:
+            q.push(name="a")
+            q.push(name="b")
+            q.push(name="c")
+            workers = q.workers
+            assert len(workers) == 2
+
+            # The workers keep running jobs, even after one of them fails.
+            deadline = time.time() + 10
+            while not q.empty and time.time() < deadline:
+                q.tick()
+                time.sleep(0.01)
+            assert sorted(q.outbox_jobs) == ["a", "c"]
+            assert q.failed_jobs == ["b"]
+            assert q.workers == workers
+
+            q.close()
+            for worker in workers:
+                worker.process.join(10)
+                assert not worker.is_alive()
+            assert q.workers == []
+
+    def test_worker_queue__persistent_worker_dies(self, tmpdir):
+        job_events = queue.Queue()
+        with self.configure_worker_queue(
+            parent_dir=tmpdir,
+            name="start",
+            task_class=Sleep,
+            make_task_options=lambda *args, **kwargs: {"seconds": 0},
+            queue_size=3,
+            num_workers=1,
+            persistent_workers=True,
+            job_events=job_events,
+        ) as q:
+            q.push(name="a")
+            (dead_worker,) = q.workers
+
+            # The worker takes the job, then dies in the middle of it
+            task_worker = PersistentTaskWorker(
+                *dead_worker.process.args[:4], worker_id=dead_worker.worker_id
+            )
+            task_worker.take_job(q.job_queue.get())
+            dead_worker.process.terminate()
+            assert q.inprogress_jobs == ["a"]
+            assert q.num_free_workers == 0
+
+            q.tick()
+            assert q.inprogress_jobs == []
+            assert q.failed_jobs == ["a"]
+            assert (
+                "exited unexpectedly"
+                in (q.failures_dir / "a" / "exception.txt").read_text()
+            )
+
+            # A new worker replaces the dead one and runs the next job
+            q.push(name="b")
+            (worker,) = q.workers
+            assert worker is not dead_worker
+            q.close()
+            worker.process._finish()
+            q.handle_job_event(job_events.get_nowait())
+            assert q.outbox_jobs == ["b"]
+            assert q.failed_jobs == ["a"]
+
+    def test_worker_queue__persistent_workers_die_before_taking_jobs(self, tmpdir):
+        job_events = queue.Queue()
+        with self.configure_worker_queue(
+            parent_dir=tmpdir,
+            name="start",
+            task_class=Sleep,
+            make_task_options=lambda *args, **kwargs: {"seconds": 0},
+            queue_size=3,
+            num_workers=1,
+            persistent_workers=True,
+            job_events=job_events,
+        ) as q:
+            q.push(name="a")
+            (dead_worker,) = q.workers
+            dead_worker.process.terminate()
+
+            # No worker is free, but the job is still waiting to be taken
+            q.tick()
+            (worker,) = q.workers
+            assert worker is not dead_worker
+            assert q.inprogress_jobs == ["a"]
+            assert q.failed_jobs == []
+
+            q.close()
+            worker.process._finish()
+            q.handle_job_event(job_events.get_nowait())
+            assert q.outbox_jobs == ["a"]
+
+            # Closed queues don't start new workers
+            q.tick()
+            assert q.workers == []
+
     def test_worker_queues_together(self, tmpdir):
         with self.configure_worker_queue(
             parent_dir=tmpdir,
@@ -219,6 +331,78 @@ class TestWorkerQueue:
             q1.tick()
             q2.tick()
 
+    def test_worker_queues_together__job_events(self, tmpdir):
+        def make_task_options(path: Path, *args, **kwargs):
+            return {"seconds": "bad" if path.name == "b" else 0}
+
+        job_events = queue.Queue()
+        with self.configure_worker_queue(
+            parent_dir=tmpdir,
+            job_events=job_events,
+            name="start",
+            task_class=Sleep,
+            make_task_options=make_task_options,
+            queue_size=1,
+            num_workers=1,
+        ) as q1, self.configure_worker_queue(
+            parent_dir=tmpdir,
+            job_events=job_events,
+            name="next",
+            task_class=Sleep,
+            make_task_options=make_task_options,
+            queue_size=1,
+            num_workers=1,
+        ) as q2:
+            q1.feeds_data_to(q2)
+            q1.push(name="a")
+            q1.push(name="b")
+            assert q1.inprogress_jobs == ["a"]
+            assert q1.queued_jobs == ["b"]
+
+            q1.workers[0].process._finish()
+            event = job_events.get(block=False)
+            assert event == {
+                "inprogress_dir": str(q1.inprogress_dir),
+                "job": "a",
+                "status": "success",
+            }
+            # jobs are tracked in memory, so "a" stays in progress
+            # until the controller hears about it.
+            assert q1.inprogress_jobs == ["a"]
+            q1.handle_job_event(event)
+            assert q1.inprogress_jobs == []
+            assert q1.outbox_jobs == q2.queued_jobs == ["a"]
+
+            q1.tick()
+            assert q1.inprogress_jobs == ["b"]
+            assert q2.inprogress_jobs == ["a"]
+
+            with pytest.raises(exc.TaskOptionsError):
+                q1.workers[0].process._finish()
+            event = job_events.get(block=False)
+            assert event["status"] == "error"
+            q1.handle_job_event(event)
+            assert q1.inprogress_jobs == []
+            assert q1.failed_jobs == ["b"]
+            assert q2.queued_jobs == []
+
+            q2.workers[0].process._finish()
+            q2.handle_job_event(job_events.get(block=False))
+            assert q2.empty
+            assert q2.outbox_jobs == ["a"]
+            assert [job.name for job in q2.outbox_dir.iterdir()] == ["a"]
+            assert job_events.empty()
+
+            assert q1.stats()["average_job_seconds"] >= 0
+            q2.resize(3)
+            assert q2.stats() == {
+                "num_workers": 3,
+                "busy_workers": 0,
+                "queued_jobs": 0,
+                "inprogress_jobs": 0,
+                "average_job_seconds": q2.average_job_seconds,
+            }
+
     def test_worker_queues_together__outbox_cannot_be_removed(self, tmpdir):
         with self.configure_worker_queue(
             parent_dir=tmpdir,
@@ -334,6 +518,49 @@ class TestTaskWorker:
                     p.run()
             assert Path(working_dir, "exception.txt").exists()
 
+    def test_worker__cannot_move_to_outdir__job_events(self, tmp_path):
+        outbox_dir = tmp_path / "outbox"
+        config = WorkerConfig(
+            project_config=dummy_project_config,
+            org_config=dummy_org_config,
+            connected_app=None,
+            redirect_logging=True,
+            task_class=Sleep,
+            task_options={"seconds": 0},
+            failures_dir=tmp_path / "failures",
+            outbox_dir=outbox_dir,
+            working_dir=tmp_path / "inprogress" / "a",
+        )
+        config.working_dir.mkdir(parents=True)
+        results_reporter = queue.Queue()
+        job_events = queue.Queue()
+        p = TaskWorker(config.as_dict(), results_reporter, Lock(), job_events)
+
+        real_move = shutil.move
+
+        def move(src, dst):
+            if dst == str(outbox_dir):
+                raise OSError("Disk full")
+            return real_move(src, dst)
+
+        with mock.patch("shutil.move", side_effect=move):
+            with pytest.raises(OSError):
+                p.run()
+
+        # The controller hears about the failure, so it stops waiting for the job
+        assert job_events.get_nowait() == {
+            "inprogress_dir": str(tmp_path / "inprogress"),
+            "job": "a",
+            "status": "error",
+        }
+        assert results_reporter.get_nowait()["status"] == "success"
+        assert results_reporter.get_nowait() == {
+            "status": "error",
+            "error": "Disk full",
+        }
+        assert (tmp_path / "failures" / "a" / "exception.txt").exists()
+        assert not config.working_dir.exists()
+
 
 # Frankly these tests are primarily for coverage-counting purposes.
 # Meaningful tests of keychain stuff are by definition integration
@@ -0,0 +1,210 @@
+"""Streaming read-modify-write of large Salesforce metadata files.
+
+`metadata_tree.parse` holds a whole document in memory, and serializing it
+makes more copies. For huge documents like Profiles or Translations where a
+transform only touches some of the top-level children, `transform_children`
+reads the document one top-level child at a time, hands matching children to
+a transform function as `MetadataElement` objects, and writes each child out
+with Salesforce formatting before reading the next one.
+
+>>> from cumulusci.utils.xml.metadata_stream import transform_children
+>>> def grant_access(field_permission):
+...     field_permission.readable.text = "true"
+>>> transform_children(
+...     "Admin.profile", "deploy/Admin.profile", {"fieldPermissions": grant_access}
+... )
+
+The output is the same as parsing the document with `metadata_tree`, making
+the same changes, and calling `tostring(xml_declaration=True)`.
+"""
+
+import re
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Optional, Tuple, Union
+
+from lxml import etree
+
+from .metadata_tree import MetadataElement
+from .salesforce_encoding import (
+    _local_name,
+    _render_start_tag,
+    serialize_xml_for_salesforce,
+    xml_encoding,
+)
+
+INDENT = "    "
+
+# How many children to write at once
+CHUNK_SIZE = 1000
+
+ChildTransform = Callable[[MetadataElement], None]
+AddChildren = Callable[[MetadataElement, Optional[str]], None]
+
+
+def transform_children(
+    source: Union[str, Path],
+    destination: Union[str, Path],
+    transforms: Dict[str, ChildTransform],
+    add_children: Optional[AddChildren] = None,
+    xml_declaration: bool = True,
+):
+    """Copy a metadata document, transforming its top-level children on the way.
+
+    `transforms` maps tag names to functions that modify a child with that
+    tag in place.
+
+    New children can't be appended to a document which has already been
+    written, so if `add_children` is given, it is called with an empty copy
+    of the root element at the end of each run of children with the same
+    tag (with that tag), and at the end of the document (with `None`).
+    Any children it appends are written at that point. Appending children
+    with the tag of the run that ended puts them right after their siblings,
+    like `MetadataElement.append` does."""
+    with open(destination, "w", encoding="utf-8") as out:
+        if xml_declaration:
+            out.write(xml_encoding)
+        for part in _stream_children(str(source), transforms, add_children):
+            out.write(part)
+
+
+def _stream_children(
+    source: str,
+    transforms: Dict[str, ChildTransform],
+    add_children: Optional[AddChildren],
+) -> Iterable[str]:
+    events = etree.iterparse(
+        source,
+        events=("end", "comment"),
+        resolve_entities=False,
+        no_network=True,
+        huge_tree=True,
+    )
+    root = last_tag = None
+    pending = []  # children which have been read but not written
+    text = None  # the text before the next child to write
+    started = False
+
+    def write(container):
+        """Write the children of `container`, which has the same tag as the root"""
+        nonlocal text, started
+        if not started:
+            started = True
+            text = root.text
+            yield _render_root_start_tag(root)
+        output, text = _serialize_children(container, text)
+        yield output
+
+    def flush():
+        # Only children whose tails have been parsed can be moved out of the root
+        if pending:
+            container = etree.Element(root.tag, nsmap=root.nsmap)
+            container.extend(pending)
+            pending.clear()
+            yield from write(container)
+
+    def added_children(tag):
+        nonlocal text
+        if add_children is None:
+            return
+        container = etree.Element(root.tag, nsmap=root.nsmap)
+        add_children(MetadataElement(container), tag)
+        if len(container):
+            yield from write(container)
+
+    # Only the children of the root are interesting. Watching just their
+    # ends (rather than keeping track of the depth with start events too)
+    # halves the events to look at.
+    for event, element in events:
+        parent = element.getparent()
+        if parent is None:
+            root = element  # the end of the document
+            continue
+        elif parent.getparent() is not None:
+            continue
+        root = parent
+
+        if event == "end":
+            tag = _local_name(element.tag)
+            if tag != last_tag and last_tag is not None:
+                yield from flush()
+                yield from added_children(last_tag)
+            last_tag = tag
+            transform = transforms.get(tag)
+            if transform:
+                transform(MetadataElement(element, root))
+
+        if len(pending) >= CHUNK_SIZE:
+            yield from flush()
+        pending.append(element)
+
+    yield from flush()
+    if last_tag is not None:
+        yield from added_children(last_tag)
+    yield from added_children(None)
+    if started:
+        yield _indentation(text, "") + f"</{_local_name(root.tag)}>\n"
+    else:
+        yield serialize_xml_for_salesforce(root, xml_declaration=False)
+
+
+def _render_root_start_tag(root) -> str:
+    # a copy with a child renders as just the start tag
+    start = etree.Element(root.tag, attrib=dict(root.attrib), nsmap=root.nsmap)
+    etree.SubElement(start, root.tag)
+    namespaces = {url: prefix for prefix, url in root.nsmap.items()}
+    return _render_start_tag(start, dict(root.nsmap), namespaces)
+
+
+def _indentation(text: Optional[str], indent: str) -> str:
+    """The text between children, as `etree.indent` would leave it"""
+    if text and text.strip():
+        return text
+    return "\n" + indent
+
+
+# Text after an end tag or empty element. (lxml escapes ">" in text, so
+# "/" followed by ">" must be in a tag.)
+_tail_text = re.compile(r"/[^<>]*>\s*[^\s<]")
+
+
+def _is_plain(output: str) -> bool:
+    """Is lxml's output for some children the same as Salesforce formatting,
+    except for escaping quotes?
+
+    It isn't for attributes and namespace declarations, comments, processing
+    instructions, empty text (which lxml doesn't write as a self-closing tag),
+    carriage returns (which lxml escapes) or text after an element (which lxml
+    escapes, but `serialize_xml_for_salesforce` doesn't). Text that looks like
+    any of those just takes the slow path."""
+    return not (
+        '="' in output
+        or "<!" in output
+        or "<?" in output
+        or "></" in output
+        or "&#13;" in output
+        or _tail_text.search(output)
+    )
+
+
+def _serialize_children(container, text: Optional[str]) -> Tuple[str, Optional[str]]:
+    """Serialize the children of `container`, preceded by `text`.
+
+    Returns the output and the tail of the last child, which is written
+    before whatever comes next. lxml's serializer is much faster than
+    `serialize_xml_for_salesforce`, so we use it when its output only
+    differs by not escaping quotes, and fix that up."""
+    last = container[-1]
+    tail, last.tail = last.tail, None
+    container.text = text
+    etree.indent(container, space=INDENT)
+
+    output = etree.tostring(container, encoding=str)
+    output = output[output.index(">") + 1 : output.rindex("</")]
+    # prefixed tags are only possible if the root declares prefixes
+    if list(container.nsmap) != [None] or not _is_plain(output):
+        output = serialize_xml_for_salesforce(container, xml_declaration=False)
+        output = output[output.index(">") + 1 : output.rindex("</")]
+    else:
+        output = output.replace('"', "&quot;").replace("'", "&apos;")
+    # the last child's tail is left to what comes next
+    return output[:-1], tail
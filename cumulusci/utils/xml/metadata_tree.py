@@ -15,7 +15,8 @@ Or to give a more Salesforce-y example:
 Account
 """
 
-from typing import Generator, Union
+from collections import Counter
+from typing import Dict, Generator, List, Optional, Union
 
 from lxml import etree
 
@@ -24,6 +25,11 @@ from .salesforce_encoding import serialize_xml_for_salesforce
 
 METADATA_NAMESPACE = "http://soap.sforce.com/2006/04/metadata"
 
+# How many times elements with each tag have been added, removed or had
+# their text changed. Lookup indexes compare these to notice when they
+# are out of date.
+_tag_versions = Counter()
+
 
 def parse(source):
     """Parse a file by path or file object into a Metadata Tree
@@ -85,7 +91,7 @@ class MetadataElement:
     There are also methods for finding, appending, inserting and removing nodes, which have their own documentation.
     '''
 
-    __slots__ = ["_element", "_parent", "_ns", "tag"]
+    __slots__ = ["_element", "_parent", "_ns", "tag", "_indexes"]
 
     def __init__(self, element: etree._Element, parent: etree._Element = None):
         assert isinstance(element, etree._Element)
@@ -93,6 +99,7 @@ class MetadataElement:
         self._parent = parent
         self._ns = next(iter(element.nsmap.values()))
         self.tag = element.tag.split("}")[1]
+        self._indexes = {}
 
     @property
     def text(self):
@@ -103,6 +110,7 @@ class MetadataElement:
     @text.setter
     def text(self, text):
         self._element.text = text
+        _tag_versions[self.tag] += 1
 
     def _wrap_element(self, child: etree._Element):
         return MetadataElement(child, self._element)
@@ -185,6 +193,7 @@ class MetadataElement:
             self._element.insert(index + 1, newchild._element)
         else:
             self._element.append(newchild._element)
+        _tag_versions[tag] += 1
         return newchild
 
     def insert(self, index: int, tag: str, text: str = None):
@@ -204,6 +213,7 @@ class MetadataElement:
         """
         newchild = self._create_child(tag, text)
         self._element.insert(index, newchild._element)
+        _tag_versions[tag] += 1
         return newchild
 
     def insert_before(self, oldElement: "MetadataElement", tag: str, text: str = None):
@@ -224,23 +234,50 @@ class MetadataElement:
     def remove(self, metadata_element: "MetadataElement") -> None:
         """Remove an element from its parent (self)"""
         self._element.remove(metadata_element._element)
+        _tag_versions[metadata_element.tag] += 1
 
     def find(self, tag, **kwargs):
-        """Find a single direct child-elements with name `tag`"""
+        """Find a single direct child-elements with name `tag`
+
+        Keyword arguments filter on the text of a sub-element, e.g.
+        `find("fieldPermissions", field="Account.Name")`. Filtered lookups
+        use an index which is built on first use and kept for as long
+        as this MetadataElement, so repeated lookups on the same parent
+        don't scan all of its children each time. The index notices changes
+        made through MetadataElements but not changes made to the
+        underlying lxml tree directly."""
         return next(self._findall(tag, kwargs), None)
 
     def findall(self, tag, **kwargs):
-        """Find all direct child-elements with name `tag`"""
+        """Find all direct child-elements with name `tag`
+
+        Keyword arguments filter the same way as for `find`."""
         return list(self._findall(tag, kwargs))
 
-    def _sub_element_matches_spec(self, e: etree._Element, name: str, value):
+    def _sub_element_value(self, e: etree._Element, name: str):
         matching_subelement = e.find(self._add_namespace(name))
-        if matching_subelement is None and name != "text":
-            return value is None
-        elif matching_subelement is not None:
-            return matching_subelement.text == value
-        else:  # matching_subelement is None and name == "text"
-            return e.text == value
+        if matching_subelement is not None:
+            return matching_subelement.text
+        elif name == "text":
+            return e.text
+        else:
+            return None
+
+    def _sub_element_matches_spec(self, e: etree._Element, name: str, value):
+        return self._sub_element_value(e, name) == value
+
+    def _get_index(
+        self, tag: str, name: str
+    ) -> Dict[Optional[str], List[etree._Element]]:
+        """Children with name `tag`, grouped by the text of their `name` sub-element"""
+        versions = (_tag_versions[tag], _tag_versions[name])
+        index = self._indexes.get((tag, name))
+        if index is None or index[0] != versions:
+            elements = {}
+            for e in self._element.findall(self._add_namespace(tag)):
+                elements.setdefault(self._sub_element_value(e, name), []).append(e)
+            index = self._indexes[(tag, name)] = (versions, elements)
+        return index[1]
 
     def _findall(self, type, kwargs: dict) -> Generator:
         def matches(e):
@@ -249,10 +286,18 @@ class MetadataElement:
                 for name, value in kwargs.items()
             )
 
+        if kwargs:
+            name, value = next(iter(kwargs.items()))
+            candidates = self._get_index(type, name).get(value, ())
+        else:
+            candidates = self._element.findall(self._add_namespace(type))
+
+        # Matches from the index are checked again in case the tree was
+        # changed without going through a MetadataElement.
         return (
             self._wrap_element(e)
-            for e in self._element.findall(self._add_namespace(type))
-            if matches(e)
+            for e in candidates
+            if e.getparent() is self._element and matches(e)
         )
 
     def tostring(self, xml_declaration=False, include_parent_namespaces=False):
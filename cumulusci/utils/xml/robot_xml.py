@@ -1,5 +1,5 @@
 import re
-from typing import Callable, Dict, NamedTuple
+from typing import Callable, Dict, List, NamedTuple
 
 from robot.api import ExecutionResult, ResultVisitor
 from robot.result.model import TestCase
@@ -61,6 +61,13 @@ def log_perf_summary_from_xml(
     result.visit(perf_summarizer)
 
 
+def perf_summaries_from_xml(robot_xml) -> List[PerfSummary]:
+    """Return the PerfSummary of every test in a Robot output file that has metrics"""
+    summaries = []
+    ExecutionResult(robot_xml).visit(PerfSummarizer(summaries.append))
+    return summaries
+
+
 def _perf_logger(logger_func: Callable, formatter_func: Callable):
     """Generator that connects visitor to logger"""
     # ensure we have at least one result before printing header
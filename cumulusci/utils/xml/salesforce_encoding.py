@@ -10,7 +10,7 @@ _supported_events = ("start", "end", "start-ns", "end-ns", "comment")
 def serialize_xml_for_salesforce(
     element_or_tree, xml_declaration=True, include_parent_namespaces=False
 ):
-    r = xml_encoding if xml_declaration else ""
+    parts = [xml_encoding] if xml_declaration else []
     if hasattr(element_or_tree, "getroot"):
         root = element_or_tree.getroot()
     else:
@@ -31,46 +31,56 @@ def serialize_xml_for_salesforce(
             new_namespace_declarations[prefix] = ns
             all_namespaces[ns] = prefix
         elif action == "start":
-            tag = elem.tag
-            if "}" in tag:
-                tag = _render_name(tag, all_namespaces)
-            text = (
-                escape(elem.text, {"'": "&apos;", '"': "&quot;"})
-                if elem.text is not None
-                else ""
-            )
-            ns = (
-                _render_ns_declarations(new_namespace_declarations)
-                if new_namespace_declarations
-                else ""
+            parts.append(
+                _render_start_tag(elem, new_namespace_declarations, all_namespaces)
             )
             new_namespace_declarations = {}
-
-            attrs = "".join(
-                [
-                    f' {_render_attr_name(k, all_namespaces)}="{v}"'
-                    for k, v in elem.attrib.items()
-                ]
-            )
-            if not _has_content(elem):
-                r += f"<{tag}{ns}{attrs}/>"
-            else:
-                r += f"<{tag}{ns}{attrs}>{text}"
         elif action == "end":
             if _has_content(elem):
-                tag = elem.tag
-                if "}" in tag:
-                    tag = tag.split("}")[1]
-                r += f"</{tag}>"
+                parts.append(f"</{_local_name(elem.tag)}>")
             tail = elem.tail if elem.tail else "\n"
-            r += tail
+            parts.append(tail)
         elif action == "comment":
-            r += str(elem) + (elem.tail if elem.tail else "")
-    return r
+            parts.append(str(elem) + (elem.tail if elem.tail else ""))
+    return "".join(parts)
+
+
+def _render_start_tag(elem, namespace_declarations, all_namespaces):
+    """Render an element's start tag and text, or the whole element if it is empty"""
+    tag = elem.tag
+    if "}" in tag:
+        tag = _render_name(tag, all_namespaces)
+    text = _escape_text(elem.text) if elem.text is not None else ""
+    ns = (
+        _render_ns_declarations(namespace_declarations)
+        if namespace_declarations
+        else ""
+    )
+
+    attrs = "".join(
+        [f' {_render_attr_name(k, all_namespaces)}="{v}"' for k, v in elem.items()]
+    )
+    if not _has_content(elem):
+        return f"<{tag}{ns}{attrs}/>"
+    else:
+        return f"<{tag}{ns}{attrs}>{text}"
+
+
+def _escape_text(text):
+    # Most text in metadata has nothing to escape, and checking is much faster
+    if "&" in text or "<" in text or ">" in text or '"' in text or "'" in text:
+        return escape(text, {"'": "&apos;", '"': "&quot;"})
+    return text
+
+
+def _local_name(tag):
+    if "}" in tag:
+        tag = tag.split("}")[1]
+    return tag
 
 
 def _has_content(element):
-    return element.text or list(element)
+    return element.text or len(element)
 
 
 def _render_ns_declarations(declarations):
@@ -0,0 +1,131 @@
+from unittest import mock
+
+import pytest
+from lxml import etree
+
+from cumulusci.utils.xml import metadata_stream
+from cumulusci.utils.xml.metadata_stream import transform_children
+from cumulusci.utils.xml.metadata_tree import METADATA_NAMESPACE, fromstring
+
+PROFILE = f"""<?xml version="1.0" encoding="UTF-8"?>
+<Profile xmlns="{METADATA_NAMESPACE}">
+    <fieldPermissions>
+        <editable>false</editable>
+        <field>Account.Name</field>
+        <readable>false</readable>
+    </fieldPermissions>
+    <fieldPermissions><editable>false</editable><field>Account.Type</field><readable>true</readable></fieldPermissions>
+    <!-- layouts -->
+    <layoutAssignments>
+        <layout>Account-Account Layout</layout>
+    </layoutAssignments>
+    <userLicense>Salesforce</userLicense>
+    <userPermissions>
+        <enabled>true</enabled>
+        <name>"Quoted" &amp; 'escaped' &gt;</name>
+    </userPermissions>
+</Profile>
+"""
+
+
+def grant(field_permission):
+    field_permission.editable.text = "true"
+    field_permission.readable.text = "true"
+
+
+def add_layout(parent, tag):
+    if tag == "layoutAssignments":
+        parent.append("layoutAssignments").append("layout", "Contact-Contact Layout")
+
+
+def transform_tree(xml, transforms, add_children=None):
+    """The same transform, the usual way"""
+    tree = fromstring(xml.encode("utf-8"))
+    for tag, transform in transforms.items():
+        for elem in tree.findall(tag):
+            transform(elem)
+    if add_children:
+        tags = [
+            etree.QName(child).localname
+            for child in tree._element
+            if isinstance(child.tag, str)
+        ]
+        for tag in dict.fromkeys(tags):
+            add_children(tree, tag)
+        add_children(tree, None)
+    return tree.tostring(xml_declaration=True)
+
+
+def stream(tmp_path, xml, *args, **kwargs):
+    source = tmp_path / "source.xml"
+    source.write_text(xml, encoding="utf-8")
+    transform_children(source, tmp_path / "output.xml", *args, **kwargs)
+    return (tmp_path / "output.xml").read_text(encoding="utf-8")
+
+
+class TestTransformChildren:
+    def test_transform_children(self, tmp_path):
+        output = stream(tmp_path, PROFILE, {"fieldPermissions": grant}, add_layout)
+
+        assert output == transform_tree(
+            PROFILE, {"fieldPermissions": grant}, add_layout
+        )
+        assert output.count("<readable>true</readable>") == 2
+        assert "<!-- layouts -->" in output
+        assert "&quot;Quoted&quot; &amp; &apos;escaped&apos; &gt;" in output
+        assert output.index("Contact-Contact Layout") < output.index("<userLicense>")
+
+    def test_transform_children__small_chunks(self, tmp_path):
+        with mock.patch.object(metadata_stream, "CHUNK_SIZE", 1):
+            output = stream(tmp_path, PROFILE, {"fieldPermissions": grant})
+
+        assert output == transform_tree(PROFILE, {"fieldPermissions": grant})
+
+    def test_transform_children__add_at_end(self, tmp_path):
+        def add_children(parent, tag):
+            if tag is None:
+                parent.append("description", "Added")
+
+        output = stream(tmp_path, PROFILE, {}, add_children)
+
+        assert output.endswith(
+            "    <description>Added</description>\n</Profile>\n"
+        ), output
+        assert output == transform_tree(PROFILE, {}, add_children)
+
+    def test_transform_children__empty(self, tmp_path):
+        def add_children(parent, tag):
+            parent.append("label", "Test")
+
+        xml = f'<CustomObject xmlns="{METADATA_NAMESPACE}"/>'
+        assert stream(tmp_path, xml, {}, xml_declaration=False) == xml + "\n"
+        assert stream(tmp_path, xml, {}, add_children) == transform_tree(
+            xml, {}, add_children
+        )
+
+    def test_transform_children__attributes(self, tmp_path):
+        xml = f"""<CustomMetadata xmlns="{METADATA_NAMESPACE}" xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" xmlns:xsd="http://www.w3.org/2001/XMLSchema">
+    <label>Test</label>
+    <values>
+        <field>Active__c</field>
+        <value xsi:type="xsd:boolean">false</value>
+    </values>
+    <values>
+        <field>Other__c</field>
+        <value xsi:nil="true"/>
+    </values>
+</CustomMetadata>
+"""
+
+        def activate(values):
+            if values.field.text == "Active__c":
+                values.value.text = "true"
+
+        output = stream(tmp_path, xml, {"values": activate})
+
+        assert output == transform_tree(xml, {"values": activate})
+        assert '<value xsi:type="xsd:boolean">true</value>' in output
+
+    def test_transform_children__parse_error(self, tmp_path):
+        with pytest.raises(etree.XMLSyntaxError):
+            stream(tmp_path, "<Profile><fieldPermissions></Profile>", {})
@@ -1,9 +1,15 @@
 from io import BytesIO
 from pathlib import Path
+from unittest import mock
 
 import pytest
 
-from cumulusci.utils.xml.metadata_tree import METADATA_NAMESPACE, fromstring, parse
+from cumulusci.utils.xml.metadata_tree import (
+    METADATA_NAMESPACE,
+    MetadataElement,
+    fromstring,
+    parse,
+)
 
 standard_xml = f"""<Data xmlns='{METADATA_NAMESPACE}'>
                 <foo>Foo</foo>
@@ -165,6 +171,58 @@ class TestMetadataTree:
         assert Data.find("text").text == "Baz"
         assert Data.find("text", text="Baz").text == "Baz"
 
+    def test_matching__index_is_reused(self):
+        Data = fromstring(standard_xml)
+        assert Data.find("bar", name="Bar1").label.text == "Label1"
+
+        with mock.patch.object(
+            MetadataElement,
+            "_sub_element_value",
+            autospec=True,
+            side_effect=MetadataElement._sub_element_value,
+        ) as sub_element_value:
+            assert Data.find("bar", name="Bar2").label.text == "Label2"
+            assert Data.find("bar", name="xyzzy") is None
+
+        # only the match is looked at, to check that it is still current
+        assert sub_element_value.call_count == 1
+
+    def test_matching__index_follows_changes(self):
+        Data = fromstring(standard_xml)
+        assert Data.find("bar", name="Bar3") is None
+        assert Data.find("bar", name=None) is None
+
+        bar3 = Data.append("bar")
+        assert Data.find("bar", name=None) == bar3
+        bar3.append("name", "Bar3")
+        assert Data.find("bar", name="Bar3") == bar3
+        assert Data.find("bar", name=None) is None
+
+        Data.find("bar", name="Bar1").name.text = "Bar4"
+        assert Data.find("bar", name="Bar1") is None
+        assert Data.find("bar", name="Bar4").label.text == "Label1"
+        assert [bar.name.text for bar in Data.findall("bar", name="Bar4")] == ["Bar4"]
+
+        Data.remove(Data.find("bar", name="Bar2"))
+        assert Data.find("bar", name="Bar2") is None
+        assert Data.find("foo", text="Foo2").text == "Foo2"
+        Data.find("foo", text="Foo2").text = "Foo3"
+        assert Data.findall("foo", text="Foo3") == [Data.foo[1]]
+
+    def test_matching__multiple_filters(self):
+        Data = fromstring(standard_xml)
+        assert Data.find("bar", name="Bar2", label="Label2").label.text == "Label2"
+        assert Data.find("bar", name="Bar2", label="Label1") is None
+
+    def test_matching__lxml_changes(self):
+        Data = fromstring(standard_xml)
+        bar = Data.find("bar", name="Bar1")
+        assert bar is not None
+
+        # changes behind the index's back don't produce wrong matches
+        Data._element.remove(bar._element)
+        assert Data.find("bar", name="Bar1") is None
+
     def test_equality(self):
         Data = fromstring(standard_xml)
         assert Data.foo == Data.foo[0]